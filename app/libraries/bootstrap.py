@@ -0,0 +1,198 @@
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from libraries import performance, walkforward, constants as c
+
+# -------------------------------------------------------
+# BOOTSTRAP
+# -------------------------------------------------------
+# Confidence intervals of the strategy statistics by resampling the bars of
+# the returns with a stationary (random block lengths) or circular block
+# bootstrap. The bars of every strategy are resampled together, which keeps
+# the correlation between the strategies. A resample is a matrix of blocks
+# (first bar, length) that expands to a matrix of bar indices. The statistics
+# only need sums of the returns (count, sum, squares, ...), so a resample is
+# reduced through the prefix sums at the ends of its blocks, and all the
+# resamples of a chunk are one matrix product instead of a pass over
+# resamples x bars values.
+
+BOOTSTRAP_METRICS = ["Total Return", "Ann. Mean Return", "Sharpe", "Sortino"]
+
+
+@dataclass
+class BootstrapResult:
+    """
+    Results of `bootstrap`.
+
+    Attributes:
+        intervals (pandas.DataFrame): One row per (strategy, metric) with the estimate on the actual returns,
+            the mean and standard error over the resamples and the bounds of the confidence interval.
+        samples (dict): Values of every metric over the resamples, arrays of resamples x strategies.
+    """
+
+    intervals: pd.DataFrame
+    samples: dict
+
+
+# SUPPORT
+def default_block_length(num_bars):
+    """
+    Mean block length used when none is given, the cube root of the number of bars.
+    """
+    return max(1, int(round(num_bars ** (1 / 3))))
+
+
+def resample_blocks(num_bars, num_samples, block_length, rng, stationary=True):
+    """
+    Draws the blocks of bars of every resample.
+
+    Args:
+        num_bars (int): Number of bars of the returns.
+        num_samples (int): Number of resamples.
+        block_length (float): Mean length of the blocks (the fixed length for the circular block bootstrap, rounded
+            to a whole number of bars).
+        rng (numpy.random.Generator): Random generator.
+        stationary (bool): Block lengths drawn from a geometric distribution (stationary bootstrap) instead of
+            fixed.
+
+    Returns:
+        tuple: First bar and length of the blocks, two int64 arrays of resamples x blocks. Blocks wrap around
+            the end of the bars, the lengths of every resample add up to `num_bars` (trailing blocks are empty).
+    """
+    if stationary:
+        num_blocks = int(np.ceil(num_bars / block_length))
+        # Extra blocks so that nearly every resample is covered at the first draw
+        num_blocks += int(4 * np.sqrt(num_blocks)) + 1
+        lengths = rng.geometric(1 / block_length, (num_samples, num_blocks))
+        while (lengths.sum(axis=1) < num_bars).any():
+            extra = rng.geometric(1 / block_length, (num_samples, num_blocks))
+            lengths = np.concatenate([lengths, extra], axis=1)
+    else:
+        # Whole number of bars, used for both the number and the lengths of the blocks
+        length = max(1, int(round(block_length)))
+        lengths = np.full((num_samples, int(np.ceil(num_bars / length))), length)
+
+    ends = np.minimum(np.cumsum(lengths, axis=1), num_bars)
+    lengths = np.diff(ends, axis=1, prepend=0)
+    starts = rng.integers(0, num_bars, lengths.shape)
+    return starts, lengths
+
+
+def resample_sums(sums, starts, lengths):
+    """
+    Sums of the returns of every resample from the prefix sums.
+
+    Args:
+        sums (numpy.ndarray): Prefix sums over the bars repeated twice (so blocks can wrap around),
+            (2 x bars + 1) x columns.
+        starts (numpy.ndarray): First bars of the blocks, resamples x blocks.
+        lengths (numpy.ndarray): Lengths of the blocks, resamples x blocks.
+
+    Returns:
+        numpy.ndarray: Sums of every column over every resample, resamples x columns.
+
+    Notes:
+        - A block adds sums[start + length] - sums[start]; the weight of every prefix sum in every resample
+          is counted first, then all the resamples are reduced with one matrix product.
+    """
+    num_samples, size = len(starts), len(sums)
+    rows = np.arange(num_samples)[:, None] * size
+    weights = np.bincount(
+        np.concatenate([(rows + starts + lengths).ravel(), (rows + starts).ravel()]),
+        weights=np.repeat([1.0, -1.0], starts.size),
+        minlength=num_samples * size,
+    )
+    return weights.reshape(num_samples, size) @ sums
+
+
+# MAIN
+def bootstrap(
+    returns_df,
+    num_samples=c.bootstrap_samples,
+    block_length=None,
+    stationary=True,
+    confidence=0.95,
+    periods=252,
+    seed=None,
+):
+    """
+    Bootstrap confidence intervals of the statistics of every strategy.
+
+    Args:
+        returns_df (pandas.DataFrame): Returns with one column per strategy (see `main.strategy_returns`).
+        num_samples (int): Number of resamples.
+        block_length (float, optional): Mean length of the resampled blocks, `default_block_length` by default.
+        stationary (bool): Stationary bootstrap (random block lengths) instead of the circular block bootstrap.
+        confidence (float): Probability covered by the (percentile) confidence intervals.
+        periods (int): Number of periods per year.
+        seed (int, optional): Seed of the random generator, for reproducible intervals.
+
+    Returns:
+        BootstrapResult: Confidence intervals and resampled values of `BOOTSTRAP_METRICS`.
+
+    Notes:
+        - Bars without any valid return (e.g. the first one) are left out. NaN returns of a strategy in the
+          resampled bars are skipped, as in `performance.returns_statistics`.
+    """
+    returns = performance.as_returns_matrix(returns_df)
+    returns = returns[~np.isnan(returns).all(axis=1)]
+    num_bars, num_strategies = returns.shape
+    block_length = block_length or default_block_length(num_bars)
+    rng = np.random.default_rng(seed)
+
+    # Prefix sums of every key of every strategy, over the bars repeated twice
+    keys = list(
+        dict.fromkeys(
+            key for m in BOOTSTRAP_METRICS for key in walkforward.METRIC_SUMS[m]
+        )
+    )
+    sums = {}
+    for metric in BOOTSTRAP_METRICS:
+        sums.update(walkforward.prefix_sums(np.concatenate([returns, returns]), metric))
+    sums = np.concatenate([sums[key] for key in keys], axis=1)
+
+    chunk_size = max(1, c.bootstrap_chunk_bytes // (8 * len(sums)))
+    chunks = []
+    for start in range(0, num_samples, chunk_size):
+        starts, lengths = resample_blocks(
+            num_bars,
+            min(chunk_size, num_samples - start),
+            block_length,
+            rng,
+            stationary,
+        )
+        chunks.append(resample_sums(sums, starts, lengths))
+    resampled = np.concatenate(chunks).reshape(num_samples, len(keys), num_strategies)
+    resampled = {key: resampled[:, i] for i, key in enumerate(keys)}
+
+    estimates = performance.returns_statistics(returns, periods)
+    samples, bounds = {}, {}
+    tail = (1 - confidence) / 2
+    with warnings.catch_warnings():
+        # Strategies without enough valid returns have no interval
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        for metric in BOOTSTRAP_METRICS:
+            samples[metric] = walkforward.sums_metric(resampled, periods, metric)
+            values = np.where(np.isinf(samples[metric]), np.nan, samples[metric])
+            bounds[metric] = {
+                "Estimate": estimates[metric],
+                "Mean": np.nanmean(values, axis=0),
+                "Std. Error": np.nanstd(values, axis=0, ddof=1),
+                "Lower": np.nanquantile(values, tail, axis=0),
+                "Upper": np.nanquantile(values, 1 - tail, axis=0),
+            }
+
+    intervals = pd.DataFrame(
+        [
+            {column: value[i] for column, value in bounds[metric].items()}
+            for i in range(num_strategies)
+            for metric in BOOTSTRAP_METRICS
+        ],
+        index=pd.MultiIndex.from_product(
+            [list(returns_df.columns), BOOTSTRAP_METRICS], names=["Strategy", "Metric"]
+        ),
+    )
+    return BootstrapResult(intervals=intervals, samples=samples)
@@ -1,3 +1,5 @@
+import os
+
 # Used in web.py
 styles_option_menu = {
     "container": {
@@ -19,6 +21,7 @@ styles_option_menu = {
     },
     "icon": {"color": "#f2e1e1", "font-size": "20px"},
 }
+rolling_window = 63  # bars of the rolling statistics (about a quarter)
 
 # Used in main.py
 styles_statistics_df = {
@@ -26,13 +29,66 @@ styles_statistics_df = {
     "Ann. Mean Return": lambda x: f"{x*100:.2f}%",
     "St. Dev.": lambda x: f"{x*100:.2f}%",
     "Max Drawdown": lambda x: f"{x*100:.2f}%",
+    "Avg. Drawdown": lambda x: f"{x*100:.2f}%",
     "Pct. Win. Trades": lambda x: f"{x*100:.2f}%",
     "Pct. Losing Trades": lambda x: f"{x*100:.2f}%",
+    "Pct. Tickers Beating B&H": lambda x: f"{x*100:.2f}%",
     "Num. Trades": "{:.0f}",
     "Win. Trades": "{:.0f}",
     "Losing Trades": "{:.0f}",
     "Avg. Trade Duration": "{:.1f}",
+    "Longest Underwater": "{:.0f}",
     "Sharpe": "{:.2f}",
     "Sortino": "{:.2f}",
     "Win/Loss Ratio": "{:.2f}",
 }
+styles_drawdowns_df = {
+    "Depth": lambda x: f"{x*100:.2f}%",
+    "Duration": "{:.0f}",
+    "Time to Recover": "{:.0f}",
+}
+
+# Used in data.py
+data_source = os.environ.get("TA_DATA_SOURCE", "yahoo")  # yahoo, files or synthetic
+data_files_dir = os.environ.get("TA_DATA_DIR", "data")
+synthetic_bars = int(os.environ.get("TA_SYNTHETIC_BARS", 5000))
+price_data_ttl = 300  # seconds before a cached price history is downloaded again
+price_data_max_entries = 64
+price_cache_dir = os.environ.get(
+    "TA_PRICE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "ta_app")
+)
+ticker_info_ttl = int(os.environ.get("TA_TICKER_INFO_TTL", 3600))  # seconds
+ticker_info_max_entries = 256
+# Yahoo Finance only serves recent intraday bars, older stored data is downloaded again
+price_cache_max_age_days = {"5m": 59, "1h": 729}
+
+# Used in engine.py
+indicator_cache_max_entries = 512
+indicator_cache_max_bytes = int(os.environ.get("TA_INDICATOR_CACHE_MB", 256)) * 2**20
+
+# Used in optimizer.py
+# Memory of one chunk of the signal matrix (bars x parameter sets)
+optimizer_chunk_bytes = int(os.environ.get("TA_OPTIMIZER_CHUNK_MB", 4)) * 2**20
+optimizer_max_sets = 50000  # largest grid the app evaluates
+optimizer_top_results = 50  # rows of the ranked table
+
+# Used in parallel.py
+parallel_workers = int(os.environ.get("TA_PARALLEL_WORKERS", os.cpu_count() or 1))
+parallel_start_method = "spawn"  # workers do not inherit the Streamlit threads
+parallel_min_sets = 5000  # smaller grids are evaluated in the app process
+parallel_shards_per_worker = 4
+parallel_attached_blocks = 8  # price blocks kept mapped by every worker
+
+# Used in data.py and universe.py
+universe_download_batch = 100  # tickers per bulk Yahoo Finance request
+universe_max_tickers = 500
+universe_min_coverage = (
+    0.8  # tickers with fewer bars (share of the longest history) are left out
+)
+
+# Used in loops.py
+loop_backend = os.environ.get("TA_LOOP_BACKEND", "auto")  # auto, numpy or numba
+
+# Used in bootstrap.py
+bootstrap_samples = 10000
+bootstrap_chunk_bytes = 8 * 2**20  # weights of the prefix sums of a chunk of resamples
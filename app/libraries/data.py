@@ -0,0 +1,707 @@
+import os
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+import yfinance as yf
+
+from libraries import constants as c
+
+# Start of the requested period relative to now ('max' has no start)
+PERIOD_OFFSETS = {
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
+
+
+# -------------------------------------------------------
+# DATA SOURCES
+# -------------------------------------------------------
+# Every source hands out ticker objects with the part of the yfinance.Ticker
+# interface the app uses ('ticker', 'info' and 'history'), so the rest of the
+# code does not need to know where the prices come from.
+
+
+class SourceTicker:
+    """
+    yfinance.Ticker-like view of one ticker of a data source.
+
+    Args:
+        source (DataSource): Source providing the data.
+        ticker_input (str): Ticker symbol.
+    """
+
+    def __init__(self, source, ticker_input):
+        self.source = source
+        self.ticker = ticker_input.upper()
+
+    @property
+    def info(self):
+        return self.source.info(self.ticker)
+
+    def history(self, period=None, interval="1d", start=None):
+        return self.source.history(self.ticker, period, interval, start)
+
+
+class DataSource:
+    """
+    Base class of the price data sources.
+
+    Subclasses implement `history` and can override `info`. Sources that are slow to query set `cacheable`
+    so that their prices are stored on disk (see `update_history`).
+    """
+
+    cacheable = False
+
+    def ticker(self, ticker_input):
+        """
+        Returns a yfinance.Ticker-like object for the ticker.
+        """
+        return SourceTicker(self, ticker_input)
+
+    def history(self, ticker_input, period=None, interval="1d", start=None):
+        """
+        Returns the OHLCV history of the ticker from `start` or for the `period`.
+        An empty DataFrame means that the ticker is not known to the source.
+        """
+        raise NotImplementedError
+
+    def info(self, ticker_input):
+        """
+        Returns a dictionary with the metadata of the ticker (same keys as yfinance.Ticker.info).
+        """
+        return {"longName": ticker_input}
+
+    def histories(self, tickers, period=None, interval="1d", start=None):
+        """
+        Returns the histories of many tickers as a dict by ticker, without the tickers unknown to the source.
+        Sources with a bulk request override it.
+        """
+        price_dfs = {
+            ticker: self.history(ticker, period, interval, start) for ticker in tickers
+        }
+        return {ticker: df for ticker, df in price_dfs.items() if not df.empty}
+
+
+class YahooSource(DataSource):
+    """
+    Prices and metadata from Yahoo Finance (https://finance.yahoo.com/).
+    """
+
+    cacheable = True
+
+    def ticker(self, ticker_input):
+        return yf.Ticker(ticker_input)
+
+    def history(self, ticker_input, period=None, interval="1d", start=None):
+        return self.ticker(ticker_input).history(
+            period=period, interval=interval, start=start
+        )
+
+    def info(self, ticker_input):
+        return self.ticker(ticker_input).info
+
+    def histories(self, tickers, period=None, interval="1d", start=None):
+        # One request per batch of tickers instead of one per ticker
+        price_dfs = {}
+        for i in range(0, len(tickers), c.universe_download_batch):
+            batch = list(tickers[i : i + c.universe_download_batch])
+            downloaded = yf.download(
+                batch,
+                period=period if start is None else None,
+                start=start,
+                interval=interval,
+                group_by="ticker",
+                actions=True,
+                auto_adjust=True,
+                ignore_tz=False,
+                progress=False,
+            )
+            for ticker in batch:
+                if isinstance(downloaded.columns, pd.MultiIndex):
+                    if ticker not in downloaded.columns.get_level_values(0):
+                        continue
+                    price_df = downloaded[ticker]
+                else:
+                    price_df = downloaded
+                price_df = price_df.dropna(subset=["Close"])
+                if not price_df.empty:
+                    price_dfs[ticker] = price_df
+        return price_dfs
+
+
+def slice_history(price_df, period, start):
+    """
+    Selects the bars of a locally available price history from `start` or for the `period`.
+
+    Args:
+        price_df (pandas.DataFrame): Price history.
+        period (str): Period of historical data (e.g., '1y', 'ytd', 'max'), counted back from the last bar.
+        start (pandas.Timestamp or None): First timestamp to return, takes precedence over `period`.
+
+    Returns:
+        pandas.DataFrame: Selected bars.
+    """
+    if price_df.empty:
+        return price_df
+    if start is None and period is not None:
+        start = period_start(period, price_df.index[-1])
+    if start is None:
+        return price_df
+    return price_df[price_df.index >= pd.Timestamp(start)]
+
+
+class FileSource(DataSource):
+    """
+    Prices from local CSV or Parquet files.
+
+    The files are looked up as '<directory>/<TICKER>_<interval>.parquet', '<directory>/<TICKER>_<interval>.csv',
+    '<directory>/<TICKER>.parquet' and '<directory>/<TICKER>.csv'. They need a date index (first column of a CSV)
+    and Open, High, Low and Close columns.
+
+    Args:
+        directory (str): Directory with the files.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def read(self, ticker_input, interval):
+        for name in [f"{ticker_input}_{interval}", ticker_input]:
+            path = os.path.join(self.directory, name)
+            if os.path.exists(f"{path}.parquet"):
+                return pd.read_parquet(f"{path}.parquet")
+            if os.path.exists(f"{path}.csv"):
+                return pd.read_csv(f"{path}.csv", index_col=0, parse_dates=True)
+        return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+
+    def history(self, ticker_input, period=None, interval="1d", start=None):
+        price_df = self.read(ticker_input.upper(), interval).sort_index()
+        return slice_history(price_df, period, start)
+
+
+class SyntheticSource(DataSource):
+    """
+    Deterministic random-walk OHLCV prices, for tests and benchmarks without network access.
+
+    The same ticker, interval and seed always give the same prices. Every ticker is valid.
+
+    Args:
+        bars (int): Number of bars of the full ('max') history.
+        seed (int): Seed of the random generator.
+        end (str): Timestamp of the last bar.
+    """
+
+    frequencies = {"5m": "5min", "1h": "h", "1d": "B", "1wk": "W-MON"}
+
+    def __init__(self, bars=5000, seed=0, end="2024-06-28"):
+        self.bars = bars
+        self.seed = seed
+        self.end = end
+
+    def dates(self, interval):
+        """
+        Timestamps of the bars, the last one at `end`. Histories longer than the about 292 years of nanosecond
+        timestamps (e.g., 100k daily bars) are indexed in seconds (UTC).
+        """
+        frequency = self.frequencies.get(interval, "B")
+        try:
+            return pd.date_range(
+                end=self.end, periods=self.bars, freq=frequency, tz="America/New_York"
+            )
+        except (pd.errors.OutOfBoundsDatetime, pd.errors.OutOfBoundsTimedelta):
+            # In UTC: pandas cannot convert second timestamps of the past centuries to New York time
+            return pd.date_range(
+                end=self.end, periods=self.bars, freq=frequency, tz="UTC", unit="s"
+            )
+
+    def generate(self, ticker_input, interval):
+        rng = np.random.default_rng(
+            [self.seed, zlib.crc32(f"{ticker_input}_{interval}".encode())]
+        )
+        index = self.dates(interval)
+        log_returns = rng.normal(0.0002, 0.015, self.bars)
+        close = 100 * np.exp(np.cumsum(log_returns))
+        open_ = np.concatenate([[100.0], close[:-1]]) * np.exp(
+            rng.normal(0, 0.003, self.bars)
+        )
+        high = np.maximum(open_, close) * np.exp(
+            np.abs(rng.normal(0, 0.005, self.bars))
+        )
+        low = np.minimum(open_, close) * np.exp(
+            -np.abs(rng.normal(0, 0.005, self.bars))
+        )
+        volume = rng.lognormal(13, 0.5, self.bars).round()
+        return pd.DataFrame(
+            {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
+            index=index,
+        )
+
+    def history(self, ticker_input, period=None, interval="1d", start=None):
+        price_df = self.generate(ticker_input.upper(), interval)
+        return slice_history(price_df, period, start)
+
+    def info(self, ticker_input):
+        price_df = self.generate(ticker_input.upper(), "1d")
+        close = price_df["Close"]
+        return {
+            "longName": f"Synthetic {ticker_input.upper()}",
+            "country": "N/A",
+            "sector": "Synthetic",
+            "industry": "Synthetic",
+            "marketCap": close.iloc[-1] * 1e9,
+            "enterpriseValue": close.iloc[-1] * 1e9,
+            "fullTimeEmployees": 1,
+            "currentPrice": close.iloc[-1],
+            "previousClose": close.iloc[-2],
+            "dayHigh": price_df["High"].iloc[-1],
+            "dayLow": price_df["Low"].iloc[-1],
+            "fiftyTwoWeekHigh": close.iloc[-252:].max(),
+            "fiftyTwoWeekLow": close.iloc[-252:].min(),
+            "forwardEps": 0.0,
+            "forwardPE": 0.0,
+            "pegRatio": 0.0,
+            "dividendRate": 0.0,
+            "dividendYield": 0.0,
+            "recommendationKey": "none",
+        }
+
+
+def get_source(name=None):
+    """
+    Creates the data source selected by name.
+
+    Args:
+        name (str, optional): 'yahoo', 'files' or 'synthetic'. Defaults to `c.data_source`.
+
+    Returns:
+        DataSource: The selected data source.
+
+    Raises:
+        ValueError: If the name is not a known data source.
+    """
+    name = name or c.data_source
+    if name == "yahoo":
+        return YahooSource()
+    if name == "files":
+        return FileSource(c.data_files_dir)
+    if name == "synthetic":
+        return SyntheticSource(bars=c.synthetic_bars)
+    raise ValueError(f"Unknown data source '{name}'.")
+
+
+# -------------------------------------------------------
+# SUPPORT (ON-DISK CACHE)
+# -------------------------------------------------------
+def period_start(period, now):
+    """
+    Calculates the first timestamp covered by a Yahoo Finance period.
+
+    Args:
+        period (str): Period of historical data (e.g., '1y', '3mo', 'ytd', 'max').
+        now (pandas.Timestamp): Current time, in the timezone of the price data.
+
+    Returns:
+        pandas.Timestamp or None: Start of the period, or None for 'max'.
+    """
+    if period == "max":
+        return None
+    if period == "ytd":
+        return now.normalize().replace(month=1, day=1)
+    return now - PERIOD_OFFSETS[period]
+
+
+def cache_path(ticker_input, interval):
+    """
+    Returns the path of the Parquet file storing the price history of a ticker for an interval.
+
+    Args:
+        ticker_input (str): Ticker symbol of the stock or asset.
+        interval (str): Interval of historical data (e.g., '1d', '1h', '5m').
+
+    Returns:
+        str: Path of the Parquet file.
+    """
+    return os.path.join(c.price_cache_dir, f"{ticker_input.upper()}_{interval}.parquet")
+
+
+def read_cached_history(ticker_input, interval):
+    """
+    Reads the stored price history of a ticker.
+
+    Args:
+        ticker_input (str): Ticker symbol of the stock or asset.
+        interval (str): Interval of historical data (e.g., '1d', '1h', '5m').
+
+    Returns:
+        pandas.DataFrame or None: Stored price history, or None if nothing usable is stored.
+    """
+    try:
+        cached = pd.read_parquet(cache_path(ticker_input, interval))
+    except (OSError, ValueError, ImportError):
+        return None
+    if cached.empty or "covered_from" not in cached.attrs:
+        return None
+    return cached
+
+
+def write_cached_history(ticker_input, interval, price_df, covered_from):
+    """
+    Stores the price history of a ticker, replacing the previous file atomically.
+
+    Args:
+        ticker_input (str): Ticker symbol of the stock or asset.
+        interval (str): Interval of historical data (e.g., '1d', '1h', '5m').
+        price_df (pandas.DataFrame): Price history to store.
+        covered_from (str): 'max' or the ISO timestamp from which the history is complete.
+
+    Returns:
+        None
+
+    Notes:
+        - Failing to write (e.g. read-only file system) is not an error, the data is only not cached.
+    """
+    path = cache_path(ticker_input, interval)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    price_df = price_df.copy()
+    price_df.attrs = {"covered_from": covered_from}
+    try:
+        os.makedirs(c.price_cache_dir, exist_ok=True)
+        price_df.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+    except (OSError, ValueError, ImportError):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def covers(covered_from, start):
+    """
+    Checks whether stored history that is complete from `covered_from` contains the period starting at `start`.
+
+    Args:
+        covered_from (str): 'max' or the ISO timestamp from which the stored history is complete.
+        start (pandas.Timestamp or None): Start of the requested period, None for 'max'.
+
+    Returns:
+        bool: True if the stored history covers the requested period.
+    """
+    if covered_from == "max":
+        return True
+    if start is None:
+        return False
+    return pd.Timestamp(covered_from) <= start
+
+
+def merge_history(old_df, new_df):
+    """
+    Appends newly downloaded bars to stored ones, the new version of overlapping bars wins.
+
+    Args:
+        old_df (pandas.DataFrame): Stored price history.
+        new_df (pandas.DataFrame): Newly downloaded price history.
+
+    Returns:
+        pandas.DataFrame: Merged price history sorted by date.
+    """
+    if new_df.empty:
+        return old_df
+    new_df = new_df.tz_convert(old_df.index.tz) if old_df.index.tz else new_df
+    merged = pd.concat([old_df, new_df])
+    merged = merged[~merged.index.duplicated(keep="last")]
+    return merged.sort_index()
+
+
+def has_adjustments(price_df):
+    """
+    Checks whether price data contains a dividend or a split, which changes the adjusted prices of all earlier bars.
+
+    Args:
+        price_df (pandas.DataFrame): Price history from yfinance.
+
+    Returns:
+        bool: True if there is a dividend or a stock split in the data.
+    """
+    for col in ["Dividends", "Stock Splits"]:
+        if col in price_df.columns and (price_df[col] != 0).any():
+            return True
+    return False
+
+
+def update_history(ticker_data, period, interval):
+    """
+    Returns the price history of a ticker, downloading only the bars that are not stored on disk yet.
+
+    Args:
+        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
+        period (str): Period for fetching historical data (e.g., '1y', '3mo', 'max').
+        interval (str): Interval for fetching historical data (e.g., '1d', '1h', '5m').
+
+    Returns:
+        pandas.DataFrame: Price history of the requested period.
+
+    Notes:
+        - The store is a Parquet file per ticker and interval (see `cache_path`).
+        - If the stored history covers the period, only the bars from the last stored timestamp onwards are downloaded.
+          The last stored bar is downloaded again because it may have been incomplete.
+        - If the file was written less than `c.price_data_ttl` seconds ago, nothing is downloaded.
+        - The whole period is downloaded again if the stored history is too short, too old for the interval
+          or if a dividend or a split changed the adjusted prices.
+    """
+    ticker_input = ticker_data.ticker
+    state, cached, start = cache_state(ticker_input, period, interval)
+
+    if state != "missing":
+        covered_from = cached.attrs["covered_from"]
+        if state == "fresh":
+            price_df = cached
+        else:
+            last_bar = cached.index[-1]
+            new_bars = ticker_data.history(start=last_bar, interval=interval)
+            if has_adjustments(new_bars.iloc[1:]):
+                new_bars = ticker_data.history(period=period, interval=interval)
+                cached = cached.iloc[0:0]
+                covered_from = period if period == "max" else start.isoformat()
+            price_df = merge_history(cached, new_bars)
+            write_cached_history(ticker_input, interval, price_df, covered_from)
+        if start is not None:
+            price_df = price_df[price_df.index >= start]
+        return price_df
+
+    price_df = ticker_data.history(period=period, interval=interval)
+    store_downloaded_history(ticker_input, period, interval, price_df)
+    return price_df
+
+
+def cache_state(ticker_input, period, interval):
+    """
+    Checks whether the stored price history of a ticker can serve a period.
+
+    Args:
+        ticker_input (str): Ticker symbol of the stock or asset.
+        period (str): Period of historical data (e.g., '1y', '3mo', 'max').
+        interval (str): Interval of historical data (e.g., '1d', '1h', '5m').
+
+    Returns:
+        tuple: (state, stored history, start of the period):
+            - 'fresh': the stored history covers the period and was written less than `c.price_data_ttl` seconds ago.
+            - 'stale': the stored history covers the period, only the newest bars have to be downloaded.
+            - 'missing': nothing usable is stored (the stored history and the start are None).
+    """
+    cached = read_cached_history(ticker_input, interval)
+    if cached is None:
+        return "missing", None, None
+
+    now = pd.Timestamp.now(tz=cached.index.tz)
+    start = period_start(period, now)
+    max_age = pd.Timedelta(days=c.price_cache_max_age_days.get(interval, 36500))
+    if (
+        not covers(cached.attrs["covered_from"], start)
+        or now - cached.index[-1] >= max_age
+    ):
+        return "missing", None, None
+
+    modified = os.path.getmtime(cache_path(ticker_input, interval))
+    if time.time() - modified < c.price_data_ttl:
+        return "fresh", cached, start
+    return "stale", cached, start
+
+
+def store_downloaded_history(ticker_input, period, interval, price_df):
+    """
+    Stores the price history of a whole period downloaded for a ticker (see `write_cached_history`).
+    """
+    if not price_df.empty:
+        now = pd.Timestamp.now(tz=price_df.index.tz)
+        start = period_start(period, now)
+        covered_from = "max" if start is None else start.isoformat()
+        write_cached_history(ticker_input, interval, price_df, covered_from)
+
+
+def update_histories(source, tickers, period, interval):
+    """
+    Batched version of `update_history` for many tickers of a bulk source.
+
+    Args:
+        source (DataSource): Source of the data.
+        tickers (list): Ticker symbols.
+        period (str): Period for fetching historical data (e.g., '1y', '3mo', 'max').
+        interval (str): Interval for fetching historical data (e.g., '1d', '1h', '5m').
+
+    Returns:
+        dict: Price history of the requested period of every ticker known to the source.
+
+    Notes:
+        - The newest bars of all the stored tickers are downloaded in one bulk request from the oldest of their
+          last stored bars, the tickers without usable stored history in another one.
+    """
+    price_dfs, stale, missing = {}, {}, []
+    for ticker in tickers:
+        state, cached, start = cache_state(ticker, period, interval)
+        if state == "fresh":
+            price_dfs[ticker] = slice_history(cached, None, start)
+        elif state == "stale":
+            stale[ticker] = (cached, start)
+        else:
+            missing.append(ticker)
+
+    if stale:
+        first_bar = min(cached.index[-1] for cached, _ in stale.values())
+        downloaded = source.histories(list(stale), interval=interval, start=first_bar)
+        for ticker, (cached, start) in stale.items():
+            new_bars = downloaded.get(ticker, cached.iloc[0:0])
+            new_bars = new_bars[new_bars.index >= cached.index[-1]]
+            if has_adjustments(new_bars.iloc[1:]):
+                # Adjusted prices changed, the whole period is downloaded again
+                missing.append(ticker)
+                continue
+            price_df = merge_history(cached, new_bars)
+            write_cached_history(
+                ticker, interval, price_df, cached.attrs["covered_from"]
+            )
+            price_dfs[ticker] = slice_history(price_df, None, start)
+
+    if missing:
+        downloaded = source.histories(missing, period=period, interval=interval)
+        for ticker, price_df in downloaded.items():
+            store_downloaded_history(ticker, period, interval, price_df)
+            price_dfs[ticker] = price_df
+
+    return {ticker: price_dfs[ticker] for ticker in tickers if ticker in price_dfs}
+
+
+# -------------------------------------------------------
+# PRICE DATA
+# -------------------------------------------------------
+def get_price_data(source, ticker_input, period, interval):
+    """
+    Fetches the OHLCV price history of a ticker from a data source.
+
+    Args:
+        source (DataSource): Source of the data.
+        ticker_input (str): Ticker symbol of the stock or asset.
+        period (str): Period for fetching historical data (e.g., '1y', '3mo', 'max').
+        interval (str): Interval for fetching historical data (e.g., '1d', '1h', '5m').
+
+    Returns:
+        pandas.DataFrame: DataFrame with Open, High, Low, Close and Volume columns indexed by date.
+                          Empty if the ticker is not known to the source.
+
+    Notes:
+        - Prices of cacheable sources go through the on-disk store, so only new bars are downloaded (see `update_history`).
+    """
+    ticker_data = source.ticker(ticker_input)
+    if source.cacheable:
+        return update_history(ticker_data, period, interval)
+    return ticker_data.history(period=period, interval=interval)
+
+
+def get_price_histories(source, tickers, period, interval):
+    """
+    Fetches the OHLCV price histories of many tickers from a data source with bulk requests.
+
+    Args:
+        source (DataSource): Source of the data.
+        tickers (list): Ticker symbols.
+        period (str): Period for fetching historical data (e.g., '1y', '3mo', 'max').
+        interval (str): Interval for fetching historical data (e.g., '1d', '1h', '5m').
+
+    Returns:
+        dict: Price history of every ticker known to the source, in the order of `tickers`.
+
+    Notes:
+        - Prices of cacheable sources go through the on-disk store (see `update_histories`).
+    """
+    tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+    if source.cacheable:
+        return update_histories(source, tickers, period, interval)
+    return source.histories(tickers, period=period, interval=interval)
+
+
+@st.cache_data(
+    ttl=c.price_data_ttl, max_entries=c.price_data_max_entries, show_spinner=False
+)
+def load_price_histories(tickers, period, interval):
+    """
+    Fetches the price histories of a universe of tickers once per (tickers, period, interval), see
+    `get_price_histories`.
+
+    Args:
+        tickers (tuple): Ticker symbols.
+        period (str): Period for fetching historical data (e.g., '1y', '3mo', 'max').
+        interval (str): Interval for fetching historical data (e.g., '1d', '1h', '5m').
+
+    Returns:
+        dict: Price history of every ticker known to the source.
+    """
+    return get_price_histories(get_source(), tickers, period, interval)
+
+
+@st.cache_data(
+    ttl=c.price_data_ttl, max_entries=c.price_data_max_entries, show_spinner=False
+)
+def load_price_data(ticker_input, period, interval):
+    """
+    Fetches the OHLCV price history of a ticker once per (ticker, period, interval).
+
+    Args:
+        ticker_input (str): Ticker symbol of the stock or asset.
+        period (str): Period for fetching historical data (e.g., '1y', '3mo', 'max').
+        interval (str): Interval for fetching historical data (e.g., '1d', '1h', '5m').
+
+    Returns:
+        pandas.DataFrame: DataFrame with Open, High, Low, Close and Volume columns indexed by date.
+
+    Notes:
+        - The result is cached by Streamlit, so repeated reruns and sessions reuse the same download.
+        - Prices come from the data source selected by `c.data_source` (see `get_source` and `get_price_data`).
+        - The returned DataFrame is shared by the chart, the indicators, the parameter widgets and the statistics.
+          Callers must not add columns to it in place.
+    """
+    return get_price_data(get_source(), ticker_input, period, interval)
+
+
+# -------------------------------------------------------
+# TICKER INFO
+# -------------------------------------------------------
+def get_ticker_info(source, ticker_input):
+    """
+    Fetches a snapshot of the metadata of a ticker (company name, sector, valuation, price levels, ...).
+
+    Args:
+        source (DataSource): Source of the data.
+        ticker_input (str): Ticker symbol of the stock or asset.
+
+    Returns:
+        dict: Copy of the yfinance.Ticker.info dictionary, with the 'symbol' key always set.
+    """
+    ticker_info = dict(source.ticker(ticker_input).info)
+    ticker_info.setdefault("symbol", ticker_input.upper())
+    return ticker_info
+
+
+@st.cache_data(
+    ttl=c.ticker_info_ttl, max_entries=c.ticker_info_max_entries, show_spinner=False
+)
+def load_ticker_info(ticker_input):
+    """
+    Fetches the metadata snapshot of a ticker once per ticker (see `get_ticker_info`).
+
+    Args:
+        ticker_input (str): Ticker symbol of the stock or asset.
+
+    Returns:
+        dict: Metadata of the ticker.
+
+    Notes:
+        - yfinance.Ticker.info is one of the slowest Yahoo Finance requests. The snapshot is cached by Streamlit
+          for `c.ticker_info_ttl` seconds and shared by all sessions, so the INFO section and the chart title
+          do not hit the network again on reruns.
+    """
+    return get_ticker_info(get_source(), ticker_input)
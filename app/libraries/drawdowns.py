@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# -------------------------------------------------------
+# DRAWDOWN EPISODES
+# -------------------------------------------------------
+# Every drawdown of every strategy, from the equity curves of
+# performance.equity_curves. The underwater curves (distance below the running
+# peak) of all strategies are one accumulate call. They are laid out one after
+# the other with a bar at the peak between them, so the episodes (runs of bars
+# below the peak) of all strategies are found with one diff over the flat
+# array. The troughs are segment minimums (reduceat) and the summary columns
+# of the statistics table are bincounts over the episodes, so the whole pass
+# is linear in the number of bars times strategies.
+
+EPISODE_COLUMNS = [
+    "Strategy",
+    "Start",
+    "Trough",
+    "Recovery",
+    "Depth",
+    "Duration",
+    "Time to Recover",
+]
+
+
+@dataclass
+class DrawdownResult:
+    """
+    Results of `drawdown_episodes`.
+
+    Attributes:
+        underwater (pandas.DataFrame): Relative distance of every equity curve below its running peak (0 at a new
+            high, NaN during the warm-up), with the index and columns of the equity curves.
+        episodes (pandas.DataFrame): One row per drawdown with the columns of `EPISODE_COLUMNS`:
+            - 'Strategy': Column of the equity curves.
+            - 'Start': Index label of the peak before the drawdown.
+            - 'Trough': Index label of the lowest equity of the drawdown.
+            - 'Recovery': Index label of the first bar back at the peak (NaT if not recovered yet).
+            - 'Depth': Relative decline from the peak to the trough (negative).
+            - 'Duration': Number of bars from the peak to the recovery (to the last bar if not recovered).
+            - 'Time to Recover': Number of bars from the trough to the recovery (NaN if not recovered).
+        summary (pandas.DataFrame): One row per strategy with 'Avg. Drawdown' (mean depth of its episodes) and
+            'Longest Underwater' (longest duration in bars), 0 without drawdowns and NaN without returns.
+    """
+
+    underwater: pd.DataFrame
+    episodes: pd.DataFrame
+    summary: pd.DataFrame
+
+
+# SUPPORT
+def underwater_curves(equity):
+    """
+    Relative distance below the running peak of every column of equity (NaN where the equity is NaN).
+    """
+    with np.errstate(invalid="ignore"):
+        return equity / np.fmax.accumulate(equity, axis=0) - 1
+
+
+def flat_curves(underwater):
+    """
+    Underwater curves of all strategies one after the other in a 1-D array, separated by one bar at 0.
+    """
+    num_bars, num_strategies = underwater.shape
+    flat = np.zeros((num_strategies, num_bars + 1))
+    flat[:, :num_bars] = np.nan_to_num(underwater.T)
+    return flat.ravel()
+
+
+def episode_bounds(flat):
+    """
+    First and last positions of the runs of bars below the peak in the flat curves of `flat_curves`.
+    """
+    edges = np.diff((flat < 0).astype(np.int8), prepend=0)
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+
+
+def episode_troughs(flat, firsts, lasts):
+    """
+    Depth and position of the first lowest bar of every episode in the flat curves (see `episode_bounds`).
+    """
+    if len(firsts) == 0:
+        return np.zeros(0), np.zeros(0, dtype=np.int64)
+    depth = np.minimum.reduceat(flat, np.column_stack([firsts, lasts + 1]).ravel())[::2]
+    lengths = lasts - firsts + 1
+    offsets = np.cumsum(lengths) - lengths
+    positions = np.repeat(firsts - offsets, lengths) + np.arange(lengths.sum())
+    candidates = np.where(
+        flat[positions] == np.repeat(depth, lengths), positions, len(flat)
+    )
+    return depth, np.minimum.reduceat(candidates, offsets)
+
+
+# MAIN
+def drawdown_episodes(equity_df):
+    """
+    Enumerates the drawdown episodes of every strategy in one batched pass.
+
+    Args:
+        equity_df (pandas.DataFrame): Equity curves with one column per strategy (see performance.equity_curves).
+
+    Returns:
+        DrawdownResult: Underwater curves, episodes and the summary columns of the statistics table.
+
+    Notes:
+        - An episode starts at the last bar at the running peak and ends at the first bar back at it, so the
+          depth of the deepest episode of a strategy is its 'Max Drawdown'.
+    """
+    equity = equity_df.to_numpy(dtype=np.float64)
+    num_bars, num_strategies = equity.shape
+    underwater = underwater_curves(equity)
+
+    flat = flat_curves(underwater)
+    firsts, lasts = episode_bounds(flat)
+    depth, troughs = episode_troughs(flat, firsts, lasts)
+    strategy, start_bar = np.divmod(firsts, num_bars + 1)
+    start_bar -= 1
+    last_bar = lasts % (num_bars + 1)
+    trough_bar = troughs % (num_bars + 1)
+    recovered = last_bar + 1 < num_bars
+    recovery_bar = np.where(recovered, last_bar + 1, num_bars - 1)
+    duration = recovery_bar - start_bar
+
+    index = equity_df.index
+    episodes = pd.DataFrame(
+        {
+            "Strategy": equity_df.columns[strategy],
+            "Start": index[start_bar],
+            "Trough": index[trough_bar],
+            "Recovery": index[recovery_bar].where(recovered),
+            "Depth": depth,
+            "Duration": duration,
+            "Time to Recover": np.where(recovered, recovery_bar - trough_bar, np.nan),
+        },
+        columns=EPISODE_COLUMNS,
+    )
+
+    # Strategies without any return have no statistics
+    has_returns = ~np.isnan(equity).all(axis=0)
+    counts = np.bincount(strategy, minlength=num_strategies)
+    total_depth = np.bincount(strategy, weights=depth, minlength=num_strategies)
+    longest = np.zeros(num_strategies)
+    np.maximum.at(longest, strategy, duration)
+    average = total_depth / np.maximum(counts, 1)
+    summary = pd.DataFrame(
+        {
+            "Avg. Drawdown": np.where(has_returns, average, np.nan),
+            "Longest Underwater": np.where(has_returns, longest, np.nan),
+        },
+        index=equity_df.columns,
+    )
+
+    return DrawdownResult(
+        underwater=pd.DataFrame(
+            underwater, index=equity_df.index, columns=equity_df.columns
+        ),
+        episodes=episodes,
+        summary=summary,
+    )
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+
+from libraries import kernels as k, memo, registry, constants as c
+
+# -------------------------------------------------------
+# INDICATOR ENGINE
+# -------------------------------------------------------
+# Every indicator is computed here exactly once per set of parameters. The
+# resulting columns are consumed both by the graphs (indicators.py) and by the
+# signals and statistics (main.add_ta_to_df). The indicators are declared in
+# registry.py as graphs of nodes; every node is memoized by its definition,
+# so shared nodes are computed once and editing one parameter only
+# recomputes the nodes that depend on it.
+INDICATOR_CACHE = memo.IndicatorCache(
+    c.indicator_cache_max_entries, c.indicator_cache_max_bytes
+)
+
+
+def cache_stats():
+    """
+    Returns the hit/miss counters and the memory use of the indicator memo (see `memo.IndicatorCache.stats`).
+    """
+    return INDICATOR_CACHE.stats()
+
+
+def evaluate(node, price_df, data_key, values):
+    """
+    Returns the values of a node of the indicator graph (see registry.py).
+
+    Args:
+        node (tuple): Node to evaluate, (operation, *arguments) or a price column such as ('Close',).
+        price_df (pandas.DataFrame): Price data of the ticker.
+        data_key (str): Fingerprint of `price_df`.
+        values (dict): Nodes already evaluated in the current computation.
+
+    Returns:
+        numpy.ndarray: Values of the node.
+
+    Notes:
+        - Inputs of a node are only evaluated if the node itself is not in the memo.
+    """
+    if node not in values:
+        if len(node) == 1:
+            values[node] = k.as_float_array(price_df[node[0]])
+        else:
+            operation, *arguments = node
+
+            def compute():
+                inputs = [
+                    (
+                        evaluate(argument, price_df, data_key, values)
+                        if isinstance(argument, tuple)
+                        else argument
+                    )
+                    for argument in arguments
+                ]
+                return registry.OPERATIONS[operation](*inputs)
+
+            values[node] = INDICATOR_CACHE.get_or_compute((data_key,) + node, compute)
+    return values[node]
+
+
+def compute_indicators(price_df, selected_indicators, **parameters):
+    """
+    Computes the values of the selected technical indicators.
+
+    Args:
+        price_df (pandas.DataFrame): Price data of the ticker.
+        selected_indicators (list): List of selected technical indicators.
+        **parameters: Parameters of the selected indicators by name (see registry.INDICATORS), e.g.:
+            - ma_short, ma_long, ema_checkbox for Moving Average.
+            - rsi_length for RSI.
+            - macd_fast, macd_slow, macd_signal for MACD.
+            - dmi_length, adx_smoothing for DMI.
+            - trb_length for Trading Range Breakout.
+            Other parameters are ignored.
+
+    Returns:
+        pandas.DataFrame: DataFrame with the same index as `price_df` and one column per indicator series:
+            - 'Moving_Average_short', 'Moving_Average_long' for Moving Average.
+            - 'RSI_<length>' for RSI.
+            - 'MACD_<fast>_<slow>_<signal>', 'MACDh_...', 'MACDs_...' for MACD (line, histogram, signal).
+            - 'ADX_<smoothing>', 'DMP_<length>', 'DMN_<length>' for DMI.
+            - 'Max', 'Min' (rolling maximum and minimum of the close) for Trading Range Breakout.
+    """
+    data_key = memo.fingerprint(price_df)
+    values = {}
+    columns = {}
+
+    for _, entry in registry.selected(selected_indicators):
+        for column, node in entry["outputs"](parameters).items():
+            columns[column] = evaluate(node, price_df, data_key, values)
+
+    return pd.DataFrame(columns, index=price_df.index)
+
+
+def compute_indicator_grid(price_df, name, grid):
+    """
+    Computes the outputs of one indicator for many sets of parameters.
+
+    Args:
+        price_df (pandas.DataFrame): Price data of the ticker.
+        name (str): Name of the indicator in registry.INDICATORS.
+        grid (pandas.DataFrame): One row per set of parameters, one column per parameter.
+
+    Returns:
+        list: One 2-D array (bars x parameter sets) per output of the indicator, in declaration order.
+
+    Notes:
+        - Nodes shared by several sets (e.g. the long moving average of many pairs) are evaluated once.
+    """
+    data_key = memo.fingerprint(price_df)
+    values = {}
+    nodes = [
+        list(registry.INDICATORS[name]["outputs"](p).values())
+        for p in grid.to_dict("records")
+    ]
+    matrices = []
+    for outputs in zip(*nodes):
+        unique = list(dict.fromkeys(outputs))
+        columns = np.column_stack(
+            [evaluate(node, price_df, data_key, values) for node in unique]
+        )
+        position = {node: i for i, node in enumerate(unique)}
+        matrices.append(columns.take([position[node] for node in outputs], axis=1))
+    return matrices
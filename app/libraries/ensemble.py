@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+
+from libraries import optimizer, performance, registry, signals as sg
+
+# -------------------------------------------------------
+# ENSEMBLES
+# -------------------------------------------------------
+# Backtests every combination of the selected indicators as one strategy. The
+# int8 signals are packed into a matrix (bars x indicators) and the
+# combinations into a 0/1 matrix (indicators x subsets), so the buy and sell
+# votes of all 2^N subsets are two matrix products and every voting rule is an
+# elementwise comparison. The returns of all ensembles then go through the
+# batched statistics of performance.py in one call.
+
+ENSEMBLE_RULES = ["Majority", "Unanimous", "Weighted"]
+
+
+# SUPPORT
+def pack_signals(signal_set):
+    """
+    Packs the signals of the indicators into an int8 matrix.
+
+    Args:
+        signal_set (signals.SignalSet or pandas.DataFrame): Signals from `signals.build_signals` or DataFrame
+            from `main.add_ta_to_df`.
+
+    Returns:
+        tuple: Indicator keys, signals (int8, bars x indicators, 0 during the warm-up periods) and the warm-up
+            length of every indicator.
+    """
+    signal_set = sg.as_signal_set(signal_set)
+    return signal_set.keys, signal_set.signals, signal_set.warm_up
+
+
+def subset_masks(num_indicators, min_size=2):
+    """
+    Every subset of the indicators with at least `min_size` members, as rows of a 0/1 int8 matrix.
+    """
+    bits = (np.arange(2**num_indicators)[:, None] >> np.arange(num_indicators)) & 1
+    return bits[bits.sum(axis=1) >= min_size].astype(np.int8)
+
+
+def ensemble_signals(signals, lengths, masks, rule, weights=None):
+    """
+    Combines the signals of the indicators of every subset with a voting rule.
+
+    Args:
+        signals (numpy.ndarray): int8 signals from `pack_signals`, bars x indicators.
+        lengths (numpy.ndarray): Warm-up length of every indicator.
+        masks (numpy.ndarray): Subsets from `subset_masks`, subsets x indicators.
+        rule (str): One of `ENSEMBLE_RULES`:
+            - 'Majority': 1 (-1) when more than half of the members signal 1 (-1), otherwise 0.
+            - 'Unanimous': 1 (-1) when every member signals 1 (-1), otherwise 0.
+            - 'Weighted': sign of the weighted sum of the signals of the members.
+        weights (array-like, optional): Weight of every indicator for the 'Weighted' rule (1 by default).
+
+    Returns:
+        tuple: int8 signals of the ensembles (bars x subsets) and their warm-up lengths, the longest warm-up of
+            their members.
+    """
+    sizes = masks.sum(axis=1, dtype=np.int16)
+    if rule == "Weighted":
+        weights = np.ones(len(signals.T)) if weights is None else np.asarray(weights)
+        combined = np.sign(signals @ (masks * weights).T).astype(np.int8)
+    else:
+        buy = (signals == 1).astype(np.int16) @ masks.T
+        sell = (signals == -1).astype(np.int16) @ masks.T
+        needed = sizes if rule == "Unanimous" else sizes // 2 + 1
+        combined = (buy >= needed).astype(np.int8) - (sell >= needed)
+    return combined, (masks * lengths).max(axis=1)
+
+
+def ensemble_names(keys, masks, rule):
+    """
+    Names of the ensembles, e.g. 'MA+RSI (Majority)'.
+    """
+    return [
+        "+".join(key for key, member in zip(keys, mask) if member) + f" ({rule})"
+        for mask in masks
+    ]
+
+
+# MAIN
+def evaluate_ensembles(signal_set, rules=ENSEMBLE_RULES, weights=None, periods=252):
+    """
+    Backtests B&H, every indicator and every ensemble of two or more indicators.
+
+    Args:
+        signal_set (signals.SignalSet or pandas.DataFrame): Signals from `signals.build_signals` or DataFrame
+            from `main.add_ta_to_df`.
+        rules (list): Voting rules evaluated (see `ensemble_signals`).
+        weights (array-like, optional): Weight of every indicator for the 'Weighted' rule, in the order of the
+            signal columns.
+        periods (int): Number of periods per year.
+
+    Returns:
+        pandas.DataFrame: One row per strategy ('B&H' first) with the statistics of
+            performance.returns_statistics, 'Num. Trades' and 'Current Recommendation', the ensembles sorted by
+            Sharpe ratio after the individual indicators.
+    """
+    signal_set = sg.as_signal_set(signal_set)
+    keys, signals, lengths = pack_signals(signal_set)
+    logreturns = signal_set.logreturns
+
+    names, columns = list(keys), [(signals, lengths)]
+    masks = subset_masks(len(keys))
+    for rule in rules:
+        names += ensemble_names(keys, masks, rule)
+        columns.append(ensemble_signals(signals, lengths, masks, rule, weights))
+    all_signals = np.concatenate([column for column, _ in columns], axis=1)
+    all_lengths = np.concatenate([length for _, length in columns])
+
+    returns = np.column_stack(
+        [logreturns, registry.masked_returns(all_signals, all_lengths, logreturns)]
+    )
+    statistics = pd.DataFrame(
+        performance.returns_statistics(returns, periods), index=["B&H"] + names
+    )
+    statistics["Num. Trades"] = np.append(np.nan, optimizer.count_trades(all_signals))
+    statistics["Current Recommendation"] = [None] + list(
+        optimizer.recommendations(all_signals)
+    )
+
+    ensembles = statistics.iloc[1 + len(keys) :].sort_values(
+        "Sharpe", ascending=False, na_position="last", kind="stable"
+    )
+    return pd.concat([statistics.iloc[: 1 + len(keys)], ensembles])
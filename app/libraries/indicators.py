@@ -1,7 +1,6 @@
 import streamlit as st
 import plotly.graph_objs as go
 import numpy as np
-import pandas_ta as ta
 
 # -------------------------------------------------------
 # HOW TO ADD OTHER INDICATORS:
@@ -11,16 +10,24 @@ import pandas_ta as ta
 #     or 'add_(indicator_name)' if it is to be added to the main graph
 # b.) Create function 'execute_(indicator_name' if it is to be displayed
 #
-# 2. Modify main.py
+# 2. Modify registry.py
+# a.) Add an entry to 'INDICATORS' with its key, parameters (and their widgets),
+#     outputs (nodes of the computation graph), signal rule (on 2-D arrays, one column
+#     per parameter set), warm-up length and the optimizer ranges ('grid') of the
+#     numeric parameters
+# b.) Add new operations to 'OPERATIONS' (and kernels.py) if the existing ones are not enough
+#
+# 3. Modify main.py
 # a.) Modify function 'execute_ta' if it is to be displayed
-# b.) Modify function 'add_ta_to_df'
 #
-# 3. Modify web.py
-# a.) Add placeholder '(indicator_name)_place' = st.empty() and execution if-statement if separate graph needs to be displayed
-# b.) Add (indicator_name) to st.multiselect
-# c.) Add section for parameters' choice
-# d.) Add necessary variables to main.execute_ta and main.add_ta_to_df
-# e.) Modify the logic of "REMOVE INDICATORS" button if separate graph is displayed
+# 4. Modify web.py
+# a.) Add placeholder '(indicator_name)_place' = st.empty() and pass it to main.execute_ta if separate graph needs to be displayed
+# b.) Modify the logic of "REMOVE INDICATORS" button if separate graph is displayed
+#
+# 5. Modify streaming.py
+# a.) Create a subclass of 'IndicatorState' that updates the outputs of the indicator
+#     bar by bar (in the order of its registry 'outputs') and implements its signal rule
+# b.) Add it to 'STREAM_STATES' under the key of its registry entry
 
 
 # -------------------------------------------------------
@@ -86,48 +93,26 @@ def indicator_graph_layout(fig, interval, height=400):
 # MAIN
 # -------------------------------------------------------
 # INDICATOR GRAPHS
-def add_mas(
-    fig, ticker_data, period, interval, ma_period_short, ma_period_long, ema_chechbox
-):
+def add_mas(fig, indicators_df, ma_period_short, ma_period_long):
     """
     Adds moving averages (MA) to a Plotly figure based on the given parameters.
 
     Args:
         fig (plotly.graph_objs._figure.Figure): Plotly figure object to update.
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period (str): Period for fetching historical data.
-        interval (str): Interval for historical data.
+        indicators_df (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
         ma_period_short (int): Period for short moving average.
         ma_period_long (int): Period for long moving average.
-        ema_chechbox (bool): If True, calculates exponential moving averages (EMAs); otherwise, calculates simple moving averages (SMAs).
 
     Returns:
         plotly.graph_objs._figure.Figure: Updated Plotly figure object with moving averages added.
     """
-    price_df = ticker_data.history(period=period, interval=interval)
-
-    if ema_chechbox:
-        price_df["Moving_Average_short"] = ta.ema(
-            close=price_df["Close"], length=ma_period_short
-        )
-        price_df["Moving_Average_long"] = ta.ema(
-            close=price_df["Close"], length=ma_period_long
-        )
-    else:
-        price_df["Moving_Average_short"] = (
-            price_df["Close"].rolling(window=ma_period_short).mean()
-        )
-        price_df["Moving_Average_long"] = (
-            price_df["Close"].rolling(window=ma_period_long).mean()
-        )
-
     fig.data = [trace for trace in fig.data if "MA" not in trace.name]
 
     if ma_period_short > 1:
         fig.add_trace(
             go.Scatter(
-                x=price_df.index,
-                y=price_df["Moving_Average_short"],
+                x=indicators_df.index,
+                y=indicators_df["Moving_Average_short"],
                 mode="lines",
                 line=dict(color="#FF5500", width=1),
                 name=f"{ma_period_short}-MA",
@@ -135,8 +120,8 @@ def add_mas(
         )
     fig.add_trace(
         go.Scatter(
-            x=price_df.index,
-            y=price_df["Moving_Average_long"],
+            x=indicators_df.index,
+            y=indicators_df["Moving_Average_long"],
             mode="lines",
             line=dict(color="lightgreen", width=1),
             name=f"{ma_period_long}-MA",
@@ -150,34 +135,32 @@ def add_mas(
     return fig
 
 
-def add_channels(fig, ticker_data, period, interval, trb_length, trb_width):
+def add_channels(fig, indicators_df, trb_length, trb_width):
     """
     Adds trading range boundaries to a Plotly figure based on the given parameters.
 
     Args:
         fig (plotly.graph_objs._figure.Figure): Plotly figure object to update.
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period (str): Period for fetching historical data.
-        interval (str): Interval for historical data.
+        indicators_df (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
         trb_length (int): Length of the trading range boundary window.
         trb_width (float): Width multiplier for trading range boundaries as a percentage of the support line.
 
     Returns:
         plotly.graph_objs._figure.Figure: Updated Plotly figure object with trading range boundaries added.
     """
-    price_df = ticker_data.history(period=period, interval=interval)
-    price_df["Max"] = price_df["Close"].rolling(window=trb_length).max()
-    price_df["Min"] = price_df["Close"].rolling(window=trb_length).min()
+    channel_max = indicators_df["Max"].copy()
+    channel_min = indicators_df["Min"].copy()
 
-    condition = price_df["Max"] > price_df["Min"] * (1 + trb_width)
-    price_df.loc[condition, ["Max", "Min"]] = np.nan
+    condition = channel_max > channel_min * (1 + trb_width)
+    channel_max[condition] = np.nan
+    channel_min[condition] = np.nan
 
     fig.data = [trace for trace in fig.data if "Range" not in trace.name]
 
     fig.add_trace(
         go.Scatter(
-            x=price_df.index,
-            y=price_df["Max"],
+            x=indicators_df.index,
+            y=channel_max,
             mode="lines",
             line=dict(color="lightskyblue", width=1.5),
             name=f"{trb_length}/{trb_width}-Range Resistance",
@@ -185,8 +168,8 @@ def add_channels(fig, ticker_data, period, interval, trb_length, trb_width):
     )
     fig.add_trace(
         go.Scatter(
-            x=price_df.index,
-            y=price_df["Min"],
+            x=indicators_df.index,
+            y=channel_min,
             mode="lines",
             line=dict(color="lightskyblue", width=1.5),
             name=f"{trb_length}/{trb_width}-Range Support",
@@ -195,14 +178,13 @@ def add_channels(fig, ticker_data, period, interval, trb_length, trb_width):
     return fig
 
 
-def create_rsi(ticker_data, period, interval, rsi_length, rsi_thresholds, rsi_checkbox):
+def create_rsi(indicators_df, interval, rsi_length, rsi_thresholds, rsi_checkbox):
     """
     Creates a Plotly figure displaying the Relative Strength Index (RSI) and its thresholds.
 
     Args:
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period (str): Period for fetching historical data (e.g., '1y', '3mo').
-        interval (str): Interval for historical data (e.g., '1d', '1h').
+        indicators_df (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
+        interval (str): Interval of the price data (e.g., '1d', '1h').
         rsi_length (int): Length of RSI calculation period.
         rsi_thresholds (str): Lower and upper RSI thresholds separated by '/' (e.g., '30/70').
         rsi_checkbox (bool): If True, calculates and plots the SMA of RSI.
@@ -210,15 +192,14 @@ def create_rsi(ticker_data, period, interval, rsi_length, rsi_thresholds, rsi_ch
     Returns:
         plotly.graph_objs._figure.Figure: Plotly figure object displaying RSI and its thresholds.
     """
-    price_df = ticker_data.history(period=period, interval=interval)
     fig = go.Figure()
 
-    price_df.ta.rsi(length=rsi_length, append=True)
+    rsi = indicators_df[f"RSI_{rsi_length}"]
 
     fig.add_trace(
         go.Scatter(
-            x=price_df.index,
-            y=price_df[f"RSI_{rsi_length}"],
+            x=indicators_df.index,
+            y=rsi,
             mode="lines",
             line=dict(color="lime", width=1.5),
             name=f"RSI-{rsi_length}",
@@ -229,18 +210,18 @@ def create_rsi(ticker_data, period, interval, rsi_length, rsi_thresholds, rsi_ch
 
     fig.add_shape(
         type="line",
-        x0=price_df.index[0],
+        x0=indicators_df.index[0],
         y0=lower_threshold,
-        x1=price_df.index[-1],
+        x1=indicators_df.index[-1],
         y1=lower_threshold,
         line=dict(color="#FF440B", width=1, dash="dash"),
         name=f"Lower Threshold ({lower_threshold})",
     )
     fig.add_shape(
         type="line",
-        x0=price_df.index[0],
+        x0=indicators_df.index[0],
         y0=upper_threshold,
-        x1=price_df.index[-1],
+        x1=indicators_df.index[-1],
         y1=upper_threshold,
         line=dict(color="#FF440B", width=1, dash="dash"),
         name=f"Upper Threshold ({upper_threshold})",
@@ -249,12 +230,12 @@ def create_rsi(ticker_data, period, interval, rsi_length, rsi_thresholds, rsi_ch
     indicator_graph_layout(fig, interval, height=300)
 
     if rsi_checkbox:
-        price_df.ta.sma(close=f"RSI_{rsi_length}", length=rsi_length, append=True)
+        rsi_sma = rsi.rolling(window=rsi_length).mean()
 
         fig.add_trace(
             go.Scatter(
-                x=price_df.index,
-                y=price_df[f"SMA_{rsi_length}"],
+                x=indicators_df.index,
+                y=rsi_sma,
                 mode="lines",
                 line=dict(color="#FF5500", width=1),
                 name=f"{rsi_length}-MA",
@@ -264,14 +245,13 @@ def create_rsi(ticker_data, period, interval, rsi_length, rsi_thresholds, rsi_ch
     return fig
 
 
-def create_macd(ticker_data, period, interval, macd_fast, macd_slow, macd_signal):
+def create_macd(indicators_df, interval, macd_fast, macd_slow, macd_signal):
     """
     Creates a Plotly figure displaying the Moving Average Convergence Divergence (MACD) and its components.
 
     Args:
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period (str): Period for fetching historical data (e.g., '1y', '3mo').
-        interval (str): Interval for historical data (e.g., '1d', '1h').
+        indicators_df (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
+        interval (str): Interval of the price data (e.g., '1d', '1h').
         macd_fast (int): Fast length for MACD calculation.
         macd_slow (int): Slow length for MACD calculation.
         macd_signal (int): Signal length for MACD calculation.
@@ -279,17 +259,12 @@ def create_macd(ticker_data, period, interval, macd_fast, macd_slow, macd_signal
     Returns:
         plotly.graph_objs._figure.Figure: Plotly figure object displaying MACD, its signal line, and histogram.
     """
-    price_df = ticker_data.history(period=period, interval=interval)
     fig = go.Figure()
 
-    price_df.ta.macd(
-        close="Close", fast=macd_fast, slow=macd_slow, signal=macd_signal, append=True
-    )
-
     fig.add_trace(
         go.Scatter(
-            x=price_df.index,
-            y=price_df[f"MACD_{macd_fast}_{macd_slow}_{macd_signal}"],
+            x=indicators_df.index,
+            y=indicators_df[f"MACD_{macd_fast}_{macd_slow}_{macd_signal}"],
             mode="lines",
             line=dict(color="lime", width=1.5),
             name="MACD_line",
@@ -298,8 +273,8 @@ def create_macd(ticker_data, period, interval, macd_fast, macd_slow, macd_signal
 
     fig.add_trace(
         go.Scatter(
-            x=price_df.index,
-            y=price_df[f"MACDs_{macd_fast}_{macd_slow}_{macd_signal}"],
+            x=indicators_df.index,
+            y=indicators_df[f"MACDs_{macd_fast}_{macd_slow}_{macd_signal}"],
             mode="lines",
             line=dict(color="#FF5500", width=1.5),
             name="Signal_line",
@@ -308,8 +283,8 @@ def create_macd(ticker_data, period, interval, macd_fast, macd_slow, macd_signal
 
     fig.add_trace(
         go.Bar(
-            x=price_df.index,
-            y=price_df[f"MACDh_{macd_fast}_{macd_slow}_{macd_signal}"],
+            x=indicators_df.index,
+            y=indicators_df[f"MACDh_{macd_fast}_{macd_slow}_{macd_signal}"],
             marker_color="#FF440B",
             name="MACD_Histogram",
         )
@@ -320,29 +295,25 @@ def create_macd(ticker_data, period, interval, macd_fast, macd_slow, macd_signal
     return fig
 
 
-def create_dmi(ticker_data, period, interval, length, adx_smoothing):
+def create_dmi(indicators_df, interval, length, adx_smoothing):
     """
     Creates a Plotly figure displaying the Directional Movement Index (DMI) and its components.
 
     Args:
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period (str): Period for fetching historical data (e.g., '1y', '3mo').
-        interval (str): Interval for historical data (e.g., '1d', '1h').
+        indicators_df (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
+        interval (str): Interval of the price data (e.g., '1d', '1h').
         length (int): Length for calculating DMI.
         adx_smoothing (int): Smoothing period for ADX calculation.
 
     Returns:
         plotly.graph_objs._figure.Figure: Plotly figure object displaying ADX, DI+, and DI-.
     """
-    price_df = ticker_data.history(period=period, interval=interval)
     fig = go.Figure()
 
-    price_df.ta.adx(close="Close", length=length, lensig=adx_smoothing, append=True)
-
     fig.add_trace(
         go.Scatter(
-            x=price_df.index,
-            y=price_df[f"ADX_{adx_smoothing}"],
+            x=indicators_df.index,
+            y=indicators_df[f"ADX_{adx_smoothing}"],
             mode="lines",
             line=dict(color="#FF5500", width=1.5),
             name="ADX",
@@ -351,8 +322,8 @@ def create_dmi(ticker_data, period, interval, length, adx_smoothing):
 
     fig.add_trace(
         go.Scatter(
-            x=price_df.index,
-            y=price_df[f"DMP_{length}"],
+            x=indicators_df.index,
+            y=indicators_df[f"DMP_{length}"],
             mode="lines",
             line=dict(color="lime", width=1.5),
             name="DI+",
@@ -361,8 +332,8 @@ def create_dmi(ticker_data, period, interval, length, adx_smoothing):
 
     fig.add_trace(
         go.Scatter(
-            x=price_df.index,
-            y=price_df[f"DMN_{length}"],
+            x=indicators_df.index,
+            y=indicators_df[f"DMN_{length}"],
             mode="lines",
             line=dict(color="#FF440B", width=1.5),
             name="DI-",
@@ -376,26 +347,20 @@ def create_dmi(ticker_data, period, interval, length, adx_smoothing):
 
 # EXECUTE TA GRAPHS
 def execute_ma(
-    ticker_data,
-    period_input,
-    interval_input,
+    indicators_df,
     graph,
     ma_short,
     ma_long,
-    ema_checkbox,
     graph_place,
 ):
     """
     Executes the calculation and plotting of moving averages (MA) on a specified graph.
 
     Args:
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period_input (str): Period for fetching historical data (e.g., '1y', '3mo').
-        interval_input (str): Interval for historical data (e.g., '1d', '1h').
+        indicators_df (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
         graph (plotly.graph_objs._figure.Figure): Plotly figure object to update.
         ma_short (int): Period for short moving average.
         ma_long (int): Period for long moving average.
-        ema_checkbox (bool): If True, calculates exponential moving averages (EMAs); otherwise, calculates simple moving averages (SMAs).
         graph_place: Placeholder for displaying the graph.
 
     Returns:
@@ -409,26 +374,19 @@ def execute_ma(
     else:
         st.session_state.graph = add_mas(
             graph,
-            ticker_data,
-            period_input,
-            interval_input,
+            indicators_df,
             ma_short,
             ma_long,
-            ema_checkbox,
         )
         graph_place.plotly_chart(st.session_state.graph, config=dict(scrollZoom=True))
 
 
-def execute_trb(
-    ticker_data, period_input, interval_input, graph, trb_length, trb_width, graph_place
-):
+def execute_trb(indicators_df, graph, trb_length, trb_width, graph_place):
     """
     Executes the calculation and plotting of trading range boundaries (TRB) on a specified graph.
 
     Args:
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period_input (str): Period for fetching historical data (e.g., '1y', '3mo').
-        interval_input (str): Interval for historical data (e.g., '1d', '1h').
+        indicators_df (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
         graph (plotly.graph_objs._figure.Figure): Plotly figure object to update.
         trb_length (int): Length of the trading range boundary window.
         trb_width (float): Width multiplier for trading range boundaries.
@@ -437,15 +395,12 @@ def execute_trb(
     Returns:
         None
     """
-    st.session_state.graph = add_channels(
-        graph, ticker_data, period_input, interval_input, trb_length, trb_width
-    )
+    st.session_state.graph = add_channels(graph, indicators_df, trb_length, trb_width)
     graph_place.plotly_chart(st.session_state.graph, config=dict(scrollZoom=True))
 
 
 def execute_rsi(
-    ticker_data,
-    period_input,
+    indicators_df,
     interval_input,
     rsi_length,
     rsi_thresholds,
@@ -456,9 +411,8 @@ def execute_rsi(
     Executes the calculation and plotting of the Relative Strength Index (RSI) on a specified graph.
 
     Args:
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period_input (str): Period for fetching historical data (e.g., '1y', '3mo').
-        interval_input (str): Interval for historical data (e.g., '1d', '1h').
+        indicators_df (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
+        interval_input (str): Interval of the price data (e.g., '1d', '1h').
         rsi_length (int): Length of RSI calculation period.
         rsi_thresholds (str): Lower and upper RSI thresholds separated by '/' (e.g., '30/70').
         rsi_checkbox (bool): If True, calculates and plots the SMA of RSI.
@@ -468,8 +422,7 @@ def execute_rsi(
         None
     """
     rsi_graph = create_rsi(
-        ticker_data,
-        period_input,
+        indicators_df,
         interval_input,
         rsi_length,
         rsi_thresholds,
@@ -479,8 +432,7 @@ def execute_rsi(
 
 
 def execute_macd(
-    ticker_data,
-    period_input,
+    indicators_df,
     interval_input,
     macd_fast,
     macd_slow,
@@ -491,9 +443,8 @@ def execute_macd(
     Executes the calculation and plotting of the Moving Average Convergence Divergence (MACD) on a specified graph.
 
     Args:
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period_input (str): Period for fetching historical data (e.g., '1y', '3mo').
-        interval_input (str): Interval for historical data (e.g., '1d', '1h').
+        indicators_df (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
+        interval_input (str): Interval of the price data (e.g., '1d', '1h').
         macd_fast (int): Fast length for MACD calculation.
         macd_slow (int): Slow length for MACD calculation.
         macd_signal (int): Signal length for MACD calculation.
@@ -509,21 +460,18 @@ def execute_macd(
         )
     else:
         macd_graph = create_macd(
-            ticker_data, period_input, interval_input, macd_fast, macd_slow, macd_signal
+            indicators_df, interval_input, macd_fast, macd_slow, macd_signal
         )
         MACD_place.plotly_chart(macd_graph, config=dict(scrollZoom=True))
 
 
-def execute_dmi(
-    ticker_data, period_input, interval_input, dmi_length, adx_smoothing, DMI_place
-):
+def execute_dmi(indicators_df, interval_input, dmi_length, adx_smoothing, DMI_place):
     """
     Executes the calculation and plotting of the Directional Movement Index (DMI) on a specified graph.
 
     Args:
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period_input (str): Period for fetching historical data (e.g., '1y', '3mo').
-        interval_input (str): Interval for historical data (e.g., '1d', '1h').
+        indicators_df (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
+        interval_input (str): Interval of the price data (e.g., '1d', '1h').
         dmi_length (int): Length for calculating DMI.
         adx_smoothing (int): Smoothing period for ADX calculation.
         DMI_place: Placeholder for displaying the DMI graph.
@@ -531,7 +479,5 @@ def execute_dmi(
     Returns:
         None
     """
-    dmi_graph = create_dmi(
-        ticker_data, period_input, interval_input, dmi_length, adx_smoothing
-    )
+    dmi_graph = create_dmi(indicators_df, interval_input, dmi_length, adx_smoothing)
     DMI_place.plotly_chart(dmi_graph, config=dict(scrollZoom=True))
@@ -0,0 +1,513 @@
+import sys
+
+import numpy as np
+
+from libraries import loops
+
+# -------------------------------------------------------
+# NUMPY INDICATOR KERNELS
+# -------------------------------------------------------
+# All kernels take float64 arrays and work along axis 0, so a 2-D array is
+# processed as one series per column. They reproduce the formulas of
+# pandas_ta 0.3.14b (the library the app used before) without the pandas
+# overhead. Inputs must not contain NaN after their warm-up.
+
+# Largest power of ten the block-wise recursion may scale values by
+MAX_EXPONENT = 200
+
+
+# SUPPORT
+def as_float_array(x):
+    """
+    Converts a Series, DataFrame or array to a contiguous float64 array.
+
+    Args:
+        x (array-like): Values to convert.
+
+    Returns:
+        numpy.ndarray: Contiguous float64 array.
+    """
+    return np.ascontiguousarray(x, dtype=np.float64)
+
+
+def nan_like(x):
+    """
+    Returns an array of NaN with the shape of `x`.
+    """
+    return np.full(np.shape(x), np.nan)
+
+
+def linear_recursion(b, a, y_prev=0.0):
+    """
+    Computes y[t] = a * y[t - 1] + b[t] along axis 0 without a Python loop over the elements.
+
+    Args:
+        b (numpy.ndarray): Inputs of the recursion (1-D or 2-D).
+        a (float): Decay factor between 0 and 1.
+        y_prev (float or numpy.ndarray): Value of y before the first element.
+
+    Returns:
+        numpy.ndarray: Values of y.
+
+    Notes:
+        - Within a block y[k] = a^k * (a * y_prev + cumsum(b[j] * a^-j)), so every block is one cumulative sum.
+        - The block length is limited so that a^-k stays below 10^MAX_EXPONENT.
+    """
+    n = len(b)
+    out = np.empty_like(b)
+    if n == 0:
+        return out
+    if a == 0:
+        out[:] = b
+        return out
+
+    block = int(min(n, max(1, MAX_EXPONENT / -np.log10(a))))
+    shape = (block,) + (1,) * (b.ndim - 1)
+    powers = (a ** np.arange(block)).reshape(shape)
+    inverse_powers = 1 / powers
+
+    carry = y_prev
+    for start in range(0, n, block):
+        end = min(start + block, n)
+        m = end - start
+        acc = np.cumsum(b[start:end] * inverse_powers[:m], axis=0)
+        out[start:end] = powers[:m] * (a * carry + acc)
+        carry = out[end - 1]
+    return out
+
+
+def rolling_extreme(x, length, ufunc):
+    """
+    Computes the rolling maximum or minimum along axis 0 in O(n) (van Herk/Gil-Werman algorithm).
+
+    Args:
+        x (numpy.ndarray): Values (1-D or 2-D).
+        length (int): Length of the window.
+        ufunc (numpy.ufunc): np.maximum or np.minimum.
+
+    Returns:
+        numpy.ndarray: Rolling extreme, NaN for the first `length` - 1 rows.
+    """
+    n = len(x)
+    out = nan_like(x)
+    if length > n:
+        return out
+
+    pad = (-n) % length
+    padded = np.concatenate([x, np.repeat(x[-1:], pad, axis=0)])
+    blocks = padded.reshape((-1, length) + x.shape[1:])
+    prefix = ufunc.accumulate(blocks, axis=1).reshape(padded.shape)
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(padded.shape)
+
+    out[length - 1 :] = ufunc(suffix[: n - length + 1], prefix[length - 1 : n])
+    return out
+
+
+# MAIN
+def sma(x, length):
+    """
+    Simple moving average, equivalent to pandas rolling(window=length).mean().
+
+    Args:
+        x (array-like): Values (1-D or 2-D), may contain NaN.
+        length (int): Length of the window.
+
+    Returns:
+        numpy.ndarray: Moving average, NaN where the window is incomplete or contains NaN.
+    """
+    x = as_float_array(x)
+    out = nan_like(x)
+    if length > len(x):
+        return out
+
+    valid = ~np.isnan(x)
+    # Centering the values keeps the rounding error of the cumulative sum small
+    offset = np.nanmean(x, axis=0) if valid.any() else 0.0
+    values = np.where(valid, x - offset, 0.0)
+    zeros = np.zeros((1,) + x.shape[1:])
+    sums = np.cumsum(np.concatenate([zeros, values]), axis=0)
+    counts = np.cumsum(np.concatenate([zeros, valid]), axis=0)
+
+    window_sum = sums[length:] - sums[:-length]
+    window_count = counts[length:] - counts[:-length]
+    out[length - 1 :] = np.where(
+        window_count == length, window_sum / length + offset, np.nan
+    )
+    return out
+
+
+def rolling_max(x, length):
+    """
+    Rolling maximum, equivalent to pandas rolling(window=length).max().
+    """
+    return rolling_extreme(as_float_array(x), length, np.maximum)
+
+
+def rolling_min(x, length):
+    """
+    Rolling minimum, equivalent to pandas rolling(window=length).min().
+    """
+    return rolling_extreme(as_float_array(x), length, np.minimum)
+
+
+def ema(x, length, start=0):
+    """
+    Exponential moving average seeded with the simple average of the first `length` values (pandas_ta.ema).
+
+    Args:
+        x (array-like): Values (1-D or 2-D).
+        length (int): Length of the average, the smoothing factor is 2 / (length + 1).
+        start (int): Index of the first value to use, earlier values are ignored.
+
+    Returns:
+        numpy.ndarray: Moving average, NaN before index `start` + `length` - 1.
+    """
+    x = as_float_array(x)
+    out = nan_like(x)
+    seed_index = start + length - 1
+    if length < 1 or seed_index >= len(x):
+        return out
+
+    alpha = 2 / (length + 1)
+    out[seed_index] = x[start : seed_index + 1].mean(axis=0)
+    out[seed_index + 1 :] = linear_recursion(
+        alpha * x[seed_index + 1 :], 1 - alpha, out[seed_index]
+    )
+    return out
+
+
+def rma(x, length):
+    """
+    Wilder's moving average (pandas_ta.rma), i.e. pandas ewm(alpha=1 / length, min_periods=length).mean().
+
+    Args:
+        x (array-like): Values (1-D or 2-D), may contain NaN.
+        length (int): Length of the average.
+
+    Returns:
+        numpy.ndarray: Moving average, NaN until `length` valid values are available.
+
+    Notes:
+        - NaN values get zero weight but the weights of earlier values keep decaying (pandas ignore_na=False).
+    """
+    x = as_float_array(x)
+    valid = ~np.isnan(x)
+    counts = np.cumsum(valid, axis=0)
+    decay = 1 - 1 / length
+    numerator = linear_recursion(np.where(valid, x, 0.0), decay)
+    denominator = linear_recursion(valid.astype(np.float64), decay)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = numerator / denominator
+    out[counts < length] = np.nan
+    return out
+
+
+def diff(x):
+    """
+    First difference along axis 0, NaN in the first row.
+    """
+    x = as_float_array(x)
+    out = nan_like(x)
+    out[1:] = x[1:] - x[:-1]
+    return out
+
+
+def rsi(close, length):
+    """
+    Relative Strength Index with Wilder's smoothing (pandas_ta.rsi).
+
+    Args:
+        close (array-like): Close prices (1-D or 2-D).
+        length (int): Length of the indicator.
+
+    Returns:
+        numpy.ndarray: RSI between 0 and 100, NaN for the first `length` rows.
+    """
+    change = diff(close)
+    change[:1] = 0.0
+    # Both averages share the weights of rma, so only the weighted sums are needed
+    decay = 1 - 1 / length
+    gains = linear_recursion(np.maximum(change, 0.0), decay)
+    losses = linear_recursion(np.maximum(-change, 0.0), decay)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = 100 * gains / (gains + losses)
+    out[:length] = np.nan
+    return out
+
+
+def macd(close, fast, slow, signal):
+    """
+    Moving Average Convergence Divergence (pandas_ta.macd).
+
+    Args:
+        close (array-like): Close prices (1-D or 2-D).
+        fast (int): Length of the fast EMA.
+        slow (int): Length of the slow EMA.
+        signal (int): Length of the EMA of the MACD line.
+
+    Returns:
+        tuple: MACD line, signal line and histogram (line - signal) as numpy.ndarrays.
+
+    Notes:
+        - As in pandas_ta, the lengths are swapped if `slow` is smaller than `fast`.
+    """
+    if slow < fast:
+        fast, slow = slow, fast
+    close = as_float_array(close)
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(line, signal, start=slow - 1)
+    return line, signal_line, line - signal_line
+
+
+def true_range(high, low, close):
+    """
+    True range: largest of High - Low, |High - previous Close| and |previous Close - Low| (pandas_ta.true_range).
+
+    Args:
+        high (array-like): High prices (1-D or 2-D).
+        low (array-like): Low prices.
+        close (array-like): Close prices.
+
+    Returns:
+        numpy.ndarray: True range, NaN in the first row.
+
+    Notes:
+        - As in pandas_ta, machine epsilon is added to High - Low if any bar of a series has High == Low.
+    """
+    high, low, close = as_float_array(high), as_float_array(low), as_float_array(close)
+    high_low = high - low
+    high_low = high_low + sys.float_info.epsilon * (high_low == 0).any(axis=0)
+    prev_close = np.concatenate([nan_like(close[:1]), close[:-1]])
+    out = np.fmax(
+        np.abs(high_low),
+        np.fmax(np.abs(high - prev_close), np.abs(prev_close - low)),
+    )
+    out[:1] = np.nan
+    return out
+
+
+def directional_movement(high, low, sign):
+    """
+    Positive (`sign` = 1) or negative (`sign` = -1) directional movement.
+
+    Args:
+        high (array-like): High prices (1-D or 2-D).
+        low (array-like): Low prices.
+        sign (int): 1 for +DM, -1 for -DM.
+
+    Returns:
+        numpy.ndarray: Directional movement, NaN in the first row.
+    """
+    up = diff(high)
+    down = -diff(low)
+    if sign < 0:
+        up, down = down, up
+    out = np.where((up > down) & (up > 0), up, 0.0)
+    out[np.abs(out) < sys.float_info.epsilon] = 0.0
+    out[:1] = np.nan
+    return out
+
+
+def directional_index(smoothed_movement, atr):
+    """
+    DI+ or DI-: smoothed directional movement relative to the average true range, in percent.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (100 / atr) * smoothed_movement
+
+
+def directional_movement_index(di_plus, di_minus):
+    """
+    DX: absolute difference of DI+ and DI- relative to their sum, in percent.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return 100 * np.abs(di_plus - di_minus) / (di_plus + di_minus)
+
+
+def dmi(high, low, close, length, adx_smoothing):
+    """
+    Directional Movement Index and Average Directional Index (pandas_ta.adx).
+
+    Args:
+        high (array-like): High prices (1-D or 2-D).
+        low (array-like): Low prices.
+        close (array-like): Close prices.
+        length (int): Length of DI+ and DI-.
+        adx_smoothing (int): Length of the ADX smoothing.
+
+    Returns:
+        tuple: ADX, DI+ and DI- as numpy.ndarrays.
+    """
+    atr = rma(true_range(high, low, close), length)
+    di_plus = directional_index(rma(directional_movement(high, low, 1), length), atr)
+    di_minus = directional_index(rma(directional_movement(high, low, -1), length), atr)
+    dx = directional_movement_index(di_plus, di_minus)
+    return rma(dx, adx_smoothing), di_plus, di_minus
+
+
+# -------------------------------------------------------
+# SIGNAL KERNELS
+# -------------------------------------------------------
+def breakout_signal(close, maximum, minimum, width):
+    """
+    Trading range breakout signal of every bar, known at its close (before the shift to the next bar).
+
+    Args:
+        close (array-like): Close prices (1-D or 2-D).
+        maximum (array-like): Rolling maximum of the close.
+        minimum (array-like): Rolling minimum of the close.
+        width (float): Maximum width of the range relative to its minimum.
+
+    Returns:
+        numpy.ndarray: 1 if the close breaks above the previous maximum, -1 if below the previous minimum
+            and 0 otherwise (or if the range is wider than `width`).
+    """
+    close, maximum, minimum = (
+        as_float_array(close),
+        as_float_array(maximum),
+        as_float_array(minimum),
+    )
+    prev_maximum = np.concatenate([nan_like(maximum[:1]), maximum[:-1]])
+    prev_minimum = np.concatenate([nan_like(minimum[:1]), minimum[:-1]])
+    condition = maximum < minimum * (1 + width)
+    return np.where(
+        condition & (close > prev_maximum),
+        1.0,
+        np.where(condition & (close < prev_minimum), -1.0, 0.0),
+    )
+
+
+def next_index(mask):
+    """
+    For every position i of a 1-D boolean array, the first j >= i where `mask` is True (len(mask) if none).
+    """
+    n = len(mask)
+    positions = np.where(mask, np.arange(n), n)
+    return np.minimum.accumulate(positions[::-1])[::-1]
+
+
+def chain(successor, start):
+    """
+    Follows a chain start -> successor[start] -> ... until the last element of `successor` (the sentinel).
+
+    Args:
+        successor (numpy.ndarray): Successor of every node; the last node is a sentinel pointing to itself.
+        start (int): First node.
+
+    Returns:
+        numpy.ndarray: Nodes of the chain in order, without the sentinel.
+
+    Notes:
+        - Pointer doubling: after k steps the first 2^k nodes are known and the successor table jumps 2^k
+          nodes, so the whole chain takes O(log n) vectorized steps.
+    """
+    sentinel = len(successor) - 1
+    nodes = np.array([start])
+    jump = successor
+    while nodes[-1] != sentinel:
+        nodes = np.concatenate([nodes, jump[nodes]])
+        jump = jump[jump]
+    return nodes[nodes != sentinel]
+
+
+def hold_signal(signal, periods):
+    """
+    Keeps a new position for `periods` bars (the Trading Range Breakout holding period).
+
+    A position opened right after a neutral bar (0 followed by 1 or -1) is kept over the following
+    neutral bars until `periods` bars have passed or the opposite signal appears. Bars inside a
+    holding period do not open a new one.
+
+    Args:
+        signal (array-like): 1-D signals (1, -1, 0 or NaN).
+        periods (int): Number of bars the position is held, including the opening bar.
+
+    Returns:
+        numpy.ndarray: Signals with the holding periods filled in.
+    """
+    signal = as_float_array(signal)
+    n = len(signal)
+    out = signal.copy()
+    opening = np.flatnonzero((signal[:-1] == 0) & (np.abs(signal[1:]) == 1)) + 1
+    if len(opening) == 0 or periods <= 1:
+        return out
+
+    # Last bar of the holding period: bar before the opposite signal or the end of the period
+    direction = signal[opening]
+    next_up = next_index(signal == 1)
+    next_down = next_index(signal == -1)
+    after = np.minimum(opening + 1, n - 1)
+    opposite = np.where(direction > 0, next_down[after], next_up[after])
+    opposite = np.where(opening + 1 < n, opposite, n)
+    end = np.minimum(np.minimum(opening + periods - 1, opposite - 1), n - 1)
+
+    # Opening bars that are not inside the holding period of an earlier one
+    successor = np.append(np.searchsorted(opening, end + 2), len(opening))
+    accepted = chain(successor, 0)
+
+    marker = np.zeros(n + 1)
+    marker[opening[accepted]] = direction[accepted]
+    marker[end[accepted] + 1] = 2
+    last_marker = np.maximum.accumulate(np.where(marker != 0, np.arange(n + 1), 0))
+    state = marker[last_marker][:n]
+    holding = np.abs(state) == 1
+    out[holding] = state[holding]
+    return out
+
+
+def hold_signals(signal, periods):
+    """
+    Holding periods of every column of 2-D signals (see `hold_signal`).
+
+    Args:
+        signal (array-like): Signals, bars x columns.
+        periods (array-like): Number of bars a position is held, one per column.
+
+    Returns:
+        numpy.ndarray: Signals with the holding periods filled in.
+
+    Notes:
+        - With the 'numba' backend of loops.py all the columns go through one compiled loop.
+    """
+    signal = as_float_array(signal)
+    periods = np.asarray(periods, dtype=np.int64)
+    if loops.get_backend() == "numba":
+        return loops.compiled(loops.hold_signal_loop)(signal, periods)
+    return np.column_stack(
+        [hold_signal(column, length) for column, length in zip(signal.T, periods)]
+    ).reshape(signal.shape)
+
+
+def trade_segments(values, returns):
+    """
+    Splits 1-D signals into trades, the runs of consecutive bars with the same signal 1 or -1.
+
+    Args:
+        values (numpy.ndarray): Signals (1, -1, 0 or NaN).
+        returns (numpy.ndarray): Log returns of the strategy (NaN counted as 0).
+
+    Returns:
+        tuple: First bar, last bar and sum of the returns of every trade (int64, int64 and float64 arrays).
+
+    Notes:
+        - With the 'numba' backend of loops.py the bars go through one compiled loop.
+    """
+    values = as_float_array(values)
+    returns = as_float_array(returns)
+    if loops.get_backend() == "numba":
+        return loops.compiled(loops.trade_segments_loop)(values, returns)
+
+    n = len(values)
+    changes = np.ones(n, dtype=bool)
+    changes[1:] = values[1:] != values[:-1]
+    boundaries = np.append(np.flatnonzero(changes), n)
+
+    starts = np.flatnonzero(changes & (np.abs(values) == 1))
+    ends = boundaries[np.searchsorted(boundaries, starts, side="right")] - 1
+    if len(starts) == 0:
+        return starts, ends, np.zeros(0)
+
+    # Sums of the returns between every start and the bar after the end
+    padded = np.append(np.nan_to_num(returns), 0.0)
+    bounds = np.column_stack([starts, ends + 1]).ravel()
+    return starts, ends, np.add.reduceat(padded, bounds)[::2]
@@ -0,0 +1,129 @@
+import numpy as np
+
+from libraries import constants as c
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# -------------------------------------------------------
+# PATH-DEPENDENT LOOPS
+# -------------------------------------------------------
+# Sequential kernels (every bar depends on the state left by the previous
+# ones) written as plain loops, compiled with Numba when it is installed.
+# The kernels of kernels.py reproduce them with NumPy array operations, which
+# is the backend used without Numba. The backend can be changed at runtime
+# with `set_backend`; both give the same results (see tests/test_loops.py).
+
+BACKENDS = ["numpy", "numba"]
+_COMPILED = {}
+
+
+# SUPPORT (BACKEND)
+def available_backends():
+    """
+    Returns the backends that can be used here ('numba' only if Numba is installed).
+    """
+    return [name for name in BACKENDS if name != "numba" or numba is not None]
+
+
+def set_backend(name):
+    """
+    Selects the backend of the path-dependent kernels.
+
+    Args:
+        name (str): 'numpy', 'numba' or 'auto' (Numba when installed, NumPy otherwise).
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+    """
+    global _BACKEND
+    if name == "auto":
+        name = available_backends()[-1]
+    if name not in available_backends():
+        raise ValueError(
+            f"Unknown or unavailable backend '{name}' (available: {', '.join(available_backends())})."
+        )
+    _BACKEND = name
+
+
+def get_backend():
+    """
+    Returns the backend of the path-dependent kernels, 'numpy' or 'numba'.
+    """
+    return _BACKEND
+
+
+def compiled(loop):
+    """
+    Returns the Numba-compiled version of a loop of this module, compiled on first use.
+    """
+    if loop not in _COMPILED:
+        _COMPILED[loop] = numba.njit(cache=True, nogil=True)(loop)
+    return _COMPILED[loop]
+
+
+# LOOPS
+def hold_signal_loop(signal, periods):
+    """
+    Holding period of the Trading Range Breakout, bar by bar (see kernels.hold_signal).
+
+    Args:
+        signal (numpy.ndarray): Signals (1, -1, 0 or NaN), bars x columns.
+        periods (numpy.ndarray): Number of bars a position is held, one per column (int64).
+
+    Returns:
+        numpy.ndarray: Signals with the holding periods filled in.
+    """
+    out = signal.copy()
+    n, num_columns = out.shape
+    for column in range(num_columns):
+        for i in range(1, n):
+            value = out[i, column]
+            if out[i - 1, column] == 0 and (value == 1 or value == -1):
+                for j in range(i + 1, min(i + periods[column], n)):
+                    if out[j, column] == 0:
+                        out[j, column] = value
+                    elif out[j, column] == -value:
+                        break
+    return out
+
+
+def trade_segments_loop(values, returns):
+    """
+    Splits signals into trades, bar by bar (see kernels.trade_segments).
+
+    Args:
+        values (numpy.ndarray): 1-D signals.
+        returns (numpy.ndarray): 1-D log returns of the strategy (NaN counted as 0).
+
+    Returns:
+        tuple: First bar, last bar and sum of the returns of every trade.
+    """
+    n = len(values)
+    starts = np.empty(n, dtype=np.int64)
+    ends = np.empty(n, dtype=np.int64)
+    sums = np.empty(n, dtype=np.float64)
+    count = 0
+    i = 0
+    while i < n:
+        value = values[i]
+        if value == 1 or value == -1:
+            total = 0.0
+            j = i
+            while j < n and values[j] == value:
+                if not np.isnan(returns[j]):
+                    total += returns[j]
+                j += 1
+            starts[count] = i
+            ends[count] = j - 1
+            sums[count] = total
+            count += 1
+            i = j
+        else:
+            i += 1
+    return starts[:count], ends[:count], sums[:count]
+
+
+set_backend(c.loop_backend)
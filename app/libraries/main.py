@@ -1,28 +1,39 @@
 import streamlit as st
-import yfinance as yf
 import plotly.graph_objs as go
 import numpy as np
 import pandas as pd
-import pandas_ta as ta
 import base64
+from dataclasses import dataclass
 
-from libraries import indicators as ind, constants as c
+from libraries import (
+    indicators as ind,
+    kernels as k,
+    data,
+    registry,
+    performance,
+    optimizer,
+    signals as sg,
+    drawdowns as dd,
+    constants as c,
+)
 
 
 # -------------------------------------------------------
 # MAIN (INITIAL INTERACTION)
 # -------------------------------------------------------
-def fetch_data(ticker_input, period, interval):
+def fetch_data(ticker_input, period, interval, source=None):
     """
-    Fetches historical price data for a specified ticker from Yahoo Finance.
+    Fetches historical price data for a specified ticker from Yahoo Finance or another data source.
 
     Args:
         ticker_input (str): Ticker symbol of the stock or asset.
         period (str): Period for fetching historical data (e.g., '1y', '3mo', 'max').
         interval (str): Interval for fetching historical data (e.g., '1d', '1h', '5m').
+        source (data.DataSource, optional): Source of the data. Defaults to the source selected in constants.
 
     Returns:
-        yfinance.Ticker: Object containing historical data for the specified ticker.
+        yfinance.Ticker: Object containing historical data for the specified ticker
+                         (a yfinance.Ticker-like object for other sources than Yahoo Finance).
 
     Raises:
         StreamlitAPIException: If the interval '5m' is selected with a period other than '1mo',
@@ -30,19 +41,25 @@ def fetch_data(ticker_input, period, interval):
 
     Notes:
         - Uses Yahoo Finance API to retrieve historical price data.
+        - The ticker is validated by downloading the requested period and interval, which is cached and
+          reused as the price data of the search (see `data.load_price_data`).
         - Displays an error message via Streamlit if there are issues with the input parameters or data retrieval.
     """
-    ticker_data = yf.Ticker(ticker_input)
-    price = ticker_data.history(period="max")
-
     if interval == "5m" and period != "1mo":
         st.error(
             "5 minutes time frame can be used only for the time period of 1 month. Please select the correct time period.",
             icon="🚨",
         )
         return 1
-    elif not price.empty:
-        return ticker_data
+
+    if source is None:
+        source = data.get_source()
+        price = data.load_price_data(ticker_input, period, interval)
+    else:
+        price = data.get_price_data(source, ticker_input, period, interval)
+
+    if not price.empty:
+        return source.ticker(ticker_input)
     else:
         st.error(
             "Error: The ticker is not recognized. Please provide a valid symbol listed on Yahoo Finance (https://finance.yahoo.com/).",
@@ -51,14 +68,14 @@ def fetch_data(ticker_input, period, interval):
         return 1
 
 
-def create_graph(ticker_data, period, interval):
+def create_graph(ticker_info, price_df, interval):
     """
     Creates a Plotly figure displaying a candlestick chart for historical price data of a specified ticker.
 
     Args:
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period (str): Period for fetching historical data (e.g., '1y', '3mo').
-        interval (str): Interval for fetching historical data (e.g., '1d', '1h', '5m').
+        ticker_info (dict): Metadata snapshot of the ticker (see `data.load_ticker_info`).
+        price_df (pandas.DataFrame): Price data of the ticker.
+        interval (str): Interval of the price data (e.g., '1d', '1h', '5m').
 
     Returns:
         plotly.graph_objs._figure.Figure: Plotly figure object displaying the candlestick chart.
@@ -67,7 +84,6 @@ def create_graph(ticker_data, period, interval):
         - Candlestick chart shows Open, High, Low, and Close prices over time.
         - Updates the figure layout with appropriate title, axis configurations, and styling.
     """
-    price_df = ticker_data.history(period=period, interval=interval)
     fig = go.Figure()
 
     fig.add_trace(
@@ -89,7 +105,7 @@ def create_graph(ticker_data, period, interval):
     )
 
     fig.update_layout(
-        title=f"Graph {ticker_data.info.get('longName')} ({ticker_data.ticker.upper()})",
+        title=f"Graph {ticker_info.get('longName')} ({ticker_info['symbol'].upper()})",
         xaxis_rangeslider_visible=False,
         title_font=dict(size=32, family="serif", color="linen"),
         height=600,
@@ -121,111 +137,124 @@ def create_graph(ticker_data, period, interval):
 # -------------------------------------------------------
 
 
+def select_parameters(selected_indicators, num_bars):
+    """
+    Displays the parameter widgets of the selected indicators (declared in registry.INDICATORS) in up to three columns.
+
+    Args:
+        selected_indicators (list): List of selected technical indicators.
+        num_bars (int): Number of bars of the price data, used as the upper bound of the lengths.
+
+    Returns:
+        dict: Values of all parameters of the registry by name, None for the parameters of unselected indicators.
+    """
+    parameters = registry.default_parameters()
+    selected = registry.selected(selected_indicators)
+    if not selected:
+        return parameters
+
+    # Dynamic adjustments to the # of cols depending on the # of indicators
+    num_indicator_columns = min(len(selected), 3)
+    indicator_columns = st.columns(num_indicator_columns)
+
+    for counter, (_, entry) in enumerate(selected):
+        with indicator_columns[counter % num_indicator_columns]:
+            st.write(f"**{entry['title']}**")
+            for name, widget in entry["parameters"].items():
+                kwargs = {
+                    key: value(num_bars, parameters) if callable(value) else value
+                    for key, value in widget.items()
+                    if key not in ("widget", "label", "grid")
+                }
+                parameters[name] = getattr(st, widget["widget"])(
+                    widget["label"], **kwargs
+                )
+
+    return parameters
+
+
 def execute_ta(
     selected_indicators,
-    ticker_data,
-    period_input,
+    indicators_df,
     interval_input,
     graph,
     graph_place,
     RSI_place,
     MACD_place,
     DMI_place,
-    ma_short,
-    ma_long,
-    ema_checkbox,
-    rsi_length,
-    rsi_thresholds,
-    rsi_checkbox,
-    macd_fast,
-    macd_slow,
-    macd_signal,
-    dmi_length,
-    adx_smoothing,
-    trb_length,
-    trb_width,
+    **parameters,
 ):
     """
     Plots selected technical analysis indicators on a specified graphs based on user input.
 
     Args:
         selected_indicators (list): List of selected indicators to execute.
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period_input (str): Period for fetching historical data (e.g., '1y', '3mo').
-        interval_input (str): Interval for fetching historical data (e.g., '1d', '1h', '5m').
+        indicators_df (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
+        interval_input (str): Interval of the price data (e.g., '1d', '1h', '5m').
         graph (plotly.graph_objs._figure.Figure): Plotly figure object to update.
         graph_place: Placeholder for displaying the main graph.
         RSI_place: Placeholder for displaying the RSI graph.
         MACD_place: Placeholder for displaying the MACD graph.
         DMI_place: Placeholder for displaying the DMI graph.
-        ma_short (int): Period for short moving average.
-        ma_long (int): Period for long moving average.
-        ema_checkbox (bool): If True, calculates exponential moving averages (EMAs); otherwise, calculates simple moving averages (SMAs).
-        rsi_length (int): Length of RSI calculation period.
-        rsi_thresholds (str): Lower and upper RSI thresholds separated by '/' (e.g., '30/70').
-        rsi_checkbox (bool): If True, calculates and plots the SMA of RSI.
-        macd_fast (int): Fast length for MACD calculation.
-        macd_slow (int): Slow length for MACD calculation.
-        macd_signal (int): Signal length for MACD calculation.
-        dmi_length (int): Length for calculating DMI.
-        adx_smoothing (int): Smoothing period for ADX calculation.
-        trb_length (int): Length of the trading range boundary window.
-        trb_width (float): Width multiplier for trading range boundaries as a percentage of the support.
+        **parameters: Parameters of the selected indicators by name (see registry.INDICATORS):
+            - ma_short (int), ma_long (int): Periods of the moving averages.
+            - rsi_length (int): Length of RSI calculation period.
+            - rsi_thresholds (str): Lower and upper RSI thresholds separated by '/' (e.g., '30/70').
+            - rsi_checkbox (bool): If True, calculates and plots the SMA of RSI.
+            - macd_fast (int), macd_slow (int), macd_signal (int): Lengths for MACD calculation.
+            - dmi_length (int): Length for calculating DMI.
+            - adx_smoothing (int): Smoothing period for ADX calculation.
+            - trb_length (int): Length of the trading range boundary window.
+            - trb_width (float): Width multiplier for trading range boundaries as a percentage of the support.
 
     Returns:
         None
     """
+    p = parameters
+
     if "Moving Average" in selected_indicators:
         ind.execute_ma(
-            ticker_data,
-            period_input,
-            interval_input,
+            indicators_df,
             graph,
-            ma_short,
-            ma_long,
-            ema_checkbox,
+            p["ma_short"],
+            p["ma_long"],
             graph_place,
         )
 
     if "Relative Strength Index (RSI)" in selected_indicators:
         ind.execute_rsi(
-            ticker_data,
-            period_input,
+            indicators_df,
             interval_input,
-            rsi_length,
-            rsi_thresholds,
-            rsi_checkbox,
+            p["rsi_length"],
+            p["rsi_thresholds"],
+            p["rsi_checkbox"],
             RSI_place,
         )
 
     if "Moving Average Converge Divergence (MACD)" in selected_indicators:
         ind.execute_macd(
-            ticker_data,
-            period_input,
+            indicators_df,
             interval_input,
-            macd_fast,
-            macd_slow,
-            macd_signal,
+            p["macd_fast"],
+            p["macd_slow"],
+            p["macd_signal"],
             MACD_place,
         )
 
     if "Directional Movement Index (DMI)" in selected_indicators:
         ind.execute_dmi(
-            ticker_data,
-            period_input,
+            indicators_df,
             interval_input,
-            dmi_length,
-            adx_smoothing,
+            p["dmi_length"],
+            p["adx_smoothing"],
             DMI_place,
         )
     if "Trading Range Breakout" in selected_indicators:
         ind.execute_trb(
-            ticker_data,
-            period_input,
-            interval_input,
+            indicators_df,
             graph,
-            trb_length,
-            trb_width,
+            p["trb_length"],
+            p["trb_width"],
             graph_place,
         )
 
@@ -236,100 +265,99 @@ def execute_ta(
 
 
 # SUPPORT (STATISTICS)
-def calculate_num_trades(col):
+def trade_ledger(col_signals, col_returns=None):
     """
-    Calculates the number of trades based on a column of signals.
+    Splits a column of signals into trades (see kernels.trade_segments).
 
     Args:
-        col (pandas.Series): Column of signals, indicating buy/sell/neutral (1/-1/0) signals.
+        col_signals (pandas.Series): Column of signals indicating buy/sell/neutral (1/-1/0) signals.
+        col_returns (pandas.Series, optional): Column of log returns of the strategy corresponding to the signals.
 
     Returns:
-        int: Number of distinct trading signals detected.
+        pandas.DataFrame: One row per trade with columns:
+            - 'Entry', 'Exit': Index labels of the first and the last bar of the trade.
+            - 'Direction': 1 for long and -1 for short trades.
+            - 'Bars': Number of bars the position was held.
+            - 'Return': Sum of the log returns of the trade (NaN if `col_returns` is not given).
 
     Notes:
-        - Trade is initiated when the value of signal changes to either 1 or -1 and is closed when the value changes to any other.
-        - Ignores NaN values in the column.
+        - A trade is a run of consecutive bars with the same signal 1 or -1. It is closed when the signal changes
+          to any other value (including the opposite position, which opens a new trade).
+        - NaN returns (e.g. the first bar) are counted as 0.
     """
-    num_signals = 0
-    for i in range(1, len(col)):
-        if col[i] != col[i - 1] and col[i] != 0 and not pd.isna(col[i]):
-            num_signals += 1
+    values = col_signals.to_numpy(dtype=float)
+    if col_returns is None:
+        starts, ends, _ = k.trade_segments(values, np.zeros(len(values)))
+        returns = np.full(len(starts), np.nan)
+    else:
+        starts, ends, returns = k.trade_segments(
+            values, col_returns.to_numpy(dtype=float)
+        )
 
-    return num_signals
+    return pd.DataFrame(
+        {
+            "Entry": col_signals.index[starts],
+            "Exit": col_signals.index[ends],
+            "Direction": values[starts].astype(int),
+            "Bars": ends - starts + 1,
+            "Return": returns,
+        }
+    )
 
 
-def win_lose_trades(col_signals, col_returns):
+def trade_statistics(ledger):
     """
-    Calculates the number of winning and losing trades based on trading signals and corresponding returns.
+    Derives the trade statistics from a trade ledger.
 
     Args:
-        col_signals (pandas.Series): Column of signals indicating buy/sell/neutral (1/-1/0) signals.
-        col_returns (pandas.Series): Column of returns corresponding to the signals.
+        ledger (pandas.DataFrame): Trades from `trade_ledger`.
 
     Returns:
-        list: A list containing the number of winning trades and losing trades.
+        dict: 'Num. Trades', 'Win. Trades', 'Pct. Win. Trades', 'Losing Trades', 'Pct. Losing Trades',
+            'Win/Loss Ratio' and 'Avg. Trade Duration'.
 
     Notes:
-        - Trade is initiated when the value of signal changes to either 1 or -1 and is closed when the value changes to any other.
-        - Ignores NaN values in the columns.
-    """
-    winning_trades = 0
-    losing_trades = 0
-    returns_per_trade = []
-    position = 1
-    for i in range(1, len(col_signals) - 1):
-        if (
-            col_signals[i] == col_signals[i - 1]
-            and not pd.isna(col_signals[i])
-            and col_signals[i] != 0
-        ):
-            returns_per_trade.append(col_returns[i])
-            if position == 1:
-                returns_per_trade.append(col_returns[i - 1])
-            position += 1
-        elif (
-            col_signals[i] != col_signals[i - 1]
-            and col_signals[i] != col_signals[i + 1]
-            and col_signals[i] != 0
-            and not pd.isna(col_signals[i])
-        ):
-            if returns_per_trade != []:
-                sum_return_trade = sum(returns_per_trade)
-                if sum_return_trade > 0:
-                    winning_trades += 1
-                else:
-                    losing_trades += 1
-                returns_per_trade = []
-                position = 1
-            returns_per_trade.append(col_returns[i])
-        else:
-            if returns_per_trade != []:
-                sum_return_trade = sum(returns_per_trade)
-                if sum_return_trade > 0:
-                    winning_trades += 1
-                else:
-                    losing_trades += 1
-            returns_per_trade = []
-            position = 1
-
-    # Check if the last signal is added
-    if returns_per_trade != []:
-        if returns_per_trade != []:
-            sum_return_trade = sum(returns_per_trade)
-        if sum_return_trade > 0:
-            winning_trades += 1
-        else:
-            losing_trades += 1
+        - A trade with a return of exactly 0 counts as a losing trade.
+        - Without trades the percentages and the average duration are NaN.
+    """
+    stats = {}
+    stats["Num. Trades"] = len(ledger)
+    num_trades = stats["Num. Trades"] or np.nan
+    stats["Win. Trades"] = int((ledger["Return"] > 0).sum())
+    stats["Pct. Win. Trades"] = stats["Win. Trades"] / num_trades
+    stats["Losing Trades"] = stats["Num. Trades"] - stats["Win. Trades"]
+    stats["Pct. Losing Trades"] = stats["Losing Trades"] / num_trades
+    stats["Win/Loss Ratio"] = stats["Win. Trades"] / max(1, stats["Losing Trades"])
+    stats["Avg. Trade Duration"] = ledger["Bars"].mean()
+    return stats
 
-    # Check if the last signal's duration is 1 period
-    if col_signals.iloc[-1] != col_signals.iloc[-2] and col_signals.iloc[-1] != 0:
-        if col_returns.iloc[-1] > 0:
-            winning_trades += 1
-        else:
-            losing_trades += 1
 
-    result = [winning_trades, losing_trades]
-    return result
+def calculate_num_trades(col):
+    """
+    Calculates the number of trades based on a column of signals.
+
+    Args:
+        col (pandas.Series): Column of signals, indicating buy/sell/neutral (1/-1/0) signals.
+
+    Returns:
+        int: Number of trades (see `trade_ledger`).
+    """
+    return len(trade_ledger(col))
+
+
+def win_lose_trades(col_signals, col_returns):
+    """
+    Calculates the number of winning and losing trades based on trading signals and corresponding returns.
+
+    Args:
+        col_signals (pandas.Series): Column of signals indicating buy/sell/neutral (1/-1/0) signals.
+        col_returns (pandas.Series): Column of returns corresponding to the signals.
+
+    Returns:
+        list: A list containing the number of winning trades and losing trades (see `trade_ledger`).
+    """
+    stats = trade_statistics(trade_ledger(col_signals, col_returns))
+    return [stats["Win. Trades"], stats["Losing Trades"]]
 
 
 def mean_trade_length(col_signals):
@@ -340,217 +368,51 @@ def mean_trade_length(col_signals):
         col_signals (pandas.Series): Column of signals, typically indicating buy/sell/neutral (1/-1/0) signals.
 
     Returns:
-        float: Mean length of trading positions in periods.
-
-    Notes:
-        - Assumes signals are represented as 1 (buy) or -1 (sell).
-        - Ignores periods with no trading signal (0).
-        - Computes the average length of consecutive periods with the same trading signal.
-    """
-    trade_lengths = []
-    current_trade_length = 0
-    in_trade = False
-    current_trade_value = 0
-
-    for i in col_signals:
-        if i == 1 or i == -1:
-            if not in_trade:
-                in_trade = True
-                current_trade_length = 1
-                current_trade_value = i
-            elif i == current_trade_value:
-                current_trade_length += 1
-            else:
-                trade_lengths.append(current_trade_length)
-                current_trade_length = 1
-                current_trade_value = i
-        elif i == 0 and in_trade:
-            trade_lengths.append(current_trade_length)
-            in_trade = False
-
-    if in_trade:
-        trade_lengths.append(current_trade_length)
-
-    mean = np.mean(trade_lengths)
-    return mean
+        float: Mean length of trading positions in periods (see `trade_ledger`).
+    """
+    return trade_ledger(col_signals)["Bars"].mean()
 
 
 # MAIN (STATISTICS)
-def add_ta_to_df(
-    ticker_data,
-    period_input,
-    interval_input,
-    selected_indicators,
-    ma_short,
-    ma_long,
-    ema_checkbox,
-    rsi_length,
-    rsi_thresholds,
-    macd_fast,
-    macd_slow,
-    macd_signal,
-    dmi_length,
-    adx_smoothing,
-    trb_length,
-    trb_width,
-    trb_num_periods_to_hold,
-):
+def add_ta_to_df(price_df, selected_indicators, indicators_df=None, **parameters):
     """
     Adds technical analysis signals and corresponding returns to a DataFrame based on selected indicators.
 
     Args:
-        ticker_data (yfinance.Ticker object): yfinance data of the ticker.
-        period_input (str): Period for fetching historical data (e.g., '1y', '5d', 'max').
-        interval_input (str): Interval for fetching historical data (e.g., '1d', '1h', '5m').
+        price_df (pandas.DataFrame): Price data of the ticker. It is copied, not modified.
         selected_indicators (list): List of selected technical indicators to calculate and add to the DataFrame.
-        ma_short (int): Short moving average period.
-        ma_long (int): Long moving average period.
-        ema_checkbox (bool): Whether to use exponential moving average (EMA) instead of simple moving average (SMA).
-        rsi_length (int): Length of RSI (Relative Strength Index).
-        rsi_thresholds (str): Lower and upper thresholds for RSI signals (e.g., '30/70').
-        macd_fast (int): Fast moving average period for MACD.
-        macd_slow (int): Slow moving average period for MACD.
-        macd_signal (int): Signal line period for MACD.
-        dmi_length (int): Length of DMI (Directional Movement Index).
-        adx_smoothing (int): Smoothing period for ADX (Average Directional Index).
-        trb_length (int): Length of the trading range boundary window.
-        trb_width (float): Width multiplier for trading range boundaries as a percentage of the support.
-        trb_num_periods_to_hold (int): Number of periods to hold TRB signals after initial detection.
+        indicators_df (pandas.DataFrame, optional): Indicator values from `engine.compute_indicators`.
+            Computed here if not given.
+        **parameters: Parameters of the selected indicators by name (see registry.INDICATORS):
+            - ma_short (int), ma_long (int): Short and long moving average periods.
+            - ema_checkbox (bool): Whether to use exponential moving average (EMA) instead of simple moving average (SMA).
+            - rsi_length (int): Length of RSI (Relative Strength Index).
+            - rsi_thresholds (str): Lower and upper thresholds for RSI signals (e.g., '30/70').
+            - macd_fast (int), macd_slow (int), macd_signal (int): Fast, slow and signal periods for MACD.
+            - dmi_length (int): Length of DMI (Directional Movement Index).
+            - adx_smoothing (int): Smoothing period for ADX (Average Directional Index).
+            - trb_length (int): Length of the trading range boundary window.
+            - trb_width (float): Width multiplier for trading range boundaries as a percentage of the support.
+            - trb_num_periods_to_hold (int): Number of periods to hold TRB signals after initial detection.
 
     Returns:
         pandas.DataFrame: DataFrame with added columns for each selected indicator's signals and corresponding returns.
 
     Notes:
-        - Signals are added as columns prefixed with indicator names (e.g., 'MA_Signal', 'RSI_Signal').
-        - Returns are added as columns prefixed with indicator names (e.g., 'MA_returns', 'RSI_returns').
+        - Signals are added as int8 columns (1, -1 or 0) prefixed with indicator keys (e.g., 'MA_Signal', 'RSI_Signal').
+          The length of the warm-up period of every indicator is stored in `attrs['warm_up']` by key; the signals
+          of those bars are 0.
+        - Returns are added as columns prefixed with indicator keys (e.g., 'MA_returns', 'RSI_returns'), NaN during
+          the warm-up periods.
         - Returns are calculated based on the log returns of the 'Close' price.
-        - Handles NaN values appropriately for signal and return calculations.
+        - The signal rules are declared in registry.INDICATORS.
+        - The analysis functions (`analyze`, `strategy_returns`, ensemble.evaluate_ensembles) also take the
+          SignalSet of `signals.build_signals` directly, without the DataFrame.
     """
-    price_df = ticker_data.history(period=period_input, interval=interval_input)
-
-    price_df["logreturns"] = np.log(price_df["Close"] / price_df["Close"].shift(1))
-
-    if "Moving Average" in selected_indicators:
-        if ema_checkbox:
-            price_df["Moving_Average_short"] = ta.ema(
-                close=price_df["Close"], length=ma_short
-            )
-            price_df["Moving_Average_long"] = ta.ema(
-                close=price_df["Close"], length=ma_long
-            )
-        else:
-            price_df["Moving_Average_short"] = (
-                price_df["Close"].rolling(window=ma_short).mean()
-            )
-            price_df["Moving_Average_long"] = (
-                price_df["Close"].rolling(window=ma_long).mean()
-            )
-
-        price_df["MA_Signal"] = (
-            (price_df["Moving_Average_short"] >= price_df["Moving_Average_long"])
-            .shift(1)
-            .fillna(False)
-            .astype(int)
-            .replace({0: -1, 1: 1})
-        )
-        price_df["MA_Signal"].iloc[:ma_long] = None
-        price_df["MA_returns"] = price_df["MA_Signal"] * price_df["logreturns"]
-
-    if "Relative Strength Index (RSI)" in selected_indicators:
-        price_df.ta.rsi(length=rsi_length, append=True)
-        lower_threshold, upper_threshold = map(int, rsi_thresholds.split("/"))
-
-        price_df["RSI_Signal"] = (
-            price_df[f"RSI_{rsi_length}"]
-            .apply(
-                lambda x: (
-                    -1 if x > upper_threshold else (1 if x < lower_threshold else 0)
-                )
-            )
-            .shift(1)
-        )
-        price_df["RSI_Signal"].iloc[: (rsi_length + 1)] = None
-        price_df["RSI_returns"] = price_df["RSI_Signal"] * price_df["logreturns"]
-
-    if "Moving Average Converge Divergence (MACD)" in selected_indicators:
-        price_df.ta.macd(
-            close="Close",
-            fast=macd_fast,
-            slow=macd_slow,
-            signal=macd_signal,
-            append=True,
-        )
-
-        price_df["MACD_Signal"] = (
-            price_df[f"MACDh_{macd_fast}_{macd_slow}_{macd_signal}"]
-            .apply(lambda x: -1 if x < 0 else (1 if x > 0 else 0))
-            .shift(1)
-        )
-        price_df["MACD_Signal"].iloc[: (macd_slow + macd_signal - 1)] = None
-        price_df["MACD_returns"] = price_df["MACD_Signal"] * price_df["logreturns"]
-
-    if "Directional Movement Index (DMI)" in selected_indicators:
-        price_df.ta.adx(
-            close="Close", length=dmi_length, lensig=adx_smoothing, append=True
-        )
-
-        price_df["DMI_Signal"] = (
-            (price_df[f"DMP_{dmi_length}"] >= price_df[f"DMN_{dmi_length}"])
-            .shift(1)
-            .fillna(False)
-            .astype(int)
-            .replace({0: -1, 1: 1})
-        )
-        price_df["DMI_Signal"].iloc[: (dmi_length + 1)] = None
-        price_df["DMI_returns"] = price_df["DMI_Signal"] * price_df["logreturns"]
-
-    if "Trading Range Breakout" in selected_indicators:
-        price_df["Max"] = price_df["Close"].rolling(window=trb_length).max()
-        price_df["Min"] = price_df["Close"].rolling(window=trb_length).min()
-
-        price_df["TRB_Condition"] = (
-            (price_df["Max"] < (price_df["Min"] * (1 + trb_width)))
-            .fillna(False)
-            .astype(int)
-        )
-
-        price_df["Prev_Max"] = price_df["Max"].shift(1)
-        price_df["Prev_Min"] = price_df["Min"].shift(1)
-
-        price_df["TRB_Signal"] = price_df.apply(
-            lambda row: (
-                1
-                if row["Close"] > row["Prev_Max"] and row["TRB_Condition"] == 1
-                else (
-                    -1
-                    if row["Close"] < row["Prev_Min"] and row["TRB_Condition"] == 1
-                    else 0
-                )
-            ),
-            axis=1,
-        ).shift(1)
-
-        price_df["TRB_Signal"].iloc[:trb_length] = None
-
-        modified_signal = price_df["TRB_Signal"].copy()
-        # Holding period after the signal
-        for i in range(1, len(modified_signal)):
-            if modified_signal[i - 1] == 0 and modified_signal[i] in [-1, 1]:
-                value_to_keep = modified_signal[i]
-                for j in range(1, trb_num_periods_to_hold):
-                    if i + j < len(modified_signal) and modified_signal[i + j] == 0:
-                        modified_signal[i + j] = value_to_keep
-                    elif (
-                        i + j < len(modified_signal)
-                        and modified_signal[i + j] == -value_to_keep
-                    ):
-                        break
-
-        price_df["TRB_Signal"] = modified_signal
-
-        price_df["TRB_returns"] = price_df["TRB_Signal"] * price_df["logreturns"]
-
-    return price_df
+    return sg.to_frame(
+        sg.build_signals(price_df, selected_indicators, indicators_df, **parameters),
+        price_df,
+    )
 
 
 def calculate_statistics_buyandhold(col_returns, periods):
@@ -575,30 +437,11 @@ def calculate_statistics_buyandhold(col_returns, periods):
         - Equity curve is calculated based on an initial investment of $10,000.
         - Annualized metrics are calculated assuming `periods` represent annualized units.
     """
-    stats = {}
-
-    # Returns
-    stats["Total Return"] = (1 + col_returns).cumprod()[-1] - 1
-
-    stats["Ann. Mean Return"] = (1 + col_returns.mean()) ** periods - 1
-
-    # Risk
-    stats["St. Dev."] = col_returns.std() * np.sqrt(periods)
-
-    stats["Sharpe"] = stats["Ann. Mean Return"] / stats["St. Dev."]
-
-    negative_returns = col_returns[col_returns < 0]
-    downside_deviation = negative_returns.std() * np.sqrt(periods)
-    stats["Sortino"] = stats["Ann. Mean Return"] / downside_deviation
-
-    rolling_max = (1 + col_returns).cumprod().cummax()
-    daily_drawdown = (1 + col_returns).cumprod() / rolling_max - 1
-    stats["Max Drawdown"] = daily_drawdown.min()
+    stats = performance.returns_statistics(col_returns, periods)
+    stats = {key: value[0] for key, value in stats.items()}
 
     # Equity curve
-    initial_investment = 10000
-    equity_curve = initial_investment * (1 + col_returns).cumprod()
-    stats["Equity Curve"] = equity_curve
+    stats["Equity Curve"] = performance.equity_curves(col_returns.to_frame()).iloc[:, 0]
 
     return stats
 
@@ -634,53 +477,30 @@ def calculate_statistics(col_returns, col_signals, periods):
         - Equity curve is calculated based on an initial investment of $10,000.
         - Annualized metrics are calculated assuming `periods` represent annualized units.
     """
-    stats = {}
-
-    # Returns
-    stats["Total Return"] = (1 + col_returns).cumprod()[-1] - 1
-
-    stats["Ann. Mean Return"] = (1 + col_returns.mean()) ** periods - 1
-
-    # Risk
-    stats["St. Dev."] = col_returns.std() * np.sqrt(periods)
-
-    stats["Sharpe"] = stats["Ann. Mean Return"] / stats["St. Dev."]
-
-    negative_returns = col_returns[col_returns < 0]
-    downside_deviation = negative_returns.std() * np.sqrt(periods)
-    stats["Sortino"] = stats["Ann. Mean Return"] / downside_deviation
-
-    rolling_max = (1 + col_returns).cumprod().cummax()
-    daily_drawdown = (1 + col_returns).cumprod() / rolling_max - 1
-    stats["Max Drawdown"] = daily_drawdown.min()
+    stats = calculate_statistics_buyandhold(col_returns, periods)
+    equity_curve = stats.pop("Equity Curve")
 
     # Trade statistics
-    stats["Num. Trades"] = calculate_num_trades(col_signals)
-
-    win_lose_list = win_lose_trades(col_signals, col_returns)
-    stats["Win. Trades"] = win_lose_list[0]
-    stats["Pct. Win. Trades"] = stats["Win. Trades"] / stats["Num. Trades"]
-    stats["Losing Trades"] = win_lose_list[1]
-    stats["Pct. Losing Trades"] = stats["Losing Trades"] / stats["Num. Trades"]
-    stats["Win/Loss Ratio"] = stats["Win. Trades"] / max(1, stats["Losing Trades"])
-
-    stats["Avg. Trade Duration"] = mean_trade_length(col_signals)
-
-    if col_signals.iloc[-1] == 1:
-        stats["Current Recommendation"] = "BUY"
-    elif col_signals.iloc[-1] == -1:
-        stats["Current Recommendation"] = "SELL"
-    else:
-        stats["Current Recommendation"] = "NEUTRAL"
+    stats.update(trade_statistics(trade_ledger(col_signals, col_returns)))
+    stats["Current Recommendation"] = recommendation(col_signals)
 
     # Equity curve
-    initial_investment = 10000
-    equity_curve = initial_investment * (1 + col_returns).cumprod()
     stats["Equity Curve"] = equity_curve
 
     return stats
 
 
+def recommendation(col_signals):
+    """
+    Returns the current recommendation of a strategy: 'BUY', 'SELL' or 'NEUTRAL' for the last signal 1, -1 or other.
+    """
+    if col_signals.iloc[-1] == 1:
+        return "BUY"
+    elif col_signals.iloc[-1] == -1:
+        return "SELL"
+    return "NEUTRAL"
+
+
 # --------------------------
 
 
@@ -758,13 +578,89 @@ def get_bh_value(value, df):
         - This function iterates through the first six columns of `df`.
         - It searches for `value` within each column.
         - If `value` is found in any column, it returns the corresponding B&H value from the 'B&H' row of that column.
+        - NaN is returned for values that are not found (e.g. NaN statistics), which are then not colored.
     """
     for col in df.columns[0:6]:
         if value in df[col].values:
             return df.loc["B&H", col]
+    return np.nan
 
 
 # MAIN (FINAL DATA FRAME + STYLES)
+@dataclass
+class AnalysisResult:
+    """
+    Statistics and equity curves of Buy & Hold and of every strategy, computed together by `analyze`.
+
+    Attributes:
+        statistics (pandas.DataFrame): One row per strategy ('B&H' first) with the statistics of `calculate_statistics`.
+        equity_curves (pandas.DataFrame): One column per strategy with its equity curve (10,000$ base).
+        drawdowns (drawdowns.DrawdownResult): Drawdown episodes and underwater curves of the equity curves.
+    """
+
+    statistics: pd.DataFrame
+    equity_curves: pd.DataFrame
+    drawdowns: dd.DrawdownResult
+
+
+def strategy_returns(signal_set):
+    """
+    Collects the returns of Buy & Hold and of every indicator in one DataFrame.
+
+    Parameters:
+    - signal_set (signals.SignalSet or pd.DataFrame): Signals from `signals.build_signals` or DataFrame from
+      `add_ta_to_df`.
+
+    Returns:
+    - pd.DataFrame: One column of returns per strategy, 'B&H' first and then the indicator keys.
+    """
+    signal_set = sg.as_signal_set(signal_set)
+    return pd.DataFrame(
+        np.column_stack([signal_set.logreturns, signal_set.returns]),
+        index=signal_set.index,
+        columns=["B&H"] + signal_set.keys,
+    )
+
+
+def analyze(signal_set):
+    """
+    Calculates the statistics and the equity curves of Buy & Hold and of every indicator in one pass.
+
+    Parameters:
+    - signal_set (signals.SignalSet or pd.DataFrame): Signals from `signals.build_signals` or DataFrame from
+      `add_ta_to_df` with log returns ('logreturns'), signal columns ending with '_Signal' and the corresponding
+      return columns '<indicator>_returns'.
+
+    Returns:
+    - AnalysisResult: Statistics table, equity curves and drawdown episodes, used by the table, the equity and
+      underwater charts and the recommendation.
+    """
+    signal_set = sg.as_signal_set(signal_set)
+    returns_df = strategy_returns(signal_set)
+
+    statistics = performance.statistics_table(returns_df, 252)
+    equity_curves = performance.equity_curves(returns_df)
+    drawdowns = dd.drawdown_episodes(equity_curves)
+    statistics = statistics.join(drawdowns.summary)
+
+    # Trade statistics of the indicators
+    trades = {}
+    for i, indicator in enumerate(signal_set.keys):
+        col_signals = pd.Series(signal_set.signals[:, i], index=signal_set.index)
+        trades[indicator] = trade_statistics(
+            trade_ledger(col_signals, returns_df[indicator])
+        )
+        trades[indicator]["Current Recommendation"] = recommendation(col_signals)
+    if trades:
+        statistics = statistics.join(pd.DataFrame.from_dict(trades, orient="index"))
+
+    return AnalysisResult(
+        statistics=statistics,
+        equity_curves=equity_curves,
+        drawdowns=drawdowns,
+    )
+
+
 def do_ta_analysis(price_df):
     """
     Performs technical analysis (TA) on the given DataFrame containing signals and returns statistics of indicators.
@@ -773,36 +669,9 @@ def do_ta_analysis(price_df):
     - price_df (pd.DataFrame): DataFrame containing columns for signals and corresponding returns of indicators and B&H.
 
     Returns:
-    - pd.DataFrame: DataFrame with statistics calculated for Buy & Hold and each indicator.
-    """
-    signal_columns = [col for col in price_df.columns if col.endswith("_Signal")]
-
-    ta_statistics = pd.DataFrame()
-
-    # ADD B&H
-    statistics_bh = calculate_statistics_buyandhold(price_df["logreturns"], 252)
-    statistics_for_df_bh = {
-        key: value for key, value in statistics_bh.items() if key != "Equity Curve"
-    }
-    statistics_df_bh = pd.DataFrame(statistics_for_df_bh, index=[0])
-    statistics_df_bh.index = ["B&H"]
-    ta_statistics = pd.concat([ta_statistics, statistics_df_bh])
-
-    # ADD INDICATORS
-    for col_signals in signal_columns:
-        indicator = col_signals.split("_")[0]
-        col_returns = indicator + "_returns"
-        statistics = calculate_statistics(
-            price_df[col_returns], price_df[col_signals], 252
-        )
-        statistics_for_df = {
-            key: value for key, value in statistics.items() if key != "Equity Curve"
-        }
-        statistics_df = pd.DataFrame(statistics_for_df, index=[0])
-        statistics_df.index = [indicator]
-        ta_statistics = pd.concat([ta_statistics, statistics_df])
-
-    return ta_statistics
+    - pd.DataFrame: DataFrame with statistics calculated for Buy & Hold and each indicator (see `analyze`).
+    """
+    return analyze(price_df).statistics
 
 
 def apply_styles_df(ta_statistics):
@@ -830,6 +699,15 @@ def apply_styles_df(ta_statistics):
         lambda val: color_high_red(val, get_bh_value(val, ta_statistics)),
         subset=["St. Dev."],
     )
+    # Drawdown episodes (not in the tables without equity curves, e.g. the ensembles)
+    for column, color in [
+        ("Avg. Drawdown", color_high_green),
+        ("Longest Underwater", color_high_red),
+    ]:
+        if column in ta_statistics.columns:
+            ta_statistics_styled = ta_statistics_styled.applymap(
+                color, subset=[column], reference=ta_statistics.loc["B&H", column]
+            )
     ta_statistics_styled = ta_statistics_styled.format(c.styles_statistics_df)
     ta_statistics_styled = ta_statistics_styled.applymap(
         lambda x: color_recommendation(x), subset=["Current Recommendation"]
@@ -843,42 +721,12 @@ def extract_equity_curves(price_df):
     Calculates and extracts equity curves for Buy and Hold (B&H) and various indicators from a given DataFrame.
 
     Parameters:
-    - price_df (pd.DataFrame): DataFrame containing price data, log returns, indicator signals and their returns. The DataFrame must
-      have columns for log returns (e.g., 'logreturns') and signal columns ending with '_Signal' for different indicators.
-      Corresponding return columns should follow the naming convention '<indicator>_returns'.
+    - price_df (pd.DataFrame): DataFrame containing price data, log returns, indicator signals and their returns.
 
     Returns:
-    - pd.DataFrame: A DataFrame containing the equity curves for B&H and each indicator. The columns of the DataFrame
-      represent different strategies (B&H and indicators), and the rows represent the equity curve values over time.
-    """
-    signal_columns = [col for col in price_df.columns if col.endswith("_Signal")]
-
-    equity_curves = pd.DataFrame()
-
-    # ADD B&H
-    statistics_bh = calculate_statistics_buyandhold(price_df["logreturns"], 252)
-    statistics_for_df_bh = {
-        key: value for key, value in statistics_bh.items() if key == "Equity Curve"
-    }
-    statistics_df_bh = pd.DataFrame.from_dict(statistics_for_df_bh)
-    statistics_df_bh = statistics_df_bh.rename(columns={"Equity Curve": "B&H"})
-    equity_curves["B&H"] = statistics_df_bh["B&H"]
-
-    # ADD INDICATORS
-    for col_signals in signal_columns:
-        indicator = col_signals.split("_")[0]
-        col_returns = indicator + "_returns"
-        statistics = calculate_statistics(
-            price_df[col_returns], price_df[col_signals], 252
-        )
-        statistics_for_df = {
-            key: value for key, value in statistics.items() if key == "Equity Curve"
-        }
-        statistics_df = pd.DataFrame.from_dict(statistics_for_df)
-        statistics_df = statistics_df.rename(columns={"Equity Curve": indicator})
-        equity_curves[indicator] = statistics_df[indicator]
-
-    return equity_curves
+    - pd.DataFrame: A DataFrame containing the equity curves for B&H and each indicator (see `analyze`).
+    """
+    return analyze(price_df).equity_curves
 
 
 def plot_equity_curves(equity_df):
@@ -937,6 +785,109 @@ def plot_equity_curves(equity_df):
     st.plotly_chart(fig, config=dict(scrollZoom=True))
 
 
+def plot_rolling_statistics(rolling_df, metric, window):
+    """
+    Plots a rolling statistic of every strategy, under the equity curves.
+
+    Parameters:
+    - rolling_df (DataFrame): Values of the statistic with one column per strategy (see
+      `performance.rolling_curves`).
+    - metric (str): Name of the statistic (one of `performance.ROLLING_METRICS`).
+    - window (int): Number of bars of the window.
+
+    Returns:
+    None
+    """
+    fig = go.Figure()
+
+    for column in rolling_df.columns:
+        fig.add_trace(
+            go.Scatter(
+                x=rolling_df.index, y=rolling_df[column], mode="lines", name=column
+            )
+        )
+
+    fig.update_layout(
+        title=dict(
+            text=f"ROLLING {metric.upper()} ({window} BARS)",
+            x=0.5,
+            xanchor="center",
+            yanchor="top",
+            font=dict(size=25, family="serif", color="linen"),
+        ),
+        dragmode="pan",
+        uirevision="constant",
+        xaxis=dict(
+            showline=False,
+            linecolor="dimgrey",
+            gridcolor="black",
+            tickfont=dict(family="serif", size=12, color="linen"),
+        ),
+        yaxis=dict(
+            showline=False,
+            linecolor="dimgrey",
+            gridcolor="dimgrey",
+            tickformat=".2f" if metric == "Sharpe" else ".0%",
+            tickfont=dict(family="serif", size=12, color="linen"),
+        ),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    )
+
+    st.plotly_chart(fig, config=dict(scrollZoom=True))
+
+
+def plot_underwater(underwater_df):
+    """
+    Plots the underwater curve (drawdown from the running peak) of every strategy, under the equity curves.
+
+    Parameters:
+    - underwater_df (DataFrame): Underwater curves as columns (see `drawdowns.DrawdownResult`).
+
+    Returns:
+    None
+    """
+    fig = go.Figure()
+
+    for column in underwater_df.columns:
+        fig.add_trace(
+            go.Scatter(
+                x=underwater_df.index,
+                y=underwater_df[column],
+                mode="lines",
+                fill="tozeroy",
+                name=column,
+            )
+        )
+
+    fig.update_layout(
+        title=dict(
+            text="UNDERWATER CURVES",
+            x=0.5,
+            xanchor="center",
+            yanchor="top",
+            font=dict(size=25, family="serif", color="linen"),
+        ),
+        dragmode="pan",
+        uirevision="constant",
+        xaxis=dict(
+            showline=False,
+            linecolor="dimgrey",
+            gridcolor="black",
+            tickfont=dict(family="serif", size=12, color="linen"),
+        ),
+        yaxis=dict(
+            showline=False,
+            linecolor="dimgrey",
+            gridcolor="dimgrey",
+            tickformat=".0%",
+            tickfont=dict(family="serif", size=12, color="linen"),
+        ),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    )
+
+    st.plotly_chart(fig, config=dict(scrollZoom=True))
+
+
 def current_recommendation(ta_statistics):
     """
     Determines the current trade recommendation based on the selected indicators.
@@ -978,6 +929,200 @@ def current_recommendation(ta_statistics):
     )
 
 
+# -------------------------------------------------------
+# OPTIMIZER SECTION
+# -------------------------------------------------------
+
+
+def select_grid(indicator, num_bars):
+    """
+    Displays the inputs of the parameter ranges of an indicator for the optimizer.
+
+    Args:
+        indicator (str): Name of the indicator in registry.INDICATORS.
+        num_bars (int): Number of bars of the price data, used as the upper bound of the lengths.
+
+    Returns:
+        dict: Values tried for every parameter (a single value for the parameters that are not optimized).
+    """
+    ranges = {}
+    for name, widget in registry.INDICATORS[indicator]["parameters"].items():
+        if "grid" in widget:
+            start, stop, step = widget["grid"]
+            st.write(f"**{widget['label']}**")
+            col1, col2, col3 = st.columns(3)
+            max_value = num_bars if isinstance(start, int) else widget["max_value"]
+            kwargs = dict(min_value=widget["min_value"], max_value=max_value)
+            start = col1.number_input(
+                "From:", value=start, key=f"{name}_from", **kwargs
+            )
+            stop = col2.number_input("To:", value=stop, key=f"{name}_to", **kwargs)
+            min_step = 1 if isinstance(step, int) else widget["min_value"]
+            step = col3.number_input(
+                "Step:", value=step, min_value=min_step, key=f"{name}_step"
+            )
+            ranges[name] = optimizer.parameter_range(start, stop, step)
+        elif widget["widget"] == "selectbox":
+            ranges[name] = st.multiselect(
+                widget["label"], widget["options"], default=widget["options"][:1]
+            )
+        else:
+            ranges[name] = [getattr(st, widget["widget"])(widget["label"])]
+    return ranges
+
+
+def apply_styles_optimizer(results, hide_index=True):
+    """
+    Formats the results of the optimizer, of the walk-forward and of the universe like the statistics table.
+
+    Parameters:
+    - results (pd.DataFrame): Results of `optimizer.optimize` or tables of `walkforward.walk_forward` and
+      `universe.analyze_universe`.
+    - hide_index (bool): Whether to hide the index (the positions of the parameter sets).
+
+    Returns:
+    - Styler: Styled DataFrame using Pandas Styler functionality.
+
+    Notes:
+    - Columns such as 'Test Sharpe' or 'Median Sharpe' are formatted as the statistic they contain.
+    """
+    formats = {}
+    for column in results.columns:
+        statistic = column
+        for prefix in ("Train ", "Test ", "Median ", "Mean "):
+            statistic = statistic.removeprefix(prefix)
+        if statistic in c.styles_statistics_df:
+            formats[column] = c.styles_statistics_df[statistic]
+    styled = results.style.format(formats)
+    return styled.hide(axis="index") if hide_index else styled
+
+
+def plot_optimizer_results(results, x, y, metric):
+    """
+    Plots the optimizer metric as a heatmap over two parameters (or as a line over one).
+
+    Parameters:
+    - results (pd.DataFrame): Results of `optimizer.optimize`.
+    - x (str): Parameter on the horizontal axis.
+    - y (str or None): Parameter on the vertical axis, None for a line chart.
+    - metric (str): Statistic plotted.
+
+    Returns:
+    None
+
+    Notes:
+    - Every cell shows the best value of the metric over the other optimized parameters.
+    """
+    fig = go.Figure()
+
+    if y is None:
+        best = results.groupby(x)[metric].max()
+        fig.add_trace(go.Scatter(x=best.index, y=best.values, mode="lines+markers"))
+    else:
+        best = results.pivot_table(index=y, columns=x, values=metric, aggfunc="max")
+        fig.add_trace(
+            go.Heatmap(
+                x=best.columns,
+                y=best.index,
+                z=best.values,
+                colorscale="RdYlGn",
+                colorbar=dict(title=metric),
+            )
+        )
+
+    fig.update_layout(
+        title=dict(
+            text=f"{metric.upper()} BY PARAMETERS",
+            x=0.5,
+            xanchor="center",
+            yanchor="top",
+            font=dict(size=25, family="serif", color="linen"),
+        ),
+        xaxis=dict(
+            title=x,
+            tickfont=dict(family="serif", size=12, color="linen"),
+        ),
+        yaxis=dict(
+            title=y or metric,
+            tickfont=dict(family="serif", size=12, color="linen"),
+        ),
+    )
+
+    st.plotly_chart(fig)
+
+
+# -------------------------------------------------------
+# BOOTSTRAP SECTION
+# -------------------------------------------------------
+
+
+def apply_styles_bootstrap(intervals):
+    """
+    Formats the confidence intervals of `bootstrap.bootstrap`, every row as the statistic it contains.
+
+    Parameters:
+    - intervals (pd.DataFrame): Intervals with a (Strategy, Metric) index.
+
+    Returns:
+    - Styler: Styled DataFrame using Pandas Styler functionality.
+    """
+    styled = intervals.style
+    for metric in intervals.index.unique(level="Metric"):
+        rows = intervals.index[intervals.index.get_level_values("Metric") == metric]
+        styled = styled.format(
+            c.styles_statistics_df[metric], subset=pd.IndexSlice[rows, :]
+        )
+    return styled
+
+
+def plot_bootstrap_distributions(samples, strategies, metric):
+    """
+    Plots the distribution of a statistic over the bootstrap resamples of every strategy.
+
+    Parameters:
+    - samples (dict): `BootstrapResult.samples`.
+    - strategies (list): Names of the strategies (the columns of the samples).
+    - metric (str): Statistic plotted.
+
+    Returns:
+    None
+    """
+    fig = go.Figure()
+
+    for i, strategy in enumerate(strategies):
+        values = samples[metric][:, i]
+        fig.add_trace(
+            go.Histogram(
+                x=values[np.isfinite(values)],
+                name=strategy,
+                opacity=0.6,
+                histnorm="probability density",
+            )
+        )
+
+    fig.update_layout(
+        title=dict(
+            text=f"BOOTSTRAP DISTRIBUTION OF {metric.upper()}",
+            x=0.5,
+            xanchor="center",
+            yanchor="top",
+            font=dict(size=25, family="serif", color="linen"),
+        ),
+        barmode="overlay",
+        xaxis=dict(
+            title=metric,
+            tickfont=dict(family="serif", size=12, color="linen"),
+        ),
+        yaxis=dict(
+            gridcolor="dimgrey",
+            tickfont=dict(family="serif", size=12, color="linen"),
+        ),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    )
+
+    st.plotly_chart(fig)
+
+
 # -------------------------------------------------------
 # INFO SECTION
 # -------------------------------------------------------
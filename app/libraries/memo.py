@@ -0,0 +1,130 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# -------------------------------------------------------
+# INDICATOR MEMO
+# -------------------------------------------------------
+# Indicator values are stored per (data fingerprint, indicator, parameters),
+# so changing one parameter in the app only recomputes the indicator that
+# uses it. The memo is bounded both in entries and in bytes and evicts the
+# least recently used values first.
+
+
+def fingerprint(price_df):
+    """
+    Returns a hash identifying the price data the indicators are computed from.
+
+    Args:
+        price_df (pandas.DataFrame): Price data with 'High', 'Low' and 'Close' columns.
+
+    Returns:
+        str: Hex digest of the index and the High/Low/Close values.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    # Any index (dates, or e.g. numbers and strings from files without dates)
+    digest.update(
+        pd.util.hash_pandas_object(price_df.index, index=False).to_numpy().tobytes()
+    )
+    for column in ("High", "Low", "Close"):
+        digest.update(np.ascontiguousarray(price_df[column], dtype=np.float64).data)
+    return digest.hexdigest()
+
+
+def nbytes(value):
+    """
+    Returns the memory used by an array or a tuple of arrays.
+    """
+    if isinstance(value, tuple):
+        return sum(array.nbytes for array in value)
+    return value.nbytes
+
+
+def freeze(value):
+    """
+    Makes an array or a tuple of arrays read-only, so cached values cannot be modified by their users.
+    """
+    for array in value if isinstance(value, tuple) else (value,):
+        array.setflags(write=False)
+    return value
+
+
+class IndicatorCache:
+    """
+    Least recently used memo of indicator arrays with memory accounting.
+
+    Args:
+        max_entries (int): Maximum number of stored values.
+        max_bytes (int): Maximum total size of the stored arrays.
+
+    Notes:
+        - `hits`, `misses` and `evictions` count the lookups since the last `clear`, see `stats`.
+    """
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key, function, *args):
+        """
+        Returns the stored value for `key`, or computes it as function(*args) and stores it.
+
+        Args:
+            key (tuple): Hashable key, e.g. (fingerprint, indicator, parameters...).
+            function (callable): Function computing the value (an array or a tuple of arrays).
+            *args: Arguments of `function`.
+
+        Returns:
+            numpy.ndarray or tuple: Read-only value.
+        """
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+
+        value = freeze(function(*args))
+        size = nbytes(value)
+        if size > self.max_bytes:
+            return value
+
+        with self.lock:
+            if key not in self.entries:
+                self.entries[key] = value
+                self.nbytes += size
+            while len(self.entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _, old = self.entries.popitem(last=False)
+                self.nbytes -= nbytes(old)
+                self.evictions += 1
+        return value
+
+    def stats(self):
+        """
+        Returns the counters of the memo.
+
+        Returns:
+            dict: 'hits', 'misses', 'evictions', 'hit_rate', 'entries' and 'bytes'.
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self.entries),
+                "bytes": self.nbytes,
+            }
@@ -0,0 +1,134 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from libraries import engine, performance, registry, constants as c
+
+# -------------------------------------------------------
+# PARAMETER OPTIMIZER
+# -------------------------------------------------------
+# Evaluates whole grids of parameters of one indicator at once. The signals
+# and the returns are 2-D arrays (bars x parameter sets) built by the rules of
+# registry.py and the statistics are the column-wise reductions of
+# performance.py. The grid is processed in chunks of columns so the memory
+# stays bounded for long histories and large grids.
+
+
+# SUPPORT
+def parameter_range(start, stop, step):
+    """
+    Values from `start` to `stop` (both included) every `step`, as integers if all three are integers.
+    """
+    if all(isinstance(value, (int, np.integer)) for value in (start, stop, step)):
+        return list(range(start, stop + 1, step))
+    count = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return [round(start + i * step, 10) for i in range(count)]
+
+
+def parameter_grid(name, ranges, **fixed):
+    """
+    Builds the parameter sets of an indicator.
+
+    Args:
+        name (str): Name of the indicator in registry.INDICATORS.
+        ranges (dict): Values tried for each optimized parameter, e.g. {'ma_short': range(5, 201)}.
+        **fixed: Values of the other parameters (registry defaults otherwise).
+
+    Returns:
+        pandas.DataFrame: One row per valid combination (see the 'constraint' of the indicator), one column per parameter.
+    """
+    values = registry.default_values(name)
+    values.update(fixed)
+    columns = list(values)
+    grid = pd.DataFrame(
+        itertools.product(
+            *[list(ranges.get(column, [values[column]])) for column in columns]
+        ),
+        columns=columns,
+    )
+    constraint = registry.INDICATORS[name].get("constraint")
+    if constraint is not None and len(grid):
+        grid = grid[constraint(grid)]
+    return grid.reset_index(drop=True)
+
+
+def signal_matrix(price_df, name, grid):
+    """
+    Calculates the signals of an indicator for every set of parameters.
+
+    Args:
+        price_df (pandas.DataFrame): Price data of the ticker.
+        name (str): Name of the indicator in registry.INDICATORS.
+        grid (pandas.DataFrame): Parameter sets from `parameter_grid`.
+
+    Returns:
+        tuple: int8 signals (bars x parameter sets) and the warm-up length of every set (see registry.py).
+    """
+    close = price_df["Close"].to_numpy(dtype=float)[:, None]
+    outputs = engine.compute_indicator_grid(price_df, name, grid)
+    p = {column: grid[column].to_numpy() for column in grid}
+    return registry.INDICATORS[name]["rule"](close, outputs, p)
+
+
+def log_returns(price_df):
+    """
+    Log returns of the close (NaN for the first bar), as the 'logreturns' column of main.add_ta_to_df.
+    """
+    close = price_df["Close"].to_numpy(dtype=float)
+    logreturns = np.full(len(close), np.nan)
+    logreturns[1:] = np.log(close[1:] / close[:-1])
+    return logreturns
+
+
+def count_trades(signals):
+    """
+    Number of trades of every column of signals (runs of consecutive 1 or -1, as in main.trade_ledger).
+    """
+    in_position = np.abs(signals) == 1
+    starts = in_position[1:] & (signals[1:] != signals[:-1])
+    return in_position[0].astype(int) + starts.sum(axis=0)
+
+
+def recommendations(signals):
+    """
+    Current recommendation of every column of signals, as main.recommendation: 'BUY', 'SELL' or 'NEUTRAL'.
+    """
+    last = signals[-1]
+    return np.where(last == 1, "BUY", np.where(last == -1, "SELL", "NEUTRAL"))
+
+
+# MAIN
+def optimize(price_df, name, grid, periods=252, metric="Sharpe"):
+    """
+    Evaluates every set of parameters of an indicator and ranks them.
+
+    Args:
+        price_df (pandas.DataFrame): Price data of the ticker.
+        name (str): Name of the indicator in registry.INDICATORS.
+        grid (pandas.DataFrame): Parameter sets from `parameter_grid`.
+        periods (int): Number of periods per year.
+        metric (str): Statistic used to rank the parameter sets (highest first).
+
+    Returns:
+        pandas.DataFrame: The parameters, the statistics of performance.returns_statistics and 'Num. Trades'
+            of every set, sorted by `metric`.
+    """
+    logreturns = log_returns(price_df)
+
+    chunk_size = max(1, c.optimizer_chunk_bytes // (8 * max(1, len(logreturns))))
+    chunks = []
+    for start in range(0, len(grid), chunk_size):
+        chunk = grid.iloc[start : start + chunk_size]
+        signals, length = signal_matrix(price_df, name, chunk)
+        returns = registry.masked_returns(signals, length, logreturns)
+        stats = performance.returns_statistics(returns, periods)
+        stats["Num. Trades"] = count_trades(signals)
+        chunks.append(pd.DataFrame(stats, index=chunk.index))
+
+    if not chunks:
+        return grid
+    results = grid.join(pd.concat(chunks))
+    return results.sort_values(
+        metric, ascending=False, na_position="last", kind="stable"
+    )
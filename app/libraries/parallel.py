@@ -0,0 +1,325 @@
+import atexit
+import multiprocessing
+import os
+import sys
+import threading
+import types
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from libraries import optimizer, constants as c
+
+# -------------------------------------------------------
+# PARALLEL EXECUTION
+# -------------------------------------------------------
+# Shards CPU-bound work (parameter sweeps) across a pool of worker processes. The price data is written once into a shared
+# memory block and the workers map it, so only the block name and the small
+# task arguments are pickled. The pool is kept alive between runs and every
+# worker keeps the last price blocks it attached. Pending shards are
+# cancelled when a run is cancelled or interrupted (e.g. by a Streamlit
+# rerun), the shards already running finish.
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+_ATTACHED = OrderedDict()  # In the workers: block name -> (shared memory, price data)
+
+
+# SUPPORT (SHARED MEMORY)
+class SharedPriceData:
+    """
+    Copy of the numeric columns and the index of a price DataFrame in a shared memory block.
+
+    Args:
+        price_df (pandas.DataFrame): Price data.
+
+    Notes:
+        - Use as a context manager; the block is released on exit.
+        - `descriptor` is the small picklable description the workers attach to (see `attach`).
+        - A DatetimeIndex is shared as int64 values (in its unit); other indexes are pickled with the descriptor.
+    """
+
+    def __init__(self, price_df):
+        columns = list(price_df.select_dtypes("number").columns)
+        n = len(price_df)
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=max(1, 8 * n * (len(columns) + 1))
+        )
+        try:
+            index, values = layout(self.shm, n, len(columns))
+            values[:] = price_df[columns].to_numpy(dtype=np.float64).T
+            self.descriptor = {
+                "name": self.shm.name,
+                "bars": n,
+                "columns": columns,
+                "index": None,
+                "tz": None,
+                "unit": None,
+                "index_name": price_df.index.name,
+            }
+            if isinstance(price_df.index, pd.DatetimeIndex):
+                index[:] = price_df.index.asi8
+                self.descriptor["unit"] = price_df.index.unit
+                if price_df.index.tz is not None:
+                    self.descriptor["tz"] = str(price_df.index.tz)
+            else:
+                self.descriptor["index"] = price_df.index
+        except BaseException:
+            # The views of the failed copy may still map the block, it is unmapped when collected
+            self.shm.unlink()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def release(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+def layout(shm, bars, num_columns):
+    """
+    Views of a shared price block: the int64 index and the float64 values (one row per column).
+    """
+    index = np.ndarray((bars,), dtype=np.int64, buffer=shm.buf)
+    values = np.ndarray(
+        (num_columns, bars), dtype=np.float64, buffer=shm.buf, offset=8 * bars
+    )
+    return index, values
+
+
+def attach(descriptor):
+    """
+    Returns the price data of a shared block as a read-only DataFrame (without copying the values).
+
+    Args:
+        descriptor (dict): `SharedPriceData.descriptor`.
+
+    Returns:
+        pandas.DataFrame: Price data with the same index and numeric columns as the original.
+
+    Notes:
+        - Used in the workers, which keep the last `c.parallel_attached_blocks` blocks mapped.
+    """
+    name = descriptor["name"]
+    if name in _ATTACHED:
+        _ATTACHED.move_to_end(name)
+        return _ATTACHED[name][1]
+
+    shm = shared_memory.SharedMemory(name=name)
+    index, values = layout(shm, descriptor["bars"], len(descriptor["columns"]))
+    values.setflags(write=False)
+    if descriptor["index"] is not None:
+        price_index = descriptor["index"]
+    else:
+        price_index = pd.DatetimeIndex(
+            index.copy().view(f"M8[{descriptor['unit']}]"),
+            name=descriptor["index_name"],
+        )
+        if descriptor["tz"] is not None:
+            price_index = price_index.tz_localize("UTC").tz_convert(descriptor["tz"])
+    price_df = pd.DataFrame(
+        values.T, index=price_index, columns=descriptor["columns"], copy=False
+    )
+    _ATTACHED[name] = (shm, price_df)
+
+    while len(_ATTACHED) > c.parallel_attached_blocks:
+        _, (old_shm, old_df) = _ATTACHED.popitem(last=False)
+        del old_df
+        try:
+            old_shm.close()
+        except BufferError:
+            # Still referenced by a result in use, released with the process
+            pass
+    return price_df
+
+
+# SUPPORT (WORKERS)
+def optimize_shard(descriptor, name, grid, periods, metric):
+    """
+    Task of the workers: `optimizer.optimize` on a shard of the parameter grid.
+    """
+    return optimizer.optimize(attach(descriptor), name, grid, periods, metric)
+
+
+def get_executor():
+    """
+    Returns the process pool, started on first use with `c.parallel_workers` processes.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ProcessPoolExecutor(
+                max_workers=c.parallel_workers,
+                mp_context=multiprocessing.get_context(c.parallel_start_method),
+            )
+            start_workers(_EXECUTOR)
+        return _EXECUTOR
+
+
+def start_workers(executor):
+    """
+    Starts all the processes of the pool.
+
+    Notes:
+        - Streamlit runs the app script as the '__main__' module, which spawned processes import again.
+          The workers are therefore started at once with a placeholder '__main__' module.
+    """
+    main_module = sys.modules["__main__"]
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        wait([executor.submit(os.getpid) for _ in range(c.parallel_workers)])
+    finally:
+        sys.modules["__main__"] = main_module
+
+
+@atexit.register
+def shutdown():
+    """
+    Stops the process pool (cancelling the pending tasks).
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown(wait=True, cancel_futures=True)
+            _EXECUTOR = None
+
+
+def run_tasks(tasks, progress=None, cancel=None):
+    """
+    Runs tasks in the process pool.
+
+    Args:
+        tasks (list): (function, args) pairs; the functions must be importable module-level functions.
+        progress (callable, optional): Called as progress(done, total) after every finished task.
+        cancel (threading.Event, optional): When set, the tasks that have not started are cancelled.
+
+    Returns:
+        list: Result of every task in order, None for the cancelled tasks.
+
+    Notes:
+        - Pending tasks are also cancelled if the caller is interrupted by an exception.
+    """
+    executor = get_executor()
+    futures = {
+        executor.submit(function, *args): i for i, (function, args) in enumerate(tasks)
+    }
+    results = [None] * len(tasks)
+    try:
+        for done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future]] = future.result()
+            if progress is not None:
+                progress(done, len(tasks))
+            if cancel is not None and cancel.is_set():
+                break
+    finally:
+        for future in futures:
+            future.cancel()
+    return results
+
+
+class BackgroundRun:
+    """
+    Runs a function with `progress` and `cancel` arguments (e.g. `optimize`) in a thread of the app process.
+
+    The page polls `done` and `total` while `running`, and a STOP button calls `stop` (Streamlit runs widget
+    callbacks in the next script run, while the thread keeps going).
+
+    Args:
+        function (callable): Function to run.
+        *args, **kwargs: Arguments of the function.
+
+    Attributes:
+        result: Return value of the function (partial results if stopped).
+        error (Exception): Exception raised by the function, if any.
+    """
+
+    def __init__(self, function, *args, **kwargs):
+        self.cancel = threading.Event()
+        self.done, self.total = 0, 1
+        self.result = None
+        self.error = None
+        self.thread = threading.Thread(
+            target=self.run, args=(function, args, kwargs), daemon=True
+        )
+        self.thread.start()
+
+    def run(self, function, args, kwargs):
+        try:
+            self.result = function(
+                *args, progress=self.update, cancel=self.cancel, **kwargs
+            )
+        except Exception as error:
+            self.error = error
+
+    def update(self, done, total):
+        self.done, self.total = done, total
+
+    def stop(self):
+        self.cancel.set()
+
+    @property
+    def running(self):
+        return self.thread.is_alive()
+
+
+# MAIN
+def optimize(
+    price_df,
+    name,
+    grid,
+    periods=252,
+    metric="Sharpe",
+    progress=None,
+    cancel=None,
+):
+    """
+    Parallel version of `optimizer.optimize`: the parameter grid is split in shards evaluated by the workers.
+
+    Args:
+        price_df (pandas.DataFrame): Price data of the ticker.
+        name (str): Name of the indicator in registry.INDICATORS.
+        grid (pandas.DataFrame): Parameter sets from `optimizer.parameter_grid`.
+        periods (int): Number of periods per year.
+        metric (str): Statistic used to rank the parameter sets (highest first).
+        progress (callable, optional): Called as progress(done, total) with the number of evaluated shards.
+        cancel (threading.Event, optional): Stops the run, only the shards already evaluated are returned.
+
+    Returns:
+        pandas.DataFrame: Results of the evaluated parameter sets sorted by `metric` (see `optimizer.optimize`).
+
+    Notes:
+        - Small grids (less than `c.parallel_min_sets` sets) and single worker setups run in this process.
+    """
+    if c.parallel_workers <= 1 or len(grid) < c.parallel_min_sets:
+        results = optimizer.optimize(price_df, name, grid, periods, metric)
+        if progress is not None:
+            progress(1, 1)
+        return results
+
+    num_shards = min(len(grid), c.parallel_workers * c.parallel_shards_per_worker)
+    shards = np.array_split(np.arange(len(grid)), num_shards)
+    with SharedPriceData(price_df) as shared:
+        tasks = [
+            (
+                optimize_shard,
+                (shared.descriptor, name, grid.iloc[shard], periods, metric),
+            )
+            for shard in shards
+        ]
+        results = run_tasks(tasks, progress, cancel)
+
+    results = [result for result in results if result is not None]
+    if not results:
+        return grid.iloc[:0]
+    # Shards in grid order, so the ties are ranked as in `optimizer.optimize`
+    results = pd.concat(results).sort_index()
+    return results.sort_values(
+        metric, ascending=False, na_position="last", kind="stable"
+    )
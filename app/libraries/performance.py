@@ -0,0 +1,232 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from libraries import kernels as k
+
+# -------------------------------------------------------
+# STRATEGY PERFORMANCE
+# -------------------------------------------------------
+# Statistics of many strategies at once. The returns of all strategies are
+# held as one 2-D array (one column per strategy) and every statistic is a
+# column-wise reduction, so 5 or 5,000 strategies cost one vectorized call.
+# NaN returns (warm-up periods) are skipped as in the pandas reductions.
+
+INITIAL_INVESTMENT = 10000
+
+
+# SUPPORT
+def as_returns_matrix(returns):
+    """
+    Converts a Series, DataFrame or array of returns to a 2-D float64 array (one column per strategy).
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    return returns.reshape(len(returns), -1)
+
+
+def cumulative_growth(returns):
+    """
+    Growth of one unit invested in every strategy, (1 + r).cumprod() column-wise.
+
+    Args:
+        returns (numpy.ndarray): Returns, one column per strategy.
+
+    Returns:
+        numpy.ndarray: Cumulative growth, NaN where the return is NaN (NaN returns do not change the growth).
+    """
+    missing = np.isnan(returns)
+    growth = np.cumprod(np.where(missing, 1.0, 1.0 + returns), axis=0)
+    growth[missing] = np.nan
+    return growth
+
+
+def column_std(returns, valid, periods):
+    """
+    Annualized sample standard deviation (ddof=1) of the valid returns of every column.
+
+    Args:
+        returns (numpy.ndarray): Returns, one column per strategy.
+        valid (numpy.ndarray): Boolean mask of the returns taken into account.
+        periods (int): Number of periods per year.
+
+    Returns:
+        numpy.ndarray: One value per column, NaN with less than two valid returns.
+    """
+    count = valid.sum(axis=0)
+    mean = np.where(valid, returns, 0.0).sum(axis=0) / count
+    deviations = np.where(valid, returns - mean, 0.0)
+    variance = np.einsum("ij,ij->j", deviations, deviations) / (count - 1)
+    return np.where(count > 1, np.sqrt(variance * periods), np.nan)
+
+
+def max_drawdown(growth):
+    """
+    Largest relative decline from a previous peak of every column of cumulative growth (NaN are skipped).
+    """
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return np.nanmin(growth / np.fmax.accumulate(growth, axis=0) - 1, axis=0)
+
+
+# MAIN
+def returns_statistics(returns, periods):
+    """
+    Calculates the return and risk statistics of every strategy with column-wise reductions.
+
+    Args:
+        returns (array-like): Returns, 2-D with one column per strategy (or 1-D for a single strategy).
+        periods (int): Number of periods per year (e.g., 252 trading days).
+
+    Returns:
+        dict: Arrays with one value per strategy:
+            - 'Total Return': Total cumulative return.
+            - 'Ann. Mean Return': Annualized mean return.
+            - 'St. Dev.': Annualized standard deviation of returns.
+            - 'Sharpe': Annualized mean return divided by standard deviation.
+            - 'Sortino': Annualized mean return divided by the downside deviation.
+            - 'Max Drawdown': Largest relative decline of the cumulative growth.
+    """
+    returns = as_returns_matrix(returns)
+    growth = cumulative_growth(returns)
+    valid = ~np.isnan(returns)
+
+    # Strategies without enough valid returns get NaN statistics
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        mean = np.where(valid, returns, 0.0).sum(axis=0) / valid.sum(axis=0)
+        stats = {}
+        stats["Total Return"] = growth[-1] - 1
+        stats["Ann. Mean Return"] = (1 + mean) ** periods - 1
+        stats["St. Dev."] = column_std(returns, valid, periods)
+        stats["Sharpe"] = stats["Ann. Mean Return"] / stats["St. Dev."]
+        downside_deviation = column_std(returns, valid & (returns < 0), periods)
+        stats["Sortino"] = stats["Ann. Mean Return"] / downside_deviation
+        stats["Max Drawdown"] = max_drawdown(growth)
+    return stats
+
+
+def statistics_table(returns_df, periods):
+    """
+    Calculates the statistics of every column of a DataFrame of strategy returns.
+
+    Args:
+        returns_df (pandas.DataFrame): Returns with one column per strategy.
+        periods (int): Number of periods per year.
+
+    Returns:
+        pandas.DataFrame: One row per strategy and one column per statistic (see `returns_statistics`).
+    """
+    return pd.DataFrame(
+        returns_statistics(returns_df, periods), index=returns_df.columns
+    )
+
+
+def equity_curves(returns_df):
+    """
+    Calculates the equity curve of every column of a DataFrame of strategy returns (10,000$ base).
+
+    Args:
+        returns_df (pandas.DataFrame): Returns with one column per strategy.
+
+    Returns:
+        pandas.DataFrame: Equity curves with the index and columns of `returns_df`.
+    """
+    return pd.DataFrame(
+        INITIAL_INVESTMENT * cumulative_growth(as_returns_matrix(returns_df)),
+        index=returns_df.index,
+        columns=returns_df.columns,
+    )
+
+
+# -------------------------------------------------------
+# ROLLING STATISTICS
+# -------------------------------------------------------
+# Statistics over a window of bars sliding along the returns, for every bar
+# and every strategy. The sums over the windows (count, returns, squares,
+# winning bars) are differences of cumulative sums and the peak of the equity
+# over the window is the O(n) rolling maximum of kernels.py, so the cost is
+# linear in the number of bars whatever the length of the window.
+
+ROLLING_METRICS = ["Sharpe", "Volatility", "Drawdown", "Win Rate"]
+
+
+# SUPPORT
+def window_sums(values, window):
+    """
+    Column-wise sums of the `window` bars ending at every bar (NaN for the first `window` - 1 bars).
+    """
+    sums = np.cumsum(values, axis=0)
+    out = np.full(values.shape, np.nan)
+    if window <= len(values):
+        out[window - 1] = sums[window - 1]
+        out[window:] = sums[window:] - sums[:-window]
+    return out
+
+
+# MAIN
+def rolling_statistics(returns, window, periods):
+    """
+    Calculates rolling statistics of every strategy over the `window` bars ending at every bar.
+
+    Args:
+        returns (array-like): Returns, 2-D with one column per strategy (or 1-D for a single strategy).
+        window (int): Number of bars of the window (at least 2).
+        periods (int): Number of periods per year.
+
+    Returns:
+        dict: Arrays of bars x strategies for every metric of `ROLLING_METRICS`:
+            - 'Sharpe': Annualized mean return divided by the annualized standard deviation of the window.
+            - 'Volatility': Annualized standard deviation of the returns of the window.
+            - 'Drawdown': Decline of the equity from its peak over the window.
+            - 'Win Rate': Share of the bars of the window with a position (non-zero return) that gained.
+
+    Notes:
+        - The values are NaN until the window holds `window` valid returns (as pandas rolling(window)), so
+          the warm-up periods of the strategies are followed by `window` - 1 more NaN.
+    """
+    returns = as_returns_matrix(returns)
+    valid = ~np.isnan(returns)
+    full = window_sums(valid.astype(np.float64), window) == window
+
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        # Centering the returns keeps the rounding error of the cumulative sums small
+        offset = np.nan_to_num(np.nanmean(returns, axis=0))
+        centered = np.where(valid, returns - offset, 0.0)
+        sums = window_sums(centered, window)
+        squares = window_sums(centered**2, window)
+        variance = np.maximum(squares - sums**2 / window, 0.0) / (window - 1)
+        volatility = np.where(full, np.sqrt(variance * periods), np.nan)
+        mean = (1 + sums / window + offset) ** periods - 1
+
+        wins = window_sums((returns > 0).astype(np.float64), window)
+        positions = window_sums((valid & (returns != 0)).astype(np.float64), window)
+
+        growth = cumulative_growth(returns)
+        peak = k.rolling_extreme(growth, window, np.fmax)
+
+        return {
+            "Sharpe": mean / volatility,
+            "Volatility": volatility,
+            "Drawdown": np.where(full, growth / peak - 1, np.nan),
+            "Win Rate": np.where(full & (positions > 0), wins / positions, np.nan),
+        }
+
+
+def rolling_curves(returns_df, window, periods):
+    """
+    Calculates the rolling statistics of every column of a DataFrame of strategy returns.
+
+    Args:
+        returns_df (pandas.DataFrame): Returns with one column per strategy.
+        window (int): Number of bars of the window (at least 2).
+        periods (int): Number of periods per year.
+
+    Returns:
+        dict: DataFrames with the index and columns of `returns_df` for every metric (see `rolling_statistics`).
+    """
+    return {
+        metric: pd.DataFrame(values, index=returns_df.index, columns=returns_df.columns)
+        for metric, values in rolling_statistics(returns_df, window, periods).items()
+    }
@@ -0,0 +1,453 @@
+import numpy as np
+
+from libraries import kernels as k
+
+# -------------------------------------------------------
+# INDICATOR REGISTRY
+# -------------------------------------------------------
+# Every indicator declares here its parameters (with the widget used to set
+# them in web.py), the series it outputs and its signal rule. The outputs are
+# nodes of a computation graph: a node is a tuple (operation, *arguments),
+# where the arguments are either other nodes or parameter values, and
+# ('Close',), ('High',), ... are the price columns. Equal nodes are computed
+# once, e.g. the EMAs of MACD and of the EMA moving averages, and since the
+# nodes are memoized by their full definition (engine.py), changing a
+# parameter only recomputes the nodes that depend on it.
+
+CLOSE = ("Close",)
+HIGH = ("High",)
+LOW = ("Low",)
+
+OPERATIONS = {
+    "sma": k.sma,
+    "ema": k.ema,
+    "rma": k.rma,
+    "rsi": k.rsi,
+    "subtract": np.subtract,
+    "rolling_max": k.rolling_max,
+    "rolling_min": k.rolling_min,
+    "true_range": k.true_range,
+    "directional_movement": k.directional_movement,
+    "directional_index": k.directional_index,
+    "directional_movement_index": k.directional_movement_index,
+}
+
+
+# SUPPORT
+# The signal rules work on 2-D arrays with one column per parameter set (one
+# column for the app, many for the optimizer), the parameters being arrays
+# with one value per column. A rule returns int8 signals (1, -1 or 0) and the
+# length of the warm-up period of every column, the bars before it having no
+# signal yet (see `valid_bars`); the returns of the signals are then one
+# masked multiply (`masked_returns`).
+def shift(signal, fill):
+    """
+    Shifts the signals one bar forward (a signal known at the close is the position of the next bar).
+
+    Args:
+        signal (numpy.ndarray): Signals, one column per parameter set.
+        fill (int): Value of the first bar.
+
+    Returns:
+        numpy.ndarray: int8 signals shifted by one bar.
+    """
+    shifted = np.empty(signal.shape, dtype=np.int8)
+    shifted[:1] = fill
+    shifted[1:] = signal[:-1]
+    return shifted
+
+
+def warm_up(signal, length):
+    """
+    Sets the signals of the warm-up period to 0 (the indicator is not available yet) and pairs them with its length.
+
+    Args:
+        signal (numpy.ndarray): int8 signals, one column per parameter set.
+        length (numpy.ndarray): Number of bars of the warm-up period of every column.
+
+    Returns:
+        tuple: The signals and the warm-up length of every column (int64, at least 1 as the first bar has no
+            return).
+    """
+    length = np.maximum(np.asarray(length, dtype=np.int64), 1)
+    length = np.broadcast_to(length, signal.shape[1:]).copy()
+    signal[~valid_bars(len(signal), length)] = 0
+    return signal, length
+
+
+def valid_bars(num_bars, length):
+    """
+    Boolean mask (bars x columns) of the bars after the warm-up periods.
+    """
+    return np.arange(num_bars)[:, None] >= length
+
+
+def to_float(signal, length):
+    """
+    Float signals with NaN during the warm-up periods (the representation of the analysis DataFrames).
+    """
+    return np.where(valid_bars(len(signal), length), signal, np.nan)
+
+
+def masked_returns(signal, length, logreturns):
+    """
+    Returns of the positions: signals times log returns, NaN during the warm-up periods.
+
+    Args:
+        signal (numpy.ndarray): int8 signals, bars x columns.
+        length (numpy.ndarray): Warm-up length of every column.
+        logreturns (numpy.ndarray): Log returns, 1-D or with one column per column of `signal`.
+
+    Returns:
+        numpy.ndarray: float64 returns, bars x columns.
+    """
+    if logreturns.ndim == 1:
+        logreturns = logreturns[:, None]
+    return np.where(valid_bars(len(signal), length), signal * logreturns, np.nan)
+
+
+def binary_signal(condition):
+    """
+    Converts a condition known at the close of a bar to the position of the next bar (1 if True, -1 otherwise).
+    """
+    return shift(np.where(condition, 1, -1), -1)
+
+
+def ternary_signal(buy, sell):
+    """
+    Converts buy and sell conditions known at the close of a bar to the position of the next bar (1, -1 or 0).
+    """
+    return shift(np.where(buy, 1, np.where(sell, -1, 0)), 0)
+
+
+# MOVING AVERAGE
+def moving_average_outputs(p):
+    average = "ema" if p["ema_checkbox"] else "sma"
+    return {
+        "Moving_Average_short": (average, CLOSE, p["ma_short"]),
+        "Moving_Average_long": (average, CLOSE, p["ma_long"]),
+    }
+
+
+def moving_average_warm_up(p):
+    return p["ma_long"]
+
+
+def moving_average_rule(close, outputs, p):
+    short, long = outputs
+    return warm_up(binary_signal(short >= long), moving_average_warm_up(p))
+
+
+# RSI
+def rsi_outputs(p):
+    return {f"RSI_{p['rsi_length']}": ("rsi", CLOSE, p["rsi_length"])}
+
+
+def rsi_warm_up(p):
+    return p["rsi_length"] + 1
+
+
+def rsi_rule(close, outputs, p):
+    (rsi,) = outputs
+    lower_threshold, upper_threshold = np.array(
+        [thresholds.split("/") for thresholds in p["rsi_thresholds"]], dtype=float
+    ).T
+    signal = ternary_signal(rsi < lower_threshold, rsi > upper_threshold)
+    return warm_up(signal, rsi_warm_up(p))
+
+
+# MACD
+def macd_outputs(p):
+    # As in pandas_ta, the lengths are swapped if the slow one is shorter
+    fast, slow = sorted((p["macd_fast"], p["macd_slow"]))
+    line = ("subtract", ("ema", CLOSE, fast), ("ema", CLOSE, slow))
+    signal_line = ("ema", line, p["macd_signal"], slow - 1)
+    suffix = f"{p['macd_fast']}_{p['macd_slow']}_{p['macd_signal']}"
+    return {
+        f"MACD_{suffix}": line,
+        f"MACDh_{suffix}": ("subtract", line, signal_line),
+        f"MACDs_{suffix}": signal_line,
+    }
+
+
+def macd_warm_up(p):
+    return p["macd_slow"] + p["macd_signal"] - 1
+
+
+def macd_rule(close, outputs, p):
+    _, histogram, _ = outputs
+    signal = ternary_signal(histogram > 0, histogram < 0)
+    return warm_up(signal, macd_warm_up(p))
+
+
+# DMI
+def dmi_outputs(p):
+    length = p["dmi_length"]
+    atr = ("rma", ("true_range", HIGH, LOW, CLOSE), length)
+    di_plus = (
+        "directional_index",
+        ("rma", ("directional_movement", HIGH, LOW, 1), length),
+        atr,
+    )
+    di_minus = (
+        "directional_index",
+        ("rma", ("directional_movement", HIGH, LOW, -1), length),
+        atr,
+    )
+    dx = ("directional_movement_index", di_plus, di_minus)
+    return {
+        f"ADX_{p['adx_smoothing']}": ("rma", dx, p["adx_smoothing"]),
+        f"DMP_{length}": di_plus,
+        f"DMN_{length}": di_minus,
+    }
+
+
+def dmi_warm_up(p):
+    return p["dmi_length"] + 1
+
+
+def dmi_rule(close, outputs, p):
+    _, di_plus, di_minus = outputs
+    return warm_up(binary_signal(di_plus >= di_minus), dmi_warm_up(p))
+
+
+# TRADING RANGE BREAKOUT
+def trb_outputs(p):
+    return {
+        "Max": ("rolling_max", CLOSE, p["trb_length"]),
+        "Min": ("rolling_min", CLOSE, p["trb_length"]),
+    }
+
+
+def trb_warm_up(p):
+    return p["trb_length"]
+
+
+def trb_rule(close, outputs, p):
+    maximum, minimum = outputs
+    breakout = k.breakout_signal(close, maximum, minimum, p["trb_width"])
+    signal, length = warm_up(shift(breakout, 0), trb_warm_up(p))
+    # Holding period after the signal (no position opens at the end of the warm-up)
+    held = k.hold_signals(to_float(signal, length), p["trb_num_periods_to_hold"])
+    return np.nan_to_num(held).astype(np.int8), length
+
+
+# MAIN
+# Keys of a parameter: 'widget' (streamlit input function), 'label', 'grid'
+# (default (start, stop, step) range of the optimizer, numeric parameters only)
+# and the keyword arguments of the widget. Callable arguments are evaluated
+# with the number of bars and the values of the parameters set before.
+# 'rule' maps the outputs (in declaration order) to the signals and their
+# warm-up lengths, 'warm_up' gives the length of the warm-up period from the
+# parameters (used by the rule and by streaming.py), and the optional 'constraint' filters the parameter sets of
+# the optimizer.
+INDICATORS = {
+    "Moving Average": {
+        "key": "MA",
+        "title": "MOVING AVERAGE",
+        "parameters": {
+            "ma_short": {
+                "widget": "number_input",
+                "label": "Length of short moving average:",
+                "min_value": 1,
+                "max_value": lambda n, p: n - 1,
+                "value": 20,
+                "grid": (5, 100, 5),
+            },
+            "ma_long": {
+                "widget": "number_input",
+                "label": "Length of long moving average:",
+                "min_value": 2,
+                "max_value": lambda n, p: n,
+                "value": 50,
+                "grid": (20, 200, 10),
+            },
+            "ema_checkbox": {
+                "widget": "checkbox",
+                "label": "Use exponential moving average.",
+            },
+        },
+        "outputs": moving_average_outputs,
+        "rule": moving_average_rule,
+        "warm_up": moving_average_warm_up,
+        "constraint": lambda grid: grid["ma_short"] < grid["ma_long"],
+    },
+    "Relative Strength Index (RSI)": {
+        "key": "RSI",
+        "title": "RSI",
+        "parameters": {
+            "rsi_length": {
+                "widget": "number_input",
+                "label": "Length of indicator:",
+                "min_value": 1,
+                "max_value": lambda n, p: n,
+                "value": 14,
+                "grid": (5, 30, 1),
+            },
+            "rsi_thresholds": {
+                "widget": "selectbox",
+                "label": "Thresholds values:",
+                "options": ["30/70", "40/60", "25/75", "20/80", "15/85", "10/90"],
+            },
+            "rsi_checkbox": {
+                "widget": "checkbox",
+                "label": "Add simple moving average.",
+            },
+        },
+        "outputs": rsi_outputs,
+        "rule": rsi_rule,
+        "warm_up": rsi_warm_up,
+    },
+    "Moving Average Converge Divergence (MACD)": {
+        "key": "MACD",
+        "title": "MACD",
+        "parameters": {
+            "macd_fast": {
+                "widget": "number_input",
+                "label": "Length of fast moving average:",
+                "min_value": 1,
+                "max_value": lambda n, p: n - 1,
+                "value": 12,
+                "grid": (4, 20, 2),
+            },
+            "macd_slow": {
+                "widget": "number_input",
+                "label": "Length of slow moving average:",
+                "min_value": 2,
+                "max_value": lambda n, p: n,
+                "value": 26,
+                "grid": (20, 40, 2),
+            },
+            "macd_signal": {
+                "widget": "number_input",
+                "label": "Length of signal moving average:",
+                "min_value": 1,
+                "max_value": lambda n, p: n - p["macd_slow"] + 1,
+                "value": 9,
+                "grid": (5, 15, 2),
+            },
+        },
+        "outputs": macd_outputs,
+        "rule": macd_rule,
+        "warm_up": macd_warm_up,
+        "constraint": lambda grid: grid["macd_fast"] < grid["macd_slow"],
+    },
+    "Directional Movement Index (DMI)": {
+        "key": "DMI",
+        "title": "DMI",
+        "parameters": {
+            "dmi_length": {
+                "widget": "number_input",
+                "label": "Length of indicator:",
+                "min_value": 1,
+                "max_value": lambda n, p: n - 1,
+                "value": 14,
+                "grid": (5, 30, 1),
+            },
+            "adx_smoothing": {
+                "widget": "number_input",
+                "label": "ADX smoothing:",
+                "min_value": 1,
+                "max_value": lambda n, p: n - p["dmi_length"],
+                "value": 14,
+                "grid": (5, 30, 5),
+            },
+        },
+        "outputs": dmi_outputs,
+        "rule": dmi_rule,
+        "warm_up": dmi_warm_up,
+    },
+    "Trading Range Breakout": {
+        "key": "TRB",
+        "title": "TRADING RANGE BREAKOUT",
+        "parameters": {
+            "trb_length": {
+                "widget": "number_input",
+                "label": "Length of indicator:",
+                "min_value": 1,
+                "max_value": lambda n, p: n,
+                "value": 20,
+                "grid": (10, 100, 5),
+            },
+            "trb_width": {
+                "widget": "number_input",
+                "label": "Width of channel:",
+                "min_value": 0.000001,
+                "max_value": 10.0,
+                "value": 0.1,
+                "grid": (0.02, 0.2, 0.02),
+            },
+            "trb_num_periods_to_hold": {
+                "widget": "number_input",
+                "label": "Number of periods to hold a position:",
+                "min_value": 1,
+                "max_value": 10000,
+                "value": 20,
+                "grid": (5, 50, 5),
+            },
+        },
+        "outputs": trb_outputs,
+        "rule": trb_rule,
+        "warm_up": trb_warm_up,
+    },
+}
+
+
+def selected(selected_indicators):
+    """
+    Returns the registry entries of the selected indicators in registry order.
+
+    Args:
+        selected_indicators (list): Names of the selected indicators.
+
+    Returns:
+        list: (name, entry) pairs.
+    """
+    return [
+        (name, entry)
+        for name, entry in INDICATORS.items()
+        if name in selected_indicators
+    ]
+
+
+def default_parameters():
+    """
+    Returns a dict with every parameter of the registry set to None (the value for unselected indicators).
+    """
+    return {
+        parameter: None
+        for entry in INDICATORS.values()
+        for parameter in entry["parameters"]
+    }
+
+
+def default_values(name):
+    """
+    Returns the default value of every parameter of an indicator (the initial value of its widget).
+    """
+    return {
+        parameter: widget.get("value", widget.get("options", [False])[0])
+        for parameter, widget in INDICATORS[name]["parameters"].items()
+    }
+
+
+def signal(entry, close, indicators_df, parameters):
+    """
+    Calculates the signals of an indicator for one set of parameters.
+
+    Args:
+        entry (dict): Registry entry of the indicator.
+        close (numpy.ndarray): Close prices.
+        indicators_df (pandas.DataFrame): Indicator values with the output columns of the indicator.
+        parameters (dict): Parameters of the indicator by name.
+
+    Returns:
+        tuple: int8 signals (1, -1 or 0) of every bar and the length of the warm-up period.
+    """
+    outputs = [
+        indicators_df[column].to_numpy(dtype=float)[:, None]
+        for column in entry["outputs"](parameters)
+    ]
+    p = {name: np.array([value]) for name, value in parameters.items()}
+    signals, length = entry["rule"](close[:, None], outputs, p)
+    return signals[:, 0], int(length[0])
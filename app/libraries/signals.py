@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from libraries import engine, registry
+
+# -------------------------------------------------------
+# SIGNAL SETS
+# -------------------------------------------------------
+# Output of the signal stage of the analysis as arrays: the log returns of the
+# close, the int8 signals of the selected indicators (bars x strategies) with
+# their warm-up lengths and the returns of the strategies, the columns keyed
+# by the indicator keys. The indicator values stay in the DataFrame of
+# engine.compute_indicators, so nothing is inserted column by column into the
+# price data and the statistics do not look up columns by name. `to_frame`
+# builds the DataFrame of main.add_ta_to_df in one concatenation when the
+# columns are needed.
+
+
+@dataclass
+class SignalSet:
+    """
+    Signals and returns of the selected indicators, computed by `build_signals`.
+
+    Attributes:
+        index (pandas.Index): Dates of the bars.
+        logreturns (numpy.ndarray): Log returns of the close (NaN for the first bar), the returns of B&H.
+        keys (list): Indicator keys (e.g. 'MA'), one per column of `signals` and `returns`.
+        signals (numpy.ndarray): int8 signals (1, -1 or 0), bars x strategies.
+        warm_up (numpy.ndarray): Length of the warm-up period of every strategy (its signals are 0).
+        returns (numpy.ndarray): Log returns of the strategies, bars x strategies (NaN during the warm-up).
+        indicators (pandas.DataFrame): Indicator values from `engine.compute_indicators`.
+    """
+
+    index: pd.Index
+    logreturns: np.ndarray
+    keys: list
+    signals: np.ndarray
+    warm_up: np.ndarray
+    returns: np.ndarray
+    indicators: pd.DataFrame
+
+
+# MAIN
+def build_signals(price_df, selected_indicators, indicators_df=None, **parameters):
+    """
+    Calculates the signals and returns of the selected indicators.
+
+    Args:
+        price_df (pandas.DataFrame): Price data of the ticker (not modified).
+        selected_indicators (list): Names of the selected indicators (see registry.INDICATORS).
+        indicators_df (pandas.DataFrame, optional): Indicator values from `engine.compute_indicators`.
+            Computed here if not given.
+        **parameters: Parameters of the selected indicators by name (see `main.add_ta_to_df`).
+
+    Returns:
+        SignalSet: Signals and returns of the indicators, in the order of registry.INDICATORS.
+    """
+    if indicators_df is None:
+        indicators_df = engine.compute_indicators(
+            price_df, selected_indicators, **parameters
+        )
+    close = price_df["Close"].to_numpy(dtype=float)
+    logreturns = np.empty(len(close))
+    logreturns[:1] = np.nan
+    logreturns[1:] = np.log(close[1:] / close[:-1])
+
+    keys, columns, lengths = [], [], []
+    for _, entry in registry.selected(selected_indicators):
+        signal, length = registry.signal(entry, close, indicators_df, parameters)
+        keys.append(entry["key"])
+        columns.append(signal)
+        lengths.append(length)
+
+    signals = np.empty((len(close), len(keys)), dtype=np.int8)
+    for i, signal in enumerate(columns):
+        signals[:, i] = signal
+    warm_up = np.array(lengths, dtype=np.int64)
+    return SignalSet(
+        index=price_df.index,
+        logreturns=logreturns,
+        keys=keys,
+        signals=signals,
+        warm_up=warm_up,
+        returns=registry.masked_returns(signals, warm_up, logreturns),
+        indicators=indicators_df,
+    )
+
+
+def to_frame(signal_set, price_df):
+    """
+    DataFrame of `main.add_ta_to_df`: price data, indicator values, 'logreturns' and the '<key>_Signal' and
+    '<key>_returns' columns of every indicator, with the warm-up lengths in `attrs['warm_up']`.
+    """
+    columns = {"logreturns": signal_set.logreturns}
+    for i, key in enumerate(signal_set.keys):
+        columns[f"{key}_Signal"] = signal_set.signals[:, i]
+        columns[f"{key}_returns"] = signal_set.returns[:, i]
+    ta_df = pd.concat(
+        [
+            price_df,
+            signal_set.indicators,
+            pd.DataFrame(columns, index=signal_set.index),
+        ],
+        axis=1,
+    )
+    ta_df.attrs["warm_up"] = dict(zip(signal_set.keys, signal_set.warm_up.tolist()))
+    return ta_df
+
+
+def from_frame(ta_df):
+    """
+    SignalSet of a DataFrame from `main.add_ta_to_df` (for callers that still pass the DataFrame). Its
+    `indicators` are the columns of the DataFrame other than the signals and returns.
+    """
+    keys = [col[: -len("_Signal")] for col in ta_df.columns if col.endswith("_Signal")]
+    signals = ta_df[[f"{key}_Signal" for key in keys]].to_numpy(dtype=np.int8)
+    return SignalSet(
+        index=ta_df.index,
+        logreturns=ta_df["logreturns"].to_numpy(dtype=float),
+        keys=keys,
+        signals=signals,
+        warm_up=np.array([ta_df.attrs["warm_up"][key] for key in keys], dtype=np.int64),
+        returns=ta_df[[f"{key}_returns" for key in keys]].to_numpy(dtype=float),
+        indicators=ta_df.drop(
+            columns=[
+                col for col in ta_df.columns if col.endswith(("_Signal", "_returns"))
+            ]
+        ),
+    )
+
+
+def as_signal_set(signals):
+    """
+    Returns the SignalSet of a DataFrame of `main.add_ta_to_df`, or `signals` if it is already a SignalSet.
+    """
+    return from_frame(signals) if isinstance(signals, pd.DataFrame) else signals
@@ -0,0 +1,481 @@
+import math
+from collections import deque
+
+import pandas as pd
+
+from libraries import registry
+
+# -------------------------------------------------------
+# STREAMING INDICATORS
+# -------------------------------------------------------
+# Stateful counterparts of the kernels in kernels.py. Every state object takes
+# one new value per bar and returns the updated indicator value in constant
+# time, so refreshing the analysis after new bars costs O(new bars) instead of
+# O(history). The values follow the same formulas (and warm-up NaN) as the
+# batch kernels.
+
+
+# SUPPORT
+def ratio(numerator, denominator):
+    """
+    Returns numerator / denominator, or NaN if the denominator is zero or NaN.
+    """
+    if denominator == 0 or math.isnan(denominator):
+        return math.nan
+    return numerator / denominator
+
+
+class SMAState:
+    """
+    Simple moving average over the last `length` values (kernels.sma).
+
+    Args:
+        length (int): Length of the window.
+    """
+
+    def __init__(self, length):
+        self.length = length
+        self.window = deque()
+        self.total = 0.0
+        self.missing = 0
+
+    def update(self, value):
+        self.window.append(value)
+        if math.isnan(value):
+            self.missing += 1
+        else:
+            self.total += value
+        if len(self.window) > self.length:
+            old = self.window.popleft()
+            if math.isnan(old):
+                self.missing -= 1
+            else:
+                self.total -= old
+        if len(self.window) < self.length or self.missing:
+            return math.nan
+        return self.total / self.length
+
+
+class EMAState:
+    """
+    Exponential moving average seeded with the simple average of the first `length` values (kernels.ema).
+
+    Args:
+        length (int): Length of the average.
+
+    Notes:
+        - Leading NaN values are skipped, the average starts at the first valid value.
+    """
+
+    def __init__(self, length):
+        self.length = length
+        self.alpha = 2 / (length + 1)
+        self.count = 0
+        self.value = 0.0
+
+    def update(self, value):
+        if self.count == 0 and math.isnan(value):
+            return math.nan
+        self.count += 1
+        if self.count < self.length:
+            self.value += value
+            return math.nan
+        if self.count == self.length:
+            self.value = (self.value + value) / self.length
+        else:
+            self.value = self.alpha * value + (1 - self.alpha) * self.value
+        return self.value
+
+
+class RMAState:
+    """
+    Wilder's moving average (kernels.rma), NaN until `length` valid values were seen.
+
+    Args:
+        length (int): Length of the average.
+    """
+
+    def __init__(self, length):
+        self.length = length
+        self.decay = 1 - 1 / length
+        self.count = 0
+        self.numerator = 0.0
+        self.denominator = 0.0
+
+    def update(self, value):
+        self.numerator *= self.decay
+        self.denominator *= self.decay
+        if not math.isnan(value):
+            self.count += 1
+            self.numerator += value
+            self.denominator += 1
+        if self.count < self.length:
+            return math.nan
+        return self.numerator / self.denominator
+
+
+class RollingExtremeState:
+    """
+    Rolling maximum or minimum over the last `length` values using a monotonic deque.
+
+    Args:
+        length (int): Length of the window.
+        maximum (bool): True for the rolling maximum, False for the minimum.
+
+    Notes:
+        - Every value enters and leaves the deque once, so the update is O(1) amortised.
+    """
+
+    def __init__(self, length, maximum=True):
+        self.length = length
+        self.sign = 1 if maximum else -1
+        self.window = deque()
+        self.count = 0
+
+    def update(self, value):
+        key = self.sign * value
+        while self.window and self.window[-1][1] <= key:
+            self.window.pop()
+        self.window.append((self.count, key))
+        if self.window[0][0] <= self.count - self.length:
+            self.window.popleft()
+        self.count += 1
+        if self.count < self.length:
+            return math.nan
+        return self.sign * self.window[0][1]
+
+
+class RSIState:
+    """
+    Relative Strength Index with Wilder's smoothing (kernels.rsi).
+
+    Args:
+        length (int): Length of the indicator.
+    """
+
+    def __init__(self, length):
+        self.length = length
+        self.decay = 1 - 1 / length
+        self.count = 0
+        self.previous = math.nan
+        self.gains = 0.0
+        self.losses = 0.0
+
+    def update(self, close):
+        change = 0.0 if self.count == 0 else close - self.previous
+        self.previous = close
+        self.count += 1
+        self.gains = self.decay * self.gains + max(change, 0.0)
+        self.losses = self.decay * self.losses + max(-change, 0.0)
+        if self.count <= self.length:
+            return math.nan
+        return 100 * ratio(self.gains, self.gains + self.losses)
+
+
+class MACDState:
+    """
+    Moving Average Convergence Divergence (kernels.macd).
+
+    Args:
+        fast (int): Length of the fast EMA.
+        slow (int): Length of the slow EMA.
+        signal (int): Length of the EMA of the MACD line.
+    """
+
+    def __init__(self, fast, slow, signal):
+        if slow < fast:
+            fast, slow = slow, fast
+        self.fast = EMAState(fast)
+        self.slow = EMAState(slow)
+        self.signal = EMAState(signal)
+
+    def update(self, close):
+        """
+        Returns:
+            tuple: MACD line, signal line and histogram.
+        """
+        line = self.fast.update(close) - self.slow.update(close)
+        signal_line = self.signal.update(line)
+        return line, signal_line, line - signal_line
+
+
+class DMIState:
+    """
+    Directional Movement Index and Average Directional Index (kernels.dmi).
+
+    Args:
+        length (int): Length of DI+ and DI-.
+        adx_smoothing (int): Length of the ADX smoothing.
+
+    Notes:
+        - pandas_ta adds machine epsilon to all ranges if any bar of the whole history has High == Low. A stream
+          cannot look ahead, so that adjustment is left out (the difference is of the order of 1e-16).
+    """
+
+    def __init__(self, length, adx_smoothing):
+        self.atr = RMAState(length)
+        self.plus = RMAState(length)
+        self.minus = RMAState(length)
+        self.adx = RMAState(adx_smoothing)
+        self.previous = None
+
+    def update(self, high, low, close):
+        """
+        Returns:
+            tuple: ADX, DI+ and DI-.
+        """
+        if self.previous is None:
+            true_range = plus = minus = math.nan
+        else:
+            prev_high, prev_low, prev_close = self.previous
+            true_range = max(high - low, abs(high - prev_close), abs(prev_close - low))
+            up = high - prev_high
+            down = prev_low - low
+            plus = up if up > down and up > 0 else 0.0
+            minus = down if down > up and down > 0 else 0.0
+        self.previous = (high, low, close)
+
+        k = ratio(100, self.atr.update(true_range))
+        di_plus = k * self.plus.update(plus)
+        di_minus = k * self.minus.update(minus)
+        dx = 100 * ratio(abs(di_plus - di_minus), di_plus + di_minus)
+        return self.adx.update(dx), di_plus, di_minus
+
+
+# INDICATOR STATES
+# Streaming counterparts of the entries of registry.INDICATORS, by key (see
+# STREAM_STATES). `update` returns the outputs of a bar in the order of the
+# registry 'outputs', and `rule` the signal of the next bar from the outputs
+# and the close of the bar, as the registry 'rule' does for whole arrays. The
+# output names and the warm-up lengths are read from the registry entries.
+class IndicatorState:
+    """
+    Base of the streaming indicators.
+
+    Args:
+        p (dict): Parameters of the indicator by name.
+        warm_up (int): Number of bars without a signal (the registry 'warm_up' of the indicator, at least 1).
+    """
+
+    def __init__(self, p, warm_up):
+        self.warm_up = warm_up
+
+    def update(self, high, low, close):
+        raise NotImplementedError
+
+    def rule(self, close, outputs):
+        raise NotImplementedError
+
+    def signal(self, count, close, outputs):
+        """
+        Signal of bar `count` from the close and the outputs of the previous bar (NaN during the warm-up).
+        """
+        if count < self.warm_up:
+            return math.nan
+        return self.rule(close, outputs)
+
+
+class MovingAverageState(IndicatorState):
+    def __init__(self, p, warm_up):
+        super().__init__(p, warm_up)
+        average = EMAState if p["ema_checkbox"] else SMAState
+        self.short = average(p["ma_short"])
+        self.long = average(p["ma_long"])
+
+    def update(self, high, low, close):
+        return self.short.update(close), self.long.update(close)
+
+    def rule(self, close, outputs):
+        short, long = outputs
+        return 1 if short >= long else -1
+
+
+class RSIStreamState(IndicatorState):
+    def __init__(self, p, warm_up):
+        super().__init__(p, warm_up)
+        self.rsi = RSIState(p["rsi_length"])
+        self.lower, self.upper = map(int, p["rsi_thresholds"].split("/"))
+
+    def update(self, high, low, close):
+        return (self.rsi.update(close),)
+
+    def rule(self, close, outputs):
+        (rsi,) = outputs
+        return -1 if rsi > self.upper else (1 if rsi < self.lower else 0)
+
+
+class MACDStreamState(IndicatorState):
+    def __init__(self, p, warm_up):
+        super().__init__(p, warm_up)
+        self.macd = MACDState(p["macd_fast"], p["macd_slow"], p["macd_signal"])
+
+    def update(self, high, low, close):
+        line, signal_line, histogram = self.macd.update(close)
+        return line, histogram, signal_line
+
+    def rule(self, close, outputs):
+        _, histogram, _ = outputs
+        return -1 if histogram < 0 else (1 if histogram > 0 else 0)
+
+
+class DMIStreamState(IndicatorState):
+    def __init__(self, p, warm_up):
+        super().__init__(p, warm_up)
+        self.dmi = DMIState(p["dmi_length"], p["adx_smoothing"])
+
+    def update(self, high, low, close):
+        return self.dmi.update(high, low, close)
+
+    def rule(self, close, outputs):
+        _, di_plus, di_minus = outputs
+        return 1 if di_plus >= di_minus else -1
+
+
+class TRBState(IndicatorState):
+    """
+    Trading Range Breakout with its holding period (kernels.breakout_signal and kernels.hold_signal).
+    """
+
+    def __init__(self, p, warm_up):
+        super().__init__(p, warm_up)
+        self.maximum = RollingExtremeState(p["trb_length"], maximum=True)
+        self.minimum = RollingExtremeState(p["trb_length"], maximum=False)
+        self.width = p["trb_width"]
+        self.hold = p["trb_num_periods_to_hold"]
+        # Outputs of the last two bars
+        self.last = self.before = (math.nan, math.nan)
+        self.previous_signal = math.nan
+        self.hold_value = 0
+        self.hold_remaining = 0
+
+    def update(self, high, low, close):
+        self.before = self.last
+        self.last = (self.maximum.update(close), self.minimum.update(close))
+        return self.last
+
+    def rule(self, close, outputs):
+        maximum, minimum = outputs
+        previous_maximum, previous_minimum = self.before
+        condition = maximum < minimum * (1 + self.width)
+        if condition and close > previous_maximum:
+            return 1
+        if condition and close < previous_minimum:
+            return -1
+        return 0
+
+    def signal(self, count, close, outputs):
+        """
+        Applies the holding period to the breakout signal of the current bar.
+        """
+        signal = super().signal(count, close, outputs)
+        if self.hold_remaining > 0:
+            if signal == -self.hold_value:
+                self.hold_remaining = 0
+            else:
+                signal = self.hold_value
+                self.hold_remaining -= 1
+        if self.previous_signal == 0 and signal in (-1, 1):
+            self.hold_value = signal
+            self.hold_remaining = self.hold - 1
+        self.previous_signal = signal
+        return signal
+
+
+STREAM_STATES = {
+    "MA": MovingAverageState,
+    "RSI": RSIStreamState,
+    "MACD": MACDStreamState,
+    "DMI": DMIStreamState,
+    "TRB": TRBState,
+}
+
+
+# MAIN
+class IndicatorStream:
+    """
+    Incremental version of `engine.compute_indicators` + `main.add_ta_to_df` for the selected indicators.
+
+    Every call of `update` consumes one bar and returns the row `add_ta_to_df` would produce for it
+    (indicator values, log return, signals and strategy returns), in constant time per bar.
+
+    Args:
+        selected_indicators (list): List of selected technical indicators.
+        **parameters: Parameters of the selected indicators by name (see registry.INDICATORS).
+
+    Raises:
+        ValueError: If a selected indicator has no state in `STREAM_STATES`.
+
+    Notes:
+        - As in `add_ta_to_df`, the signal of a bar is derived from the indicators of the previous bar.
+    """
+
+    def __init__(self, selected_indicators, **parameters):
+        self.selected_indicators = selected_indicators
+        self.count = 0
+        self.close = math.nan
+        self.states = {}
+        self.columns = {}
+        self.previous = {}
+
+        for name, entry in registry.selected(selected_indicators):
+            key = entry["key"]
+            if key not in STREAM_STATES:
+                raise ValueError(f"The indicator '{name}' has no streaming state.")
+            self.states[key] = STREAM_STATES[key](
+                parameters, max(1, entry["warm_up"](parameters))
+            )
+            self.columns[key] = list(entry["outputs"](parameters))
+            self.previous[key] = (math.nan,) * len(self.columns[key])
+
+    def update(self, high, low, close):
+        """
+        Consumes one bar.
+
+        Args:
+            high (float): High price of the bar.
+            low (float): Low price of the bar.
+            close (float): Close price of the bar.
+
+        Returns:
+            dict: Row of `main.add_ta_to_df` for the bar without the price columns: indicator values,
+                'logreturns', '<indicator>_Signal' and '<indicator>_returns'.
+        """
+        signals = {
+            key: state.signal(self.count, self.close, self.previous[key])
+            for key, state in self.states.items()
+        }
+        row = {}
+        for key, state in self.states.items():
+            self.previous[key] = state.update(high, low, close)
+            row.update(zip(self.columns[key], self.previous[key]))
+
+        log_return = math.log(close / self.close) if self.count else math.nan
+        row["logreturns"] = log_return
+        for key, signal in signals.items():
+            # No position during the warm-up period (NaN return, signal 0 as in the int8 signal columns)
+            row[f"{key}_Signal"] = 0 if math.isnan(signal) else signal
+            row[f"{key}_returns"] = signal * log_return
+
+        self.close = close
+        self.count += 1
+        return row
+
+    def update_many(self, price_df):
+        """
+        Consumes all bars of a DataFrame (e.g., the new bars since the last refresh).
+
+        Args:
+            price_df (pandas.DataFrame): Price data with 'High', 'Low' and 'Close' columns.
+
+        Returns:
+            pandas.DataFrame: One row per bar as returned by `update`, indexed as `price_df`.
+        """
+        rows = [
+            self.update(high, low, close)
+            for high, low, close in zip(
+                price_df["High"].to_numpy(float),
+                price_df["Low"].to_numpy(float),
+                price_df["Close"].to_numpy(float),
+            )
+        ]
+        return pd.DataFrame(rows, index=price_df.index)
@@ -0,0 +1,181 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from libraries import engine, memo, optimizer, performance, registry, constants as c
+
+# -------------------------------------------------------
+# UNIVERSE BACKTESTING
+# -------------------------------------------------------
+# Runs the same strategies over many tickers at once. The price histories are
+# aligned on their common dates into a panel with one column per ticker, and
+# since the kernels and the signal rules work column-wise, every indicator is
+# computed for all tickers in one vectorized pass. The returns of every
+# (ticker, strategy) pair then go through the batched statistics of
+# performance.py in a single call.
+
+PRICE_FIELDS = ["Open", "High", "Low", "Close"]
+
+
+@dataclass
+class UniverseResult:
+    """
+    Results of `analyze_universe`.
+
+    Attributes:
+        statistics (pandas.DataFrame): One row per (ticker, strategy) pair ('B&H' and the indicator keys).
+        rankings (pandas.DataFrame): One row per strategy with its statistics aggregated over the tickers.
+        excluded (list): Tickers left out of the panel (too short histories).
+    """
+
+    statistics: pd.DataFrame
+    rankings: pd.DataFrame
+    excluded: list
+
+
+# SUPPORT
+def price_panel(price_dfs):
+    """
+    Aligns the price histories of many tickers on their common dates.
+
+    Args:
+        price_dfs (dict): Price data of every ticker by ticker.
+
+    Returns:
+        tuple: Panel (pandas.DataFrame with (field, ticker) columns for the Open, High, Low and Close prices) and
+            the list of the tickers left out because their history is shorter than `c.universe_min_coverage`
+            times the longest one.
+
+    Notes:
+        - The panel is a valid input of `engine.evaluate`: panel['Close'] is a bars x tickers DataFrame.
+    """
+    longest = max((len(price_df) for price_df in price_dfs.values()), default=0)
+    included = {
+        ticker: price_df
+        for ticker, price_df in price_dfs.items()
+        if len(price_df) >= c.universe_min_coverage * longest
+    }
+    excluded = [ticker for ticker in price_dfs if ticker not in included]
+    if not included:
+        return pd.DataFrame(), excluded
+
+    panel = pd.concat(
+        {
+            field: pd.concat(
+                {ticker: df[field] for ticker, df in included.items()},
+                axis=1,
+                join="inner",
+            )
+            for field in PRICE_FIELDS
+        },
+        axis=1,
+    )
+    return panel.dropna(), excluded
+
+
+def panel_key(panel):
+    """
+    Fingerprint of a panel for the indicator memo, distinct from the fingerprint of single-ticker price data
+    (the values of a panel are 2-D).
+    """
+    return "panel:" + memo.fingerprint(panel)
+
+
+def signal_panel(panel, name, parameters, data_key=None, values=None):
+    """
+    Calculates the signals of an indicator for every ticker of a panel.
+
+    Args:
+        panel (pandas.DataFrame): Panel from `price_panel`.
+        name (str): Name of the indicator in registry.INDICATORS.
+        parameters (dict): Parameters of the indicator by name.
+        data_key (str, optional): `panel_key` of the panel.
+        values (dict, optional): Nodes already evaluated for the panel (shared between indicators).
+
+    Returns:
+        tuple: int8 signals (bars x tickers) and the warm-up length of every ticker (see registry.py).
+    """
+    data_key = data_key or panel_key(panel)
+    values = {} if values is None else values
+    entry = registry.INDICATORS[name]
+    outputs = [
+        engine.evaluate(node, panel, data_key, values)
+        for node in entry["outputs"](parameters).values()
+    ]
+    num_tickers = panel["Close"].shape[1]
+    p = {key: np.full(num_tickers, value) for key, value in parameters.items()}
+    return entry["rule"](panel["Close"].to_numpy(dtype=float), outputs, p)
+
+
+# MAIN
+def analyze_universe(
+    panel, selected_indicators, periods=252, excluded=(), **parameters
+):
+    """
+    Calculates the statistics of Buy & Hold and of every selected indicator for every ticker of a panel.
+
+    Args:
+        panel (pandas.DataFrame): Panel from `price_panel`.
+        selected_indicators (list): List of selected technical indicators.
+        periods (int): Number of periods per year.
+        excluded (list): Tickers left out of the panel, reported in the result.
+        **parameters: Parameters of the selected indicators by name (see registry.INDICATORS).
+
+    Returns:
+        UniverseResult: Per-ticker statistics and the rankings of the strategies.
+
+    Notes:
+        - The statistics of a ticker are those of `main.analyze(main.add_ta_to_df(...))` on its bars of the panel,
+          with the number of trades and the current recommendation of every indicator.
+    """
+    close = panel["Close"].to_numpy(dtype=float)
+    tickers = list(panel["Close"].columns)
+    logreturns = np.full(close.shape, np.nan)
+    logreturns[1:] = np.log(close[1:] / close[:-1])
+
+    data_key = panel_key(panel)
+    values = {}
+    strategies = {"B&H": logreturns}
+    signals = {}
+    for name, entry in registry.selected(selected_indicators):
+        signal, length = signal_panel(panel, name, parameters, data_key, values)
+        signals[entry["key"]] = signal
+        strategies[entry["key"]] = registry.masked_returns(signal, length, logreturns)
+
+    # One column per (ticker, strategy) pair
+    returns = np.concatenate(list(strategies.values()), axis=1)
+    index = pd.MultiIndex.from_product(
+        [list(strategies), tickers], names=["Strategy", "Ticker"]
+    )
+    statistics = pd.DataFrame(
+        performance.returns_statistics(returns, periods), index=index
+    )
+    if signals:
+        stacked = np.concatenate(list(signals.values()), axis=1)
+        trades = pd.DataFrame(
+            {
+                "Num. Trades": optimizer.count_trades(stacked),
+                "Current Recommendation": optimizer.recommendations(stacked),
+            },
+            index=index[len(tickers) :],
+        )
+        statistics = statistics.join(trades)
+    statistics = statistics.swaplevel().sort_index(level="Ticker", sort_remaining=False)
+
+    # Strategies ranked by their median Sharpe ratio over the tickers
+    by_strategy = statistics.groupby(level="Strategy", sort=False)
+    buy_and_hold = statistics.xs("B&H", level="Strategy")["Total Return"]
+    beats = statistics["Total Return"].sub(buy_and_hold, level="Ticker") > 0
+    rankings = pd.DataFrame(
+        {
+            "Median Sharpe": by_strategy["Sharpe"].median(),
+            "Mean Total Return": by_strategy["Total Return"].mean(),
+            "Median Max Drawdown": by_strategy["Max Drawdown"].median(),
+            "Pct. Tickers Beating B&H": beats.groupby(level="Strategy").mean(),
+        }
+    ).sort_values("Median Sharpe", ascending=False)
+
+    return UniverseResult(
+        statistics=statistics, rankings=rankings, excluded=list(excluded)
+    )
@@ -0,0 +1,294 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from libraries import optimizer, performance, registry, constants as c
+
+# -------------------------------------------------------
+# WALK-FORWARD OPTIMIZATION
+# -------------------------------------------------------
+# Every fold chooses the best parameter set of a grid on a train window and
+# scores it on the following test window, so the statistics are out of sample.
+# The signals of the grid are computed once over the whole history (an
+# indicator at a bar only depends on the bars before it) and every fold reads
+# its windows from them. The ranking metrics of all windows come from prefix
+# sums of the returns, so overlapping train windows share the work.
+
+RANKING_METRICS = [
+    "Sharpe",
+    "Sortino",
+    "Total Return",
+    "Ann. Mean Return",
+    "Max Drawdown",
+]
+
+
+@dataclass
+class WalkForwardResult:
+    """
+    Results of `walk_forward`.
+
+    Attributes:
+        folds (pandas.DataFrame): One row per fold with its windows, the chosen parameters, their train
+            metric and their test statistics.
+        statistics (pandas.DataFrame): Statistics over the test windows of the walk-forward strategy, of B&H
+            and of the best parameters of the whole history ('In-Sample Best', chosen with hindsight).
+        equity_curves (pandas.DataFrame): Equity curves of the same strategies over the test windows.
+    """
+
+    folds: pd.DataFrame
+    statistics: pd.DataFrame
+    equity_curves: pd.DataFrame
+
+
+# SUPPORT
+def fold_windows(num_bars, num_folds, train_bars, anchored=False):
+    """
+    Splits the bars after the first train window in `num_folds` consecutive test windows.
+
+    Args:
+        num_bars (int): Number of bars of the price data.
+        num_folds (int): Number of folds.
+        train_bars (int): Length of the (first) train window.
+        anchored (bool): Train windows start at the first bar (growing) instead of rolling with the test windows.
+
+    Returns:
+        list: (train_start, test_start, test_stop) bar positions of every fold; a train window ends where its
+            test window starts and the last test window ends with the data.
+    """
+    test_bars = (num_bars - train_bars) // num_folds
+    if train_bars < 2 or test_bars < 1:
+        raise ValueError("Not enough bars for the train and test windows.")
+    windows = []
+    for fold in range(num_folds):
+        test_start = train_bars + fold * test_bars
+        test_stop = num_bars if fold == num_folds - 1 else test_start + test_bars
+        train_start = 0 if anchored else test_start - train_bars
+        windows.append((train_start, test_start, test_stop))
+    return windows
+
+
+# Prefix sums needed by every ranking metric of `window_metric`
+METRIC_SUMS = {
+    "Sharpe": ["count", "sum", "squares"],
+    "Sortino": ["count", "sum", "negative_count", "negative_sum", "negative_squares"],
+    "Total Return": ["count", "log_growth"],
+    "Ann. Mean Return": ["count", "sum"],
+    "Max Drawdown": [],
+}
+
+
+def prefix_sums(returns, metric):
+    """
+    Cumulative sums along the bars (with a leading row of zeros) used by `window_metric`.
+
+    Args:
+        returns (numpy.ndarray): Returns, bars x strategies (NaN returns are skipped).
+        metric (str): Ranking metric, only the sums it needs are calculated.
+
+    Returns:
+        dict: Prefix sums of the count, sum and sum of squares of the valid and of the negative returns,
+            and of log(1 + r).
+    """
+    valid = ~np.isnan(returns)
+    values = np.where(valid, returns, 0.0)
+    arrays = {
+        "count": lambda: valid,
+        "sum": lambda: values,
+        "squares": lambda: values**2,
+        "negative_count": lambda: values < 0,
+        "negative_sum": lambda: np.minimum(values, 0.0),
+        "negative_squares": lambda: np.minimum(values, 0.0) ** 2,
+        "log_growth": lambda: np.log1p(values),
+    }
+    sums = {}
+    for key in METRIC_SUMS[metric]:
+        total = np.zeros((len(returns) + 1,) + returns.shape[1:])
+        np.cumsum(arrays[key](), axis=0, out=total[1:])
+        sums[key] = total
+    return sums
+
+
+def window_std(count, total, squares, periods):
+    """
+    Annualized sample standard deviation from the count, sum and sum of squares of the returns.
+    """
+    variance = (squares - total**2 / count) / (count - 1)
+    return np.sqrt(np.maximum(variance, 0.0) * periods)
+
+
+def window_metric(returns, sums, start, stop, periods, metric):
+    """
+    Calculates a statistic of `performance.returns_statistics` over the bars start..stop-1 of every column.
+
+    Args:
+        returns (numpy.ndarray): Returns, bars x strategies.
+        sums (dict): `prefix_sums` of `returns`.
+        start (int): First bar of the window.
+        stop (int): Bar after the window.
+        periods (int): Number of periods per year.
+        metric (str): One of `RANKING_METRICS`.
+
+    Returns:
+        numpy.ndarray: Value of the statistic for every column (NaN without enough valid returns).
+
+    Notes:
+        - 'Total Return' is the growth over the valid returns of the window.
+    """
+    if metric == "Max Drawdown":
+        return performance.max_drawdown(
+            performance.cumulative_growth(returns[start:stop])
+        )
+    window = {key: total[stop] - total[start] for key, total in sums.items()}
+    return sums_metric(window, periods, metric)
+
+
+def sums_metric(window, periods, metric):
+    """
+    Calculates a statistic from the sums of `prefix_sums` over some returns (all metrics but 'Max Drawdown').
+
+    Args:
+        window (dict): Sums of the returns by key of `METRIC_SUMS`, arrays of any shape.
+        periods (int): Number of periods per year.
+        metric (str): One of `RANKING_METRICS`.
+
+    Returns:
+        numpy.ndarray: Value of the statistic (NaN without enough valid returns).
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if metric == "Total Return":
+            return np.where(window["count"] > 0, np.expm1(window["log_growth"]), np.nan)
+        mean_return = (1 + window["sum"] / window["count"]) ** periods - 1
+        if metric == "Ann. Mean Return":
+            return mean_return
+        if metric == "Sharpe":
+            return mean_return / window_std(
+                window["count"], window["sum"], window["squares"], periods
+            )
+        return mean_return / window_std(
+            window["negative_count"],
+            window["negative_sum"],
+            window["negative_squares"],
+            periods,
+        )
+
+
+def best_parameters(price_df, name, grid, windows, periods, metric):
+    """
+    Chooses the best parameter set of every train window.
+
+    Args:
+        price_df (pandas.DataFrame): Price data of the ticker.
+        name (str): Name of the indicator in registry.INDICATORS.
+        grid (pandas.DataFrame): Parameter sets from `optimizer.parameter_grid`.
+        windows (list): Windows from `fold_windows`.
+        periods (int): Number of periods per year.
+        metric (str): Statistic maximized on the train windows.
+
+    Returns:
+        tuple: Positions in `grid` of the chosen sets and their train metric, one per fold, and the position
+            of the best set over the whole history.
+    """
+    logreturns = optimizer.log_returns(price_df)
+    best_value = np.full(len(windows) + 1, -np.inf)
+    best_set = np.zeros(len(windows) + 1, dtype=int)
+    # The whole history is scored as an extra window
+    bounds = [(train_start, test_start) for train_start, test_start, _ in windows]
+    bounds.append((0, len(logreturns)))
+
+    chunk_size = max(1, c.optimizer_chunk_bytes // (8 * max(1, len(logreturns))))
+    for start in range(0, len(grid), chunk_size):
+        signals, length = optimizer.signal_matrix(
+            price_df, name, grid.iloc[start : start + chunk_size]
+        )
+        returns = registry.masked_returns(signals, length, logreturns)
+        sums = prefix_sums(returns, metric)
+        for fold, (window_start, window_stop) in enumerate(bounds):
+            values = window_metric(
+                returns, sums, window_start, window_stop, periods, metric
+            )
+            values = np.where(np.isnan(values), -np.inf, values)
+            if values.max() > best_value[fold]:
+                best_value[fold] = values.max()
+                best_set[fold] = start + values.argmax()
+
+    best_value[np.isinf(best_value)] = np.nan
+    return best_set[:-1], best_value[:-1], best_set[-1]
+
+
+# MAIN
+def walk_forward(
+    price_df,
+    name,
+    grid,
+    num_folds=10,
+    train_bars=None,
+    anchored=False,
+    periods=252,
+    metric="Sharpe",
+):
+    """
+    Walk-forward optimization of the parameters of an indicator.
+
+    Args:
+        price_df (pandas.DataFrame): Price data of the ticker.
+        name (str): Name of the indicator in registry.INDICATORS.
+        grid (pandas.DataFrame): Parameter sets from `optimizer.parameter_grid`.
+        num_folds (int): Number of folds (train/test window pairs).
+        train_bars (int, optional): Length of the (first) train window, half of the bars by default.
+        anchored (bool): Train windows grow from the first bar instead of rolling.
+        periods (int): Number of periods per year.
+        metric (str): Statistic maximized on the train windows, one of `RANKING_METRICS`.
+
+    Returns:
+        WalkForwardResult: Folds, out-of-sample statistics and equity curves.
+    """
+    num_bars = len(price_df)
+    if train_bars is None:
+        train_bars = num_bars // 2
+    windows = fold_windows(num_bars, num_folds, train_bars, anchored)
+    chosen, train_values, in_sample_best = best_parameters(
+        price_df, name, grid, windows, periods, metric
+    )
+
+    # Returns of the chosen sets only
+    positions = np.unique(np.append(chosen, in_sample_best))
+    signals, length = optimizer.signal_matrix(price_df, name, grid.iloc[positions])
+    returns = registry.masked_returns(signals, length, optimizer.log_returns(price_df))
+    column = {position: i for i, position in enumerate(positions)}
+
+    test_start = windows[0][1]
+    out_of_sample = np.full(num_bars, np.nan)
+    rows = []
+    for (train_start, start, stop), position, value in zip(
+        windows, chosen, train_values
+    ):
+        fold_returns = returns[start:stop, column[position]]
+        out_of_sample[start:stop] = fold_returns
+        test_stats = performance.returns_statistics(fold_returns, periods)
+        rows.append(
+            {
+                "Train Start": price_df.index[train_start],
+                "Test Start": price_df.index[start],
+                "Test End": price_df.index[stop - 1],
+                **grid.iloc[position].to_dict(),
+                f"Train {metric}": value,
+                "Test Total Return": test_stats["Total Return"][0],
+                "Test Sharpe": test_stats["Sharpe"][0],
+            }
+        )
+
+    returns_df = pd.DataFrame(
+        {
+            "Walk-Forward": out_of_sample,
+            "B&H": optimizer.log_returns(price_df),
+            "In-Sample Best": returns[:, column[in_sample_best]],
+        },
+        index=price_df.index,
+    ).iloc[test_start:]
+    return WalkForwardResult(
+        folds=pd.DataFrame(rows),
+        statistics=performance.statistics_table(returns_df, periods),
+        equity_curves=performance.equity_curves(returns_df),
+    )
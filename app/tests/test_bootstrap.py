@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+from app.libraries import bootstrap, performance, walkforward
+
+
+def resample_indices(starts, lengths):
+    """
+    Expands the blocks of `bootstrap.resample_blocks` to the bar indices of every resample (resamples x bars).
+    """
+    num_samples, num_bars = len(lengths), int(lengths[0].sum())
+    first_position = np.cumsum(lengths, axis=1) - lengths
+    offsets = np.repeat((starts - first_position).ravel(), lengths.ravel())
+    return (offsets.reshape(num_samples, num_bars) + np.arange(num_bars)) % num_bars
+
+
+def test_resample_blocks_and_indices():
+    rng = np.random.default_rng(0)
+    starts, lengths = bootstrap.resample_blocks(50, 200, 4, rng)
+    assert (lengths.sum(axis=1) == 50).all()
+    indices = resample_indices(starts, lengths)
+    assert indices.shape == (200, 50)
+    assert indices.min() >= 0 and indices.max() < 50
+    # Within a block the bars are consecutive (wrapping around the end)
+    first = np.cumsum(lengths, axis=1) - lengths
+    row, block = np.nonzero(lengths > 1)
+    second = indices[row, first[row, block] + 1]
+    assert (second == (indices[row, first[row, block]] + 1) % 50).all()
+
+    starts, lengths = bootstrap.resample_blocks(50, 10, 7, rng, stationary=False)
+    assert (lengths[:, :-1] == 7).all() and (lengths[:, -1] == 1).all()
+
+    # Fractional lengths are rounded once, so every resample still covers all the bars
+    starts, lengths = bootstrap.resample_blocks(10, 5, 2.5, rng, stationary=False)
+    assert (lengths.sum(axis=1) == 10).all() and (lengths == 2).all()
+
+
+def test_resample_sums_match_indices():
+    rng = np.random.default_rng(1)
+    returns = rng.normal(0, 0.01, (60, 3))
+    returns[:5, 1] = np.nan
+    starts, lengths = bootstrap.resample_blocks(60, 30, 5, rng)
+    sums = walkforward.prefix_sums(np.concatenate([returns, returns]), "Sortino")
+    indices = resample_indices(starts, lengths)
+
+    for key, total in sums.items():
+        expected = walkforward.prefix_sums(returns[indices[0]], "Sortino")[key][-1]
+        actual = bootstrap.resample_sums(total, starts, lengths)
+        np.testing.assert_allclose(actual[0], expected, atol=1e-12)
+
+    # Statistics of a resample are those of its resampled bars
+    resampled = {
+        key: bootstrap.resample_sums(total, starts, lengths)
+        for key, total in sums.items()
+    }
+    sortino = walkforward.sums_metric(resampled, 252, "Sortino")[3]
+    np.testing.assert_allclose(
+        sortino, performance.returns_statistics(returns[indices[3]], 252)["Sortino"]
+    )
+
+
+def test_bootstrap_intervals():
+    rng = np.random.default_rng(2)
+    returns_df = pd.DataFrame(
+        {"B&H": rng.normal(0.001, 0.01, 500), "MA": rng.normal(0, 0.01, 500)}
+    )
+    returns_df.iloc[0] = np.nan
+    result = bootstrap.bootstrap(returns_df, num_samples=2000, seed=3)
+    intervals = result.intervals
+    assert list(intervals.index.unique(level="Strategy")) == ["B&H", "MA"]
+    assert (intervals["Lower"] < intervals["Upper"]).all()
+    assert (intervals["Lower"] <= intervals["Estimate"]).all()
+    assert (intervals["Estimate"] <= intervals["Upper"]).all()
+    assert result.samples["Sharpe"].shape == (2000, 2)
+    pd.testing.assert_frame_equal(
+        intervals, bootstrap.bootstrap(returns_df, num_samples=2000, seed=3).intervals
+    )
@@ -0,0 +1,175 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.libraries import data
+
+
+class FakeTicker:
+    def __init__(self, price_df):
+        self.ticker = "FAKE"
+        self.price_df = price_df
+        self.calls = []
+
+    def history(self, period=None, interval=None, start=None):
+        self.calls.append((period, start))
+        if start is not None:
+            return self.price_df[self.price_df.index >= start]
+        start = data.period_start(period, pd.Timestamp.now(tz="America/New_York"))
+        if start is None:
+            return self.price_df
+        return self.price_df[self.price_df.index >= start]
+
+
+def make_prices(end, periods):
+    index = pd.date_range(end=end, periods=periods, freq="D", tz="America/New_York")
+    close = np.linspace(100, 200, periods)
+    return pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1.0},
+        index=index,
+    )
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(data.c, "price_cache_dir", str(tmp_path))
+    return tmp_path
+
+
+def test_merge_history():
+    old = make_prices("2024-01-10", 10)
+    new = make_prices("2024-01-12", 3)
+    new.loc[new.index[0], "Close"] = -1.0
+    merged = data.merge_history(old, new)
+    assert len(merged) == 12
+    assert merged.index.is_monotonic_increasing
+    assert merged["Close"].iloc[9] == -1.0
+
+
+def test_covers():
+    start = pd.Timestamp("2024-01-01", tz="UTC")
+    assert data.covers("max", start)
+    assert data.covers("max", None)
+    assert not data.covers("2024-01-01T00:00:00+00:00", None)
+    assert data.covers("2023-06-01T00:00:00+00:00", start)
+    assert not data.covers("2024-06-01T00:00:00+00:00", start)
+
+
+def test_update_history_appends_new_bars(cache_dir):
+    now = pd.Timestamp.now(tz="America/New_York").normalize()
+    ticker = FakeTicker(make_prices(now - pd.Timedelta(days=2), 400))
+
+    first = data.update_history(ticker, "6mo", "1d")
+    assert ticker.calls == [("6mo", None)]
+    assert os.path.exists(data.cache_path("FAKE", "1d"))
+
+    # Fresh file: served from disk without downloading
+    data.update_history(ticker, "3mo", "1d")
+    assert len(ticker.calls) == 1
+
+    # Stale file: only bars from the last stored one are downloaded
+    old_time = (
+        os.path.getmtime(data.cache_path("FAKE", "1d")) - 2 * data.c.price_data_ttl
+    )
+    os.utime(data.cache_path("FAKE", "1d"), (old_time, old_time))
+    ticker.price_df = make_prices(now, 402)
+    second = data.update_history(ticker, "6mo", "1d")
+    assert ticker.calls[-1] == (None, first.index[-1])
+    assert len(second) == len(first) + 2
+    assert second.index[-1] == now
+
+    # Longer period than stored: full download
+    data.update_history(ticker, "1y", "1d")
+    assert ticker.calls[-1] == ("1y", None)
+
+
+def test_synthetic_source():
+    source = data.SyntheticSource(bars=1000, seed=1)
+    price_df = source.ticker("abc").history(period="max", interval="1d")
+    assert len(price_df) == 1000
+    assert (price_df["High"] >= price_df[["Open", "Close"]].max(axis=1)).all()
+    assert (price_df["Low"] <= price_df[["Open", "Close"]].min(axis=1)).all()
+    pd.testing.assert_frame_equal(
+        price_df, data.SyntheticSource(bars=1000, seed=1).history("ABC", "max", "1d")
+    )
+    assert not price_df.equals(source.history("XYZ", "max", "1d"))
+    assert len(source.history("ABC", "1y", "1d")) < 300
+
+
+def test_synthetic_source_long_history():
+    source = data.SyntheticSource(bars=120_000)
+    price_df = source.history("ABC", "max", "1d")
+    assert len(price_df) == 120_000
+    assert price_df.index.is_monotonic_increasing
+    assert price_df.index[-1] == pd.Timestamp(source.end, tz="UTC")
+    assert 250 < len(source.history("ABC", "1y", "1d")) < 300
+    assert len(source.history("ABC", "max", "1wk")) == 120_000
+
+
+def test_file_source(tmp_path):
+    price_df = data.SyntheticSource(bars=300).history("ABC", "max", "1d")
+    price_df.to_csv(tmp_path / "ABC_1d.csv")
+    price_df.to_parquet(tmp_path / "XYZ.parquet")
+    source = data.FileSource(str(tmp_path))
+
+    from_csv = source.ticker("abc").history(period="max", interval="1d")
+    assert np.allclose(from_csv["Close"], price_df["Close"])
+    pd.testing.assert_frame_equal(
+        source.history("XYZ", "6mo", "1h"), source.history("XYZ", "6mo", "1d")
+    )
+    assert source.history("QQQ", "max", "1d").empty
+
+
+def test_get_ticker_info():
+    ticker_info = data.get_ticker_info(data.SyntheticSource(bars=300), "abc")
+    assert ticker_info["symbol"] == "ABC"
+    assert ticker_info["longName"] == "Synthetic ABC"
+    assert data.get_ticker_info(data.FileSource("missing"), "abc")["symbol"] == "ABC"
+
+
+class FakeBulkSource(data.DataSource):
+    cacheable = True
+
+    def __init__(self, price_dfs):
+        self.price_dfs = price_dfs
+        self.calls = []
+
+    def histories(self, tickers, period=None, interval="1d", start=None):
+        self.calls.append((list(tickers), period, start))
+        return {
+            ticker: (
+                self.price_dfs[ticker][self.price_dfs[ticker].index >= start]
+                if start is not None
+                else self.price_dfs[ticker]
+            )
+            for ticker in tickers
+            if ticker in self.price_dfs
+        }
+
+
+def test_get_price_histories_batches_requests(cache_dir):
+    now = pd.Timestamp.now(tz="America/New_York").normalize()
+    source = FakeBulkSource(
+        {ticker: make_prices(now - pd.Timedelta(days=2), 100) for ticker in "AB"}
+    )
+
+    first = data.get_price_histories(source, ["a", "b", "A", "zzz"], "max", "1d")
+    assert list(first) == ["A", "B"]
+    assert source.calls == [(["A", "B", "ZZZ"], "max", None)]
+
+    # Fresh files: served from disk
+    data.get_price_histories(source, ["A", "B"], "max", "1d")
+    assert len(source.calls) == 1
+
+    # Stale files: one request for the new bars of both tickers
+    for ticker in "AB":
+        old_time = (
+            os.path.getmtime(data.cache_path(ticker, "1d")) - 2 * data.c.price_data_ttl
+        )
+        os.utime(data.cache_path(ticker, "1d"), (old_time, old_time))
+        source.price_dfs[ticker] = make_prices(now, 102)
+    second = data.get_price_histories(source, ["A", "B"], "max", "1d")
+    assert source.calls[-1] == (["A", "B"], None, first["A"].index[-1])
+    assert len(second["B"]) == 102
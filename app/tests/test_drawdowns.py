@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from app.libraries import drawdowns, performance
+
+
+def reference_episodes(equity):
+    """
+    Drawdown episodes of one equity curve, bar by bar: (start, trough, recovery or None, depth).
+    """
+    episodes, peak, current = [], equity[0], None
+    for i, value in enumerate(equity):
+        if value >= peak:
+            if current:
+                episodes.append(current + [i, current.pop()])
+                current = None
+            peak = value
+        elif current is None:
+            current = [i - 1, i, value / peak - 1]
+        elif value / peak - 1 < current[2]:
+            current[1:] = [i, value / peak - 1]
+    if current:
+        episodes.append(current + [None, current.pop()])
+    return episodes
+
+
+def test_drawdown_episodes_match_bar_by_bar():
+    rng = np.random.default_rng(5)
+    returns_df = pd.DataFrame(
+        rng.normal(0.0005, 0.01, (500, 3)),
+        columns=list("ABC"),
+        index=pd.date_range("2020-01-01", periods=500),
+    )
+    returns_df.iloc[:30, 1] = np.nan
+    returns_df["C"] = np.nan
+    equity_df = performance.equity_curves(returns_df)
+    result = drawdowns.drawdown_episodes(equity_df)
+
+    for column in ["A", "B"]:
+        equity = equity_df[column].dropna()
+        expected = reference_episodes(equity.to_numpy())
+        episodes = result.episodes[result.episodes["Strategy"] == column]
+        assert len(episodes) == len(expected)
+        assert list(episodes["Start"]) == [equity.index[e[0]] for e in expected]
+        assert list(episodes["Trough"]) == [equity.index[e[1]] for e in expected]
+        np.testing.assert_allclose(episodes["Depth"], [e[3] for e in expected])
+        recovered = [e[2] is not None for e in expected]
+        assert list(episodes["Recovery"].notna()) == recovered
+
+        summary = result.summary.loc[column]
+        assert np.isclose(
+            episodes["Depth"].min(),
+            performance.returns_statistics(returns_df[column], 252)["Max Drawdown"][0],
+        )
+        assert np.isclose(summary["Avg. Drawdown"], episodes["Depth"].mean())
+        assert summary["Longest Underwater"] == episodes["Duration"].max()
+
+    # Ongoing drawdowns last up to the last bar
+    ongoing = result.episodes[result.episodes["Recovery"].isna()]
+    assert ongoing["Time to Recover"].isna().all()
+    starts = equity_df.index.get_indexer(ongoing["Start"])
+    assert (ongoing["Duration"] == len(equity_df) - 1 - starts).all()
+    assert result.summary.loc["C"].isna().all()
+    assert result.underwater.shape == equity_df.shape
+
+
+def test_drawdown_episodes_without_drawdowns():
+    equity_df = pd.DataFrame({"Up": [1.0, 2.0, 3.0]})
+    result = drawdowns.drawdown_episodes(equity_df)
+    assert result.episodes.empty
+    assert result.summary.loc["Up"].tolist() == [0.0, 0.0]
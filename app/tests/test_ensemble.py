@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from app.libraries import data, ensemble, main, registry
+
+PARAMETERS = {
+    "ma_short": 10,
+    "ma_long": 30,
+    "ema_checkbox": False,
+    "rsi_length": 14,
+    "rsi_thresholds": "30/70",
+    "macd_fast": 12,
+    "macd_slow": 26,
+    "macd_signal": 9,
+}
+
+
+def test_subset_masks():
+    masks = ensemble.subset_masks(3)
+    assert masks.dtype == np.int8
+    assert sorted(map(tuple, masks)) == [(0, 1, 1), (1, 0, 1), (1, 1, 0), (1, 1, 1)]
+    assert len(ensemble.subset_masks(5)) == 2**5 - 5 - 1
+
+
+def test_ensemble_signals_rules():
+    signals = np.array([[1, 1, 0], [1, -1, 0], [-1, -1, -1], [0, 0, 1]], np.int8)
+    lengths = np.array([1, 0, 1])
+    masks = np.array([[1, 1, 1], [0, 1, 0]], np.int8)
+
+    majority, warm_up = ensemble.ensemble_signals(signals, lengths, masks, "Majority")
+    assert majority.dtype == np.int8
+    np.testing.assert_array_equal(majority[:, 0], [1, 0, -1, 0])
+    np.testing.assert_array_equal(warm_up, [1, 0])
+    unanimous, _ = ensemble.ensemble_signals(signals, lengths, masks, "Unanimous")
+    np.testing.assert_array_equal(unanimous[:, 0], [0, 0, -1, 0])
+    weighted, _ = ensemble.ensemble_signals(
+        signals, lengths, masks, "Weighted", weights=[3, 1, 1]
+    )
+    np.testing.assert_array_equal(weighted[:, 0], [1, 1, -1, 1])
+
+
+def test_evaluate_ensembles():
+    price_df = data.SyntheticSource(bars=800).history("ENS", "max", "1d")
+    selected = list(registry.INDICATORS)[:3]
+    ta_df = main.add_ta_to_df(price_df, selected, **PARAMETERS)
+    table = ensemble.evaluate_ensembles(ta_df)
+    assert len(table) == 1 + 3 + 3 * 4
+
+    # B&H and the indicators as in the statistics table
+    expected = main.do_ta_analysis(ta_df)
+    pd.testing.assert_frame_equal(
+        table.loc[expected.index, expected.columns[:6]], expected.iloc[:, :6]
+    )
+
+    # An ensemble as a strategy built by hand
+    votes = ta_df[["MA_Signal", "RSI_Signal", "MACD_Signal"]]
+    signal = np.sign(votes.sum(axis=1).astype(float))
+    signal.iloc[: max(ta_df.attrs["warm_up"].values())] = np.nan
+    returns = pd.DataFrame({"X": signal * ta_df["logreturns"]})
+    statistics = main.performance.statistics_table(returns, 252)
+    np.testing.assert_allclose(
+        table.loc["MA+RSI+MACD (Weighted)", statistics.columns].to_numpy(dtype=float),
+        statistics.loc["X"].to_numpy(dtype=float),
+    )
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from app.libraries import kernels, data
+
+
+@pytest.fixture(scope="module")
+def price_df():
+    return data.SyntheticSource(bars=3000, seed=7).history("KRN", "max", "1d")
+
+
+def assert_same(values, expected):
+    expected = np.asarray(expected, dtype=float)
+    assert np.array_equal(np.isnan(values), np.isnan(expected))
+    assert np.allclose(values, expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def test_linear_recursion():
+    rng = np.random.default_rng(0)
+    b = rng.normal(size=(5000, 3))
+    expected = np.empty_like(b)
+    y = np.full(3, 2.0)
+    for t in range(len(b)):
+        y = 0.9 * y + b[t]
+        expected[t] = y
+    assert_same(kernels.linear_recursion(b, 0.9, 2.0), expected)
+
+
+def test_rolling_kernels(price_df):
+    close = price_df["Close"]
+    for length in (1, 7, 50, len(close) + 1):
+        assert_same(kernels.sma(close, length), close.rolling(length).mean())
+        assert_same(kernels.rolling_max(close, length), close.rolling(length).max())
+        assert_same(kernels.rolling_min(close, length), close.rolling(length).min())
+
+    with_gaps = close.copy()
+    with_gaps.iloc[[0, 1, 500]] = np.nan
+    assert_same(kernels.sma(with_gaps, 10), with_gaps.rolling(10).mean())
+
+
+def test_exponential_kernels(price_df):
+    close = price_df["Close"]
+    seeded = close.copy()
+    seeded.iloc[:19] = np.nan
+    seeded.iloc[19] = close.iloc[:20].mean()
+    assert_same(kernels.ema(close, 20), seeded.ewm(span=20, adjust=False).mean())
+
+    change = close.diff()
+    gains = change.clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+    losses = (-change).clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+    assert_same(
+        kernels.rma(change, 14), change.ewm(alpha=1 / 14, min_periods=14).mean()
+    )
+    assert_same(kernels.rsi(close, 14), 100 * gains / (gains + losses))
+
+
+def test_kernels_2d(price_df):
+    matrix = np.column_stack([price_df["Close"], price_df["Open"]])
+    for kernel in (kernels.sma, kernels.ema, kernels.rsi, kernels.rolling_max):
+        result = kernel(matrix, 14)
+        assert_same(result[:, 0], kernel(matrix[:, 0], 14))
+        assert_same(result[:, 1], kernel(matrix[:, 1], 14))
+
+
+def test_pandas_ta_parity(price_df):
+    ta = pytest.importorskip("pandas_ta")
+    high, low, close = price_df["High"], price_df["Low"], price_df["Close"]
+
+    assert_same(kernels.ema(close, 20), ta.ema(close, 20))
+    assert_same(kernels.rsi(close, 14), ta.rsi(close, 14))
+    for fast, slow, signal in ((12, 26, 9), (30, 10, 5)):
+        expected = ta.macd(close, fast, slow, signal)
+        for values, column in zip(kernels.macd(close, fast, slow, signal), (0, 2, 1)):
+            assert_same(values, expected.iloc[:, column])
+    for length, smoothing in ((14, 14), (5, 20)):
+        expected = ta.adx(high, low, close, length, smoothing)
+        for values, column in zip(
+            kernels.dmi(high, low, close, length, smoothing), (0, 1, 2)
+        ):
+            assert_same(values, expected.iloc[:, column])
+
+
+def hold_signal_loop(signal, periods):
+    # Holding period as previously implemented in main.add_ta_to_df
+    modified_signal = signal.copy()
+    for i in range(1, len(modified_signal)):
+        if modified_signal[i - 1] == 0 and modified_signal[i] in [-1, 1]:
+            value_to_keep = modified_signal[i]
+            for j in range(1, periods):
+                if i + j < len(modified_signal) and modified_signal[i + j] == 0:
+                    modified_signal[i + j] = value_to_keep
+                elif (
+                    i + j < len(modified_signal)
+                    and modified_signal[i + j] == -value_to_keep
+                ):
+                    break
+    return modified_signal
+
+
+def test_hold_signal():
+    rng = np.random.default_rng(1)
+    for _ in range(500):
+        signal = rng.choice([-1.0, 0.0, 1.0], size=rng.integers(1, 80))
+        signal[: rng.integers(0, 5)] = np.nan
+        periods = int(rng.integers(1, 15))
+        assert_same(
+            kernels.hold_signal(signal, periods), hold_signal_loop(signal, periods)
+        )
+
+
+def test_breakout_signal():
+    close = np.array([10.0, 10.5, 10.2, 11.0, 10.9, 9.0, 9.5])
+    maximum = kernels.rolling_max(close, 3)
+    minimum = kernels.rolling_min(close, 3)
+    assert_same(
+        kernels.breakout_signal(close, maximum, minimum, 0.1),
+        [0, 0, 0, 1, 0, 0, 0],
+    )
+    assert_same(
+        kernels.breakout_signal(close, maximum, minimum, 0.5),
+        [0, 0, 0, 1, 0, -1, 0],
+    )
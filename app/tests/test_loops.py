@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from app.libraries import kernels, loops
+
+
+@pytest.fixture
+def backend():
+    # Restores the backend selected at import
+    previous = loops.get_backend()
+    yield loops.set_backend
+    loops.set_backend(previous)
+
+
+def random_signals(rng, bars, columns):
+    signal = rng.choice([-1.0, 0.0, 1.0], size=(bars, columns), p=[0.1, 0.8, 0.1])
+    signal[: rng.integers(0, 5)] = np.nan
+    return signal
+
+
+def check_parity(rng):
+    for _ in range(100):
+        signal = random_signals(rng, int(rng.integers(1, 200)), 3)
+        periods = rng.integers(1, 15, 3)
+        np.testing.assert_array_equal(
+            kernels.hold_signals(signal, periods),
+            loops.hold_signal_loop(signal, periods),
+        )
+
+        values = kernels.hold_signals(signal, periods)[:, 0]
+        returns = rng.normal(0, 0.01, len(values))
+        returns[0] = np.nan
+        starts, ends, sums = kernels.trade_segments(values, returns)
+        expected = loops.trade_segments_loop(values, returns)
+        np.testing.assert_array_equal(starts, expected[0])
+        np.testing.assert_array_equal(ends, expected[1])
+        np.testing.assert_allclose(sums, expected[2], atol=1e-12)
+
+
+def test_numpy_backend_matches_loops(backend):
+    backend("numpy")
+    check_parity(np.random.default_rng(0))
+
+
+def test_numba_backend_matches_loops(backend):
+    pytest.importorskip("numba")
+    backend("numba")
+    check_parity(np.random.default_rng(1))
+
+
+def test_set_backend():
+    assert loops.get_backend() in loops.available_backends()
+    with pytest.raises(ValueError):
+        loops.set_backend("fortran")
@@ -1,6 +1,8 @@
+import numpy as np
+import pandas as pd
 import pytest
 
-from app.libraries import main
+from app.libraries import main, data
 
 
 def test_fetch_data():
@@ -13,6 +15,92 @@ def test_fetch_data():
     assert main.fetch_data("nvda", "max", "5m") == 1
 
 
+def test_fetch_data_downloads_requested_period_only(tmp_path):
+    class RecordingSource(data.SyntheticSource):
+        def history(self, ticker_input, period=None, interval="1d", start=None):
+            self.requests.append((period, interval))
+            return super().history(ticker_input, period, interval, start)
+
+    source = RecordingSource(bars=600)
+    source.requests = []
+    assert main.fetch_data("TEST", "1y", "1d", source=source) != 1
+    assert source.requests == [("1y", "1d")]
+
+    assert main.fetch_data("TEST", "1y", "5m", source=source) == 1
+    assert len(source.requests) == 1
+
+    assert main.fetch_data("TEST", "1y", "1d", source=data.FileSource(tmp_path)) == 1
+
+
+def test_pipeline_synthetic_source():
+    source = data.SyntheticSource(bars=600)
+    ticker_data = main.fetch_data("TEST", "2y", "1d", source=source)
+    price_df = ticker_data.history(period="2y", interval="1d")
+
+    ticker_info = data.get_ticker_info(source, "TEST")
+    graph = main.create_graph(ticker_info, price_df, "1d")
+    assert graph.layout.title.text == "Graph Synthetic TEST (TEST)"
+
+    ta_df = main.add_ta_to_df(
+        price_df,
+        [
+            "Moving Average",
+            "Relative Strength Index (RSI)",
+            "Moving Average Converge Divergence (MACD)",
+            "Directional Movement Index (DMI)",
+            "Trading Range Breakout",
+        ],
+        ma_short=20,
+        ma_long=50,
+        ema_checkbox=False,
+        rsi_length=14,
+        rsi_thresholds="30/70",
+        macd_fast=12,
+        macd_slow=26,
+        macd_signal=9,
+        dmi_length=14,
+        adx_smoothing=14,
+        trb_length=20,
+        trb_width=0.1,
+        trb_num_periods_to_hold=20,
+    )
+    analysis = main.analyze(ta_df)
+    assert list(analysis.statistics.index) == ["B&H", "MA", "RSI", "MACD", "DMI", "TRB"]
+    assert list(analysis.equity_curves.columns) == list(analysis.statistics.index)
+    assert np.allclose(
+        analysis.equity_curves.iloc[-1] / 10000 - 1,
+        analysis.statistics["Total Return"].astype(float),
+    )
+    pd.testing.assert_frame_equal(main.do_ta_analysis(ta_df), analysis.statistics)
+    assert list(price_df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+
+
+def test_trade_ledger():
+    index = pd.date_range("2024-01-01", periods=10, freq="D")
+    signals = pd.Series([np.nan, 1, 1, 0, -1, 1, 1, 1, 0, -1], index=index)
+    returns = pd.Series([np.nan, 0.1, -0.05, 0, 0.02, -0.01, -0.01, 0.0, 0, 0.03])
+    returns.index = index
+
+    ledger = main.trade_ledger(signals, returns)
+    assert ledger["Direction"].tolist() == [1, -1, 1, -1]
+    assert ledger["Bars"].tolist() == [2, 1, 3, 1]
+    assert ledger["Entry"].tolist() == list(index[[1, 4, 5, 9]])
+    assert ledger["Exit"].tolist() == list(index[[2, 4, 7, 9]])
+    assert np.allclose(ledger["Return"], [0.05, 0.02, -0.02, 0.03])
+
+    assert main.calculate_num_trades(signals) == 4
+    assert main.win_lose_trades(signals, returns) == [3, 1]
+    assert main.mean_trade_length(signals) == 1.75
+    assert main.calculate_num_trades(pd.Series([np.nan, 0.0, 0.0])) == 0
+
+    # Strategies without trades
+    stats = main.trade_statistics(main.trade_ledger(pd.Series([0, 0, 0]), returns[:3]))
+    assert stats["Num. Trades"] == 0
+    assert np.isnan(stats["Pct. Win. Trades"])
+    assert np.isnan(stats["Pct. Losing Trades"])
+    assert np.isnan(stats["Avg. Trade Duration"])
+
+
 def test_color_high_green():
     assert main.color_high_green(100, 100) == "color: #f2e1e1"
     assert main.color_high_green(100, 101) == "color: #FF440B"
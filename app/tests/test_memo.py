@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from app.libraries import memo, engine, data, main
+
+
+def test_indicator_cache_lru():
+    cache = memo.IndicatorCache(max_entries=2, max_bytes=10 * 8)
+    calls = []
+
+    def compute(n):
+        calls.append(n)
+        return np.zeros(n)
+
+    cache.get_or_compute(("a",), compute, 4)
+    cache.get_or_compute(("b",), compute, 4)
+    cache.get_or_compute(("a",), compute, 4)
+    assert calls == [4, 4]
+
+    # 'b' is the least recently used entry and the memory limit allows only two arrays
+    cache.get_or_compute(("c",), compute, 4)
+    assert list(cache.entries) == [("a",), ("c",)]
+    assert cache.stats()["bytes"] == 64
+
+    # Values larger than the limit are returned but not stored
+    assert len(cache.get_or_compute(("d",), compute, 20)) == 20
+    assert ("d",) not in cache.entries
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 4
+    assert cache.stats()["evictions"] == 1
+    assert not cache.get_or_compute(("a",), compute, 4).flags.writeable
+
+
+def test_compute_indicators_recomputes_changed_indicator_only():
+    price_df = data.SyntheticSource(bars=500).history("MEMO", "max", "1d")
+    parameters = dict(
+        selected_indicators=["Relative Strength Index (RSI)", "Trading Range Breakout"],
+        rsi_length=14,
+        trb_length=20,
+    )
+    engine.INDICATOR_CACHE.clear()
+    first = engine.compute_indicators(price_df, **parameters)
+    assert engine.cache_stats()["misses"] == 3
+
+    second = engine.compute_indicators(price_df, **dict(parameters, rsi_length=10))
+    assert engine.cache_stats()["misses"] == 4
+    assert engine.cache_stats()["hits"] == 2
+    pd.testing.assert_series_equal(first["Max"], second["Max"])
+
+    # Other prices have another fingerprint
+    engine.compute_indicators(price_df.iloc[:-1], **parameters)
+    assert engine.cache_stats()["misses"] == 7
+
+
+def test_pipeline_accepts_non_datetime_index():
+    price_df = data.SyntheticSource(bars=300).history("IDX", "max", "1d")
+    parameters = dict(rsi_length=14, rsi_thresholds="30/70")
+    expected = main.do_ta_analysis(
+        main.add_ta_to_df(price_df, ["Relative Strength Index (RSI)"], **parameters)
+    )
+    for index in [
+        pd.RangeIndex(len(price_df)),
+        pd.Index([f"bar {i}" for i in range(len(price_df))]),
+    ]:
+        other = price_df.set_axis(index)
+        assert memo.fingerprint(other) != memo.fingerprint(price_df)
+        statistics = main.do_ta_analysis(
+            main.add_ta_to_df(other, ["Relative Strength Index (RSI)"], **parameters)
+        )
+        pd.testing.assert_frame_equal(statistics, expected)
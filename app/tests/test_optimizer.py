@@ -0,0 +1,38 @@
+import numpy as np
+
+from app.libraries import optimizer, registry, main, data
+
+
+def test_parameter_grid():
+    grid = optimizer.parameter_grid(
+        "Moving Average", {"ma_short": range(5, 201), "ma_long": range(5, 201)}
+    )
+    # Only pairs with a shorter short moving average
+    assert len(grid) == 196 * 195 // 2
+    assert (grid["ma_short"] < grid["ma_long"]).all()
+    assert not grid["ema_checkbox"].any()
+    assert optimizer.parameter_range(0.02, 0.1, 0.02) == [0.02, 0.04, 0.06, 0.08, 0.1]
+
+
+def test_optimize_matches_single_runs():
+    price_df = data.SyntheticSource(bars=600).history("OPT", "max", "1d")
+    for name, entry in registry.INDICATORS.items():
+        ranges = {
+            parameter: optimizer.parameter_range(*widget["grid"])[:4]
+            for parameter, widget in entry["parameters"].items()
+            if "grid" in widget
+        }
+        grid = optimizer.parameter_grid(name, ranges)
+        results = optimizer.optimize(price_df, name, grid)
+        assert len(results) == len(grid)
+        assert results["Sharpe"].dropna().is_monotonic_decreasing
+
+        traded = results[results["Num. Trades"] > 0]
+        for row in traded.iloc[[0, -1]].to_dict("records"):
+            parameters = {parameter: row[parameter] for parameter in grid.columns}
+            ta_df = main.add_ta_to_df(price_df, [name], **parameters)
+            stats = main.calculate_statistics(
+                ta_df[f"{entry['key']}_returns"], ta_df[f"{entry['key']}_Signal"], 252
+            )
+            for statistic in ["Total Return", "Sharpe", "Max Drawdown", "Num. Trades"]:
+                assert np.isclose(row[statistic], stats[statistic], equal_nan=True)
@@ -0,0 +1,88 @@
+import threading
+from multiprocessing.shared_memory import SharedMemory
+
+import pandas as pd
+import pytest
+
+from app.libraries import parallel, optimizer, data
+
+
+def test_shared_price_data_round_trip(monkeypatch):
+    price_df = data.SyntheticSource(bars=300).history("SHM", "max", "1d")
+    with parallel.SharedPriceData(price_df) as shared:
+        attached = parallel.attach(shared.descriptor)
+        pd.testing.assert_frame_equal(
+            attached, price_df.select_dtypes("number"), check_freq=False
+        )
+        assert not attached["Close"].to_numpy().flags.writeable
+        del attached
+        parallel._ATTACHED.pop(shared.descriptor["name"])[0].close()
+
+    # Dates in seconds (long synthetic histories)
+    price_df = data.SyntheticSource(bars=120_000).history("SHM", "max", "1d")
+    with parallel.SharedPriceData(price_df) as shared:
+        attached = parallel.attach(shared.descriptor)
+        pd.testing.assert_index_equal(attached.index, price_df.index)
+        del attached
+        parallel._ATTACHED.pop(shared.descriptor["name"])[0].close()
+
+    # The block is unlinked if the copy fails
+    created = []
+    monkeypatch.setattr(
+        parallel.shared_memory,
+        "SharedMemory",
+        lambda **kwargs: created.append(SharedMemory(**kwargs)) or created[-1],
+    )
+    monkeypatch.setattr(parallel, "layout", lambda *args: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        parallel.SharedPriceData(price_df)
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=created[0].name)
+    created[0].close()
+    monkeypatch.undo()
+
+    # Indexes other than dates go with the descriptor
+    price_df = price_df.reset_index(drop=True)
+    with parallel.SharedPriceData(price_df) as shared:
+        attached = parallel.attach(shared.descriptor)
+        pd.testing.assert_frame_equal(attached, price_df.select_dtypes("number"))
+        del attached
+        parallel._ATTACHED.pop(shared.descriptor["name"])[0].close()
+
+
+def test_parallel_optimize(monkeypatch):
+    monkeypatch.setattr(parallel.c, "parallel_workers", 2)
+    monkeypatch.setattr(parallel.c, "parallel_min_sets", 0)
+    parallel.shutdown()
+    try:
+        price_df = data.SyntheticSource(bars=500).history("PAR", "max", "1d")
+        grid = optimizer.parameter_grid(
+            "Moving Average", {"ma_short": range(5, 30), "ma_long": range(10, 60, 5)}
+        )
+        calls = []
+        results = parallel.optimize(
+            price_df,
+            "Moving Average",
+            grid,
+            progress=lambda done, total: calls.append((done, total)),
+        )
+        pd.testing.assert_frame_equal(
+            results, optimizer.optimize(price_df, "Moving Average", grid)
+        )
+        assert calls[-1] == (8, 8)
+
+        # Cancelled after the first shard
+        cancel = threading.Event()
+        cancel.set()
+        partial = parallel.optimize(price_df, "Moving Average", grid, cancel=cancel)
+        assert 0 < len(partial) < len(grid)
+
+        # Stopped from another thread
+        run = parallel.BackgroundRun(
+            parallel.optimize, price_df, "Moving Average", grid
+        )
+        run.stop()
+        run.thread.join()
+        assert run.error is None and 0 < len(run.result) <= len(grid)
+    finally:
+        parallel.shutdown()
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from app.libraries import performance, main
+
+
+def test_statistics_table_matches_single_strategy():
+    rng = np.random.default_rng(3)
+    returns_df = pd.DataFrame(rng.normal(0.0005, 0.01, (300, 4)), columns=list("ABCD"))
+    # Warm-up periods of different lengths
+    returns_df.iloc[:20, 1] = np.nan
+    returns_df.iloc[:150, 2] = np.nan
+    table = performance.statistics_table(returns_df, 252)
+    equity = performance.equity_curves(returns_df)
+
+    for column in returns_df:
+        stats = main.calculate_statistics_buyandhold(returns_df[column], 252)
+        expected = (1 + returns_df[column]).cumprod()
+        drawdown = (expected / expected.cummax() - 1).min()
+        assert np.isclose(stats["Total Return"], expected.iloc[-1] - 1)
+        assert np.isclose(stats["Max Drawdown"], drawdown)
+        assert np.isclose(
+            stats["Sharpe"],
+            ((1 + returns_df[column].mean()) ** 252 - 1)
+            / (returns_df[column].std() * np.sqrt(252)),
+        )
+        for name, value in table.loc[column].items():
+            assert np.isclose(stats[name], value)
+        pd.testing.assert_series_equal(
+            equity[column], 10000 * expected, check_names=False
+        )
+
+
+def test_statistics_without_returns_are_nan():
+    returns = np.full((10, 2), np.nan)
+    returns[:, 0] = 0.01
+    stats = performance.returns_statistics(returns, 252)
+    assert np.isnan(stats["Total Return"][1])
+    assert np.isnan(stats["Max Drawdown"][1])
+    assert np.isclose(stats["Total Return"][0], 1.01**10 - 1)
+
+    # No negative returns: the downside deviation (and the Sortino ratio) is undefined
+    assert np.isnan(stats["Sortino"][0])
+
+
+def test_rolling_statistics_match_pandas_rolling():
+    rng = np.random.default_rng(4)
+    returns_df = pd.DataFrame(rng.normal(0.0003, 0.01, (400, 3)), columns=list("ABC"))
+    returns_df.iloc[:40, 1] = np.nan
+    returns_df.iloc[::7, 2] = 0.0
+    window = 50
+    rolling = performance.rolling_curves(returns_df, window, 252)
+
+    def sharpe(x):
+        return ((1 + x.mean()) ** 252 - 1) / (x.std(ddof=1) * np.sqrt(252))
+
+    growth = (1 + returns_df.fillna(0)).cumprod().where(returns_df.notna())
+    full = returns_df.notna().rolling(window).sum() == window
+    expected = {
+        "Sharpe": returns_df.rolling(window).apply(sharpe, raw=True),
+        "Volatility": returns_df.rolling(window).std() * np.sqrt(252),
+        "Drawdown": (growth / growth.rolling(window, min_periods=1).max() - 1).where(
+            full
+        ),
+        "Win Rate": returns_df.rolling(window).apply(
+            lambda x: (x > 0).sum() / (x != 0).sum(), raw=True
+        ),
+    }
+    for metric in performance.ROLLING_METRICS:
+        pd.testing.assert_frame_equal(rolling[metric], expected[metric], atol=1e-10)
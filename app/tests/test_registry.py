@@ -0,0 +1,81 @@
+import numpy as np
+
+from app.libraries import registry, engine, kernels, data, main
+
+
+def test_registry_entries():
+    parameters = registry.default_parameters()
+    assert "trb_num_periods_to_hold" in parameters
+    assert all(value is None for value in parameters.values())
+
+    keys = [entry["key"] for entry in registry.INDICATORS.values()]
+    assert keys == ["MA", "RSI", "MACD", "DMI", "TRB"]
+    for name, entry in registry.INDICATORS.items():
+        defaults = registry.default_values(name)
+        for node in entry["outputs"](defaults).values():
+            assert node[0] in registry.OPERATIONS
+
+
+def test_shared_nodes_are_computed_once():
+    price_df = data.SyntheticSource(bars=500).history("DAG", "max", "1d")
+    parameters = dict(
+        ma_short=12,
+        ma_long=26,
+        ema_checkbox=True,
+        macd_fast=12,
+        macd_slow=26,
+        macd_signal=9,
+        dmi_length=14,
+        adx_smoothing=14,
+    )
+    engine.INDICATOR_CACHE.clear()
+    indicators_df = engine.compute_indicators(
+        price_df,
+        ["Moving Average", "Moving Average Converge Divergence (MACD)"],
+        **parameters,
+    )
+    # EMA 12 and EMA 26 are shared by the moving averages and the MACD line
+    assert engine.cache_stats()["misses"] == 5
+    line, signal_line, histogram = kernels.macd(price_df["Close"], 12, 26, 9)
+    assert np.allclose(indicators_df["MACDh_12_26_9"], histogram, equal_nan=True)
+
+    engine.compute_indicators(
+        price_df, ["Directional Movement Index (DMI)"], **parameters
+    )
+    misses = engine.cache_stats()["misses"]
+    indicators_df = engine.compute_indicators(
+        price_df,
+        ["Directional Movement Index (DMI)"],
+        **dict(parameters, adx_smoothing=20),
+    )
+    # Only the smoothing of DX depends on 'adx_smoothing'
+    assert engine.cache_stats()["misses"] == misses + 1
+    adx, di_plus, di_minus = kernels.dmi(
+        price_df["High"], price_df["Low"], price_df["Close"], 14, 20
+    )
+    assert np.allclose(indicators_df["ADX_20"], adx, equal_nan=True)
+
+
+def test_signals_are_int8_with_warm_up():
+    price_df = data.SyntheticSource(bars=300).history("I8", "max", "1d")
+    parameters = {}
+    for name in registry.INDICATORS:
+        parameters.update(registry.default_values(name))
+    ta_df = main.add_ta_to_df(price_df, list(registry.INDICATORS), **parameters)
+    for entry in registry.INDICATORS.values():
+        signals = ta_df[f"{entry['key']}_Signal"]
+        length = ta_df.attrs["warm_up"][entry["key"]]
+        assert signals.dtype == np.int8
+        assert set(np.unique(signals)) <= {-1, 0, 1}
+        assert 1 <= length < len(signals)
+        assert length == entry["warm_up"](parameters)
+        assert (signals.iloc[:length] == 0).all()
+        assert ta_df[f"{entry['key']}_returns"].iloc[:length].isna().all()
+
+    signal = np.array([[1, -1], [1, 1], [-1, 1]], np.int8)
+    returns = registry.masked_returns(
+        signal, np.array([1, 2]), np.array([0.0, 0.1, 0.2])
+    )
+    np.testing.assert_array_equal(
+        returns, [[np.nan, np.nan], [0.1, np.nan], [-0.2, 0.2]]
+    )
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from app.libraries import data, main, registry, signals
+
+PARAMETERS = {}
+for name in registry.INDICATORS:
+    PARAMETERS.update(registry.default_values(name))
+
+
+def test_build_signals_matches_add_ta_to_df():
+    price_df = data.SyntheticSource(bars=400).history("SIG", "max", "1d")
+    columns = list(price_df.columns)
+    selected = list(registry.INDICATORS)
+    signal_set = signals.build_signals(price_df, selected, **PARAMETERS)
+    assert list(price_df.columns) == columns
+    assert signal_set.keys == ["MA", "RSI", "MACD", "DMI", "TRB"]
+    assert signal_set.signals.dtype == np.int8
+
+    ta_df = main.add_ta_to_df(price_df, selected, **PARAMETERS)
+    for i, key in enumerate(signal_set.keys):
+        np.testing.assert_array_equal(
+            ta_df[f"{key}_Signal"].to_numpy(), signal_set.signals[:, i]
+        )
+        np.testing.assert_array_equal(
+            ta_df[f"{key}_returns"].to_numpy(), signal_set.returns[:, i]
+        )
+        assert ta_df.attrs["warm_up"][key] == signal_set.warm_up[i]
+
+    # The analysis takes either representation
+    from_set = main.analyze(signal_set)
+    from_frame = main.analyze(ta_df)
+    pd.testing.assert_frame_equal(from_set.statistics, from_frame.statistics)
+    pd.testing.assert_frame_equal(from_set.equity_curves, from_frame.equity_curves)
+
+
+def test_build_signals_without_indicators():
+    price_df = data.SyntheticSource(bars=50).history("SIG", "max", "1d")
+    signal_set = signals.build_signals(price_df, [])
+    assert signal_set.signals.shape == (50, 0)
+    assert list(main.strategy_returns(signal_set).columns) == ["B&H"]
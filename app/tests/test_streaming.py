@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from app.libraries import main, streaming, data, kernels, registry
+
+PARAMETERS = dict(
+    selected_indicators=[
+        "Moving Average",
+        "Relative Strength Index (RSI)",
+        "Directional Movement Index (DMI)",
+        "Moving Average Converge Divergence (MACD)",
+        "Trading Range Breakout",
+    ],
+    ma_short=10,
+    ma_long=30,
+    ema_checkbox=True,
+    rsi_length=14,
+    rsi_thresholds="40/60",
+    macd_fast=12,
+    macd_slow=26,
+    macd_signal=9,
+    dmi_length=14,
+    adx_smoothing=14,
+    trb_length=10,
+    trb_width=0.2,
+    trb_num_periods_to_hold=5,
+)
+
+
+def test_states_match_kernels():
+    close = data.SyntheticSource(bars=500).history("STR", "max", "1d")["Close"]
+    for state, kernel in (
+        (streaming.SMAState(20), kernels.sma(close, 20)),
+        (streaming.EMAState(20), kernels.ema(close, 20)),
+        (streaming.RSIState(14), kernels.rsi(close, 14)),
+        (streaming.RollingExtremeState(20, False), kernels.rolling_min(close, 20)),
+    ):
+        values = [state.update(value) for value in close]
+        assert np.allclose(values, kernel, rtol=1e-9, equal_nan=True)
+
+
+def test_stream_matches_add_ta_to_df():
+    price_df = data.SyntheticSource(bars=800).history("STR", "max", "1d")
+    expected = main.add_ta_to_df(price_df, **PARAMETERS)
+
+    stream = streaming.IndicatorStream(**PARAMETERS)
+    history = stream.update_many(price_df.iloc[:700])
+    new_bars = stream.update_many(price_df.iloc[700:])
+    result = pd.concat([history, new_bars])
+
+    for column in result.columns:
+        assert np.allclose(
+            result[column], expected[column], rtol=1e-8, atol=1e-8, equal_nan=True
+        ), column
+
+
+def test_every_indicator_has_stream_state():
+    for name, entry in registry.INDICATORS.items():
+        assert entry["key"] in streaming.STREAM_STATES, name
@@ -0,0 +1,59 @@
+import numpy as np
+
+from app.libraries import data, main, universe
+
+PARAMETERS = {
+    "ma_short": 10,
+    "ma_long": 30,
+    "ema_checkbox": False,
+    "rsi_length": 14,
+    "rsi_thresholds": "30/70",
+    "macd_fast": 12,
+    "macd_slow": 26,
+    "macd_signal": 9,
+    "dmi_length": 14,
+    "adx_smoothing": 14,
+    "trb_length": 20,
+    "trb_width": 1.0,
+    "trb_num_periods_to_hold": 5,
+}
+
+
+def test_price_panel_aligns_and_excludes():
+    source = data.SyntheticSource(bars=500)
+    price_dfs = {ticker: source.history(ticker, "max", "1d") for ticker in "ABC"}
+    price_dfs["B"] = price_dfs["B"].iloc[50:]
+    price_dfs["C"] = price_dfs["C"].iloc[300:]
+    panel, excluded = universe.price_panel(price_dfs)
+    assert excluded == ["C"]
+    assert list(panel["Close"].columns) == ["A", "B"]
+    assert panel.index.equals(price_dfs["B"].index)
+
+
+def test_analyze_universe_matches_single_ticker():
+    source = data.SyntheticSource(bars=600)
+    price_dfs = {ticker: source.history(ticker, "max", "1d") for ticker in ["X", "Y"]}
+    panel, _ = universe.price_panel(price_dfs)
+    selected = list(main.registry.INDICATORS)
+    result = universe.analyze_universe(panel, selected, **PARAMETERS)
+
+    for ticker, price_df in price_dfs.items():
+        expected = main.do_ta_analysis(
+            main.add_ta_to_df(price_df, selected, **PARAMETERS)
+        )
+        actual = result.statistics.loc[ticker].loc[expected.index]
+        for column in universe.performance.returns_statistics([0.0], 252):
+            np.testing.assert_allclose(actual[column], expected[column], rtol=1e-9)
+        np.testing.assert_array_equal(
+            actual["Num. Trades"].iloc[1:], expected["Num. Trades"].iloc[1:]
+        )
+        assert list(actual["Current Recommendation"].iloc[1:]) == list(
+            expected["Current Recommendation"].iloc[1:]
+        )
+
+    rankings = result.rankings
+    assert set(rankings.index) == {"B&H"} | {
+        entry["key"] for entry in main.registry.INDICATORS.values()
+    }
+    assert rankings["Median Sharpe"].is_monotonic_decreasing
+    assert rankings.loc["B&H", "Pct. Tickers Beating B&H"] == 0
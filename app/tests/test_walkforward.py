@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from app.libraries import walkforward, optimizer, performance, data, registry
+
+
+def test_fold_windows():
+    assert walkforward.fold_windows(100, 3, 40) == [
+        (0, 40, 60),
+        (20, 60, 80),
+        (40, 80, 100),
+    ]
+    assert [train for train, _, _ in walkforward.fold_windows(100, 3, 40, True)] == [
+        0,
+        0,
+        0,
+    ]
+    with pytest.raises(ValueError):
+        walkforward.fold_windows(10, 20, 5)
+
+
+def test_window_metric_matches_statistics():
+    returns = np.random.default_rng(1).normal(0, 0.01, (300, 4))
+    returns[:30, 2] = np.nan
+    expected = performance.returns_statistics(returns[50:250], 252)
+    for metric in walkforward.RANKING_METRICS:
+        sums = walkforward.prefix_sums(returns, metric)
+        values = walkforward.window_metric(returns, sums, 50, 250, 252, metric)
+        assert np.allclose(values, expected[metric])
+
+
+def test_walk_forward_chooses_best_train_parameters():
+    price_df = data.SyntheticSource(bars=800).history("WF", "max", "1d")
+    grid = optimizer.parameter_grid(
+        "Moving Average", {"ma_short": range(5, 50, 5), "ma_long": range(20, 120, 10)}
+    )
+    result = walkforward.walk_forward(
+        price_df, "Moving Average", grid, num_folds=4, train_bars=300
+    )
+
+    signals, lengths = optimizer.signal_matrix(price_df, "Moving Average", grid)
+    returns = registry.masked_returns(signals, lengths, optimizer.log_returns(price_df))
+    windows = walkforward.fold_windows(len(price_df), 4, 300)
+    out_of_sample = []
+    for fold, (train_start, test_start, test_stop) in enumerate(windows):
+        sharpe = performance.returns_statistics(returns[train_start:test_start], 252)[
+            "Sharpe"
+        ]
+        best = np.nanargmax(sharpe)
+        assert result.folds.loc[fold, "ma_short"] == grid.loc[best, "ma_short"]
+        assert result.folds.loc[fold, "ma_long"] == grid.loc[best, "ma_long"]
+        out_of_sample.append(returns[test_start:test_stop, best])
+
+    expected = performance.returns_statistics(np.concatenate(out_of_sample), 252)
+    assert np.isclose(
+        result.statistics.loc["Walk-Forward", "Total Return"],
+        expected["Total Return"][0],
+    )
+    assert list(result.equity_curves.columns) == list(result.statistics.index)
@@ -1,9 +1,25 @@
 import streamlit as st
 from streamlit_lottie import st_lottie
 import json
+import time
 from streamlit_option_menu import option_menu
 
-from libraries import main, constants as c, indicators as ind
+from libraries import (
+    main,
+    data,
+    engine,
+    registry,
+    optimizer,
+    parallel,
+    walkforward,
+    universe,
+    bootstrap,
+    ensemble,
+    signals,
+    performance,
+    constants as c,
+    indicators as ind,
+)
 
 st.set_page_config(
     page_title="TA App",
@@ -85,10 +101,16 @@ if (
     and st.session_state.get("interval_input")
 ):
     with st.spinner("SEARCHING"):
-        ticker_data = main.fetch_data(ticker_input, period_input, interval_input)
+        # The error of an invalid ticker or period is shown by fetch_data
+        if main.fetch_data(ticker_input, period_input, interval_input) == 1:
+            st.stop()
+        # One download per (ticker, period, interval), shared by everything below
+        price_df = data.load_price_data(ticker_input, period_input, interval_input)
+        # Metadata snapshot, cached across reruns and sessions
+        ticker_info = data.load_ticker_info(ticker_input)
         if search_btn:
             st.session_state.graph = main.create_graph(
-                ticker_data, period_input, interval_input
+                ticker_info, price_df, interval_input
             )
         # Placeholders for the graphs
         graph_place = st.empty()
@@ -113,9 +135,9 @@ if (
     # 2 suporting sections
     selected_page = option_menu(
         menu_title=None,
-        options=["INFO", "TECHNICAL ANALYSIS"],
+        options=["INFO", "TECHNICAL ANALYSIS", "OPTIMIZER", "UNIVERSE"],
         orientation="horizontal",
-        icons=["info-circle", "bar-chart-steps"],
+        icons=["info-circle", "bar-chart-steps", "grid-3x3", "globe"],
         styles=c.styles_option_menu,
     )
 
@@ -126,12 +148,12 @@ if (
         col1, col2, col3 = st.columns(3)
 
         # STOCK INFO
-        country = ticker_data.info.get("country", "N/A")
-        sector = ticker_data.info.get("sector", "N/A")
-        industry = ticker_data.info.get("industry", "N/A")
-        market_cap = ticker_data.info.get("marketCap", "N/A")
-        ent_value = ticker_data.info.get("enterpriseValue", "N/A")
-        employees = ticker_data.info.get("fullTimeEmployees", "N/A")
+        country = ticker_info.get("country", "N/A")
+        sector = ticker_info.get("sector", "N/A")
+        industry = ticker_info.get("industry", "N/A")
+        market_cap = ticker_info.get("marketCap", "N/A")
+        ent_value = ticker_info.get("enterpriseValue", "N/A")
+        employees = ticker_info.get("fullTimeEmployees", "N/A")
 
         stock_info = [
             ("Stock Info", f"{ticker_input}"),
@@ -147,12 +169,12 @@ if (
             st.markdown(main.html_table(stock_info), unsafe_allow_html=True)
 
         # PRICE INFO
-        current_price = ticker_data.info.get("currentPrice", "N/A")
-        prev_close = ticker_data.info.get("previousClose", "N/A")
-        day_high = ticker_data.info.get("dayHigh", "N/A")
-        day_low = ticker_data.info.get("dayLow", "N/A")
-        ft_week_high = ticker_data.info.get("fiftyTwoWeekHigh", "N/A")
-        ft_week_low = ticker_data.info.get("fiftyTwoWeekLow", "N/A")
+        current_price = ticker_info.get("currentPrice", "N/A")
+        prev_close = ticker_info.get("previousClose", "N/A")
+        day_high = ticker_info.get("dayHigh", "N/A")
+        day_low = ticker_info.get("dayLow", "N/A")
+        ft_week_high = ticker_info.get("fiftyTwoWeekHigh", "N/A")
+        ft_week_low = ticker_info.get("fiftyTwoWeekLow", "N/A")
 
         price_info = [
             ("Price Info", f"{ticker_input}"),
@@ -168,12 +190,12 @@ if (
             st.markdown(main.html_table(price_info), unsafe_allow_html=True)
 
         # BUSINESS METRICS
-        forward_eps = ticker_data.info.get("forwardEps", "N/A")
-        forward_pe = ticker_data.info.get("forwardPE", "N/A")
-        peg_ratio = ticker_data.info.get("pegRatio", "N/A")
-        dividend_rate = ticker_data.info.get("dividendRate", "N/A")
-        dividend_yield = ticker_data.info.get("dividendYield", "N/A")
-        recommendation = ticker_data.info.get("recommendationKey", "N/A")
+        forward_eps = ticker_info.get("forwardEps", "N/A")
+        forward_pe = ticker_info.get("forwardPE", "N/A")
+        peg_ratio = ticker_info.get("pegRatio", "N/A")
+        dividend_rate = ticker_info.get("dividendRate", "N/A")
+        dividend_yield = ticker_info.get("dividendYield", "N/A")
+        recommendation = ticker_info.get("recommendationKey", "N/A")
 
         biz_metrics = [
             ("Business Metrics", f"{ticker_input}"),
@@ -194,13 +216,7 @@ if (
     if selected_page == "TECHNICAL ANALYSIS":
         selected_indicators = st.multiselect(
             "**Select technical indicators:**",
-            [
-                "Moving Average",
-                "Relative Strength Index (RSI)",
-                "Directional Movement Index (DMI)",
-                "Moving Average Converge Divergence (MACD)",
-                "Trading Range Breakout",
-            ],
+            list(registry.INDICATORS),
         )
 
         # Parameter section layout
@@ -212,210 +228,37 @@ if (
             )
             st.write("")
 
-        # Dynamic adjustments to the # of cols depending on the # of indicators
-        num_indicator_columns = min(len(selected_indicators), 3)
-        indicator_columns = st.columns(num_indicator_columns)
-        indicator_columns_counter = 0
-
-        if "Moving Average" in selected_indicators:
-            with indicator_columns[indicator_columns_counter]:
-                st.write("**MOVING AVERAGE**")
-                ma_short = st.number_input(
-                    "Length of short moving average:",
-                    min_value=1,
-                    max_value=len(
-                        ticker_data.history(
-                            period=period_input, interval=interval_input
-                        )
-                    )
-                    - 1,
-                    value=20,
-                )
-                ma_long = st.number_input(
-                    "Length of long moving average:",
-                    min_value=2,
-                    max_value=len(
-                        ticker_data.history(
-                            period=period_input, interval=interval_input
-                        )
-                    ),
-                    value=50,
-                )
-                ema_checkbox = st.checkbox("Use exponential moving average.")
-            indicator_columns_counter = (
-                indicator_columns_counter + 1
-            ) % num_indicator_columns
-        else:
-            ma_short = None
-            ma_long = None
-            ema_checkbox = None
-        if "Relative Strength Index (RSI)" in selected_indicators:
-            with indicator_columns[indicator_columns_counter]:
-                st.write("**RSI**")
-                rsi_length = st.number_input(
-                    "Length of indicator:",
-                    min_value=1,
-                    max_value=len(
-                        ticker_data.history(
-                            period=period_input, interval=interval_input
-                        )
-                    ),
-                    value=14,
-                )
-                rsi_thresholds = st.selectbox(
-                    "Thresholds values:",
-                    ["30/70", "40/60", "25/75", "20/80", "15/85", "10/90"],
-                )
-                rsi_checkbox = st.checkbox("Add simple moving average.")
-            indicator_columns_counter = (
-                indicator_columns_counter + 1
-            ) % num_indicator_columns
-        else:
-            rsi_length = None
-            rsi_thresholds = None
-            rsi_checkbox = None
-        if "Directional Movement Index (DMI)" in selected_indicators:
-            with indicator_columns[indicator_columns_counter]:
-                st.write("**DMI**")
-                dmi_length = st.number_input(
-                    "Length of indicator:",
-                    min_value=1,
-                    max_value=len(
-                        ticker_data.history(
-                            period=period_input, interval=interval_input
-                        )
-                    )
-                    - 1,
-                    value=14,
-                )
-                adx_smoothing = st.number_input(
-                    "ADX smoothing:",
-                    min_value=1,
-                    max_value=len(
-                        ticker_data.history(
-                            period=period_input, interval=interval_input
-                        )
-                    )
-                    - dmi_length,
-                    value=14,
-                )
-            indicator_columns_counter = (
-                indicator_columns_counter + 1
-            ) % num_indicator_columns
-        else:
-            dmi_length = None
-            adx_smoothing = None
-        if "Moving Average Converge Divergence (MACD)" in selected_indicators:
-            with indicator_columns[indicator_columns_counter]:
-                st.write("**MACD**")
-                macd_fast = st.number_input(
-                    "Length of fast moving average:",
-                    min_value=1,
-                    max_value=len(
-                        ticker_data.history(
-                            period=period_input, interval=interval_input
-                        )
-                    )
-                    - 1,
-                    value=12,
-                )
-                macd_slow = st.number_input(
-                    "Length of slow moving average:",
-                    min_value=2,
-                    max_value=len(
-                        ticker_data.history(
-                            period=period_input, interval=interval_input
-                        )
-                    ),
-                    value=26,
-                )
-                macd_signal = st.number_input(
-                    "Length of signal moving average:",
-                    min_value=1,
-                    max_value=len(
-                        ticker_data.history(
-                            period=period_input, interval=interval_input
-                        )
-                    )
-                    - macd_slow
-                    + 1,
-                    value=9,
-                )
-            indicator_columns_counter = (
-                indicator_columns_counter + 1
-            ) % num_indicator_columns
-        else:
-            macd_fast = None
-            macd_slow = None
-            macd_signal = None
-        if "Trading Range Breakout" in selected_indicators:
-            with indicator_columns[indicator_columns_counter]:
-                st.write("**TRADING RANGE BREAKOUT**")
-                trb_length = st.number_input(
-                    "Length of indicator:",
-                    min_value=1,
-                    max_value=len(
-                        ticker_data.history(
-                            period=period_input, interval=interval_input
-                        )
-                    ),
-                    value=20,
-                )
-                trb_width = st.number_input(
-                    "Width of channel:", min_value=0.000001, max_value=10.0, value=0.1
-                )
-                trb_num_periods_to_hold = st.number_input(
-                    "Number of periods to hold a position:",
-                    min_value=1,
-                    max_value=10000,
-                    value=20,
-                )
-            indicator_columns_counter = (
-                indicator_columns_counter + 1
-            ) % num_indicator_columns
-        else:
-            trb_length = None
-            trb_width = None
-            trb_num_periods_to_hold = None
+        parameters = main.select_parameters(selected_indicators, len(price_df))
 
+        st.session_state.setdefault("parameter_btn", False)
         if selected_indicators != []:
-            st.session_state.setdefault("parameter_btn", False)
             parameter_btn = st.button("ANALYZE")
             if parameter_btn:
                 st.session_state.parameter_btn = True
 
         # Plot indicators
         if st.session_state.parameter_btn:
+            # Indicator values shared by the graphs and the statistics
+            indicators_df = engine.compute_indicators(
+                price_df, selected_indicators, **parameters
+            )
             main.execute_ta(
                 selected_indicators,
-                ticker_data,
-                period_input,
+                indicators_df,
                 interval_input,
                 st.session_state.graph,
                 graph_place,
                 RSI_place,
                 MACD_place,
                 DMI_place,
-                ma_short,
-                ma_long,
-                ema_checkbox,
-                rsi_length,
-                rsi_thresholds,
-                rsi_checkbox,
-                macd_fast,
-                macd_slow,
-                macd_signal,
-                dmi_length,
-                adx_smoothing,
-                trb_length,
-                trb_width,
+                **parameters,
             )
 
             # Remove indicators
             remove_indicators_btn = Remove_btn_place.button("REMOVE INDICATORS")
             if remove_indicators_btn:
                 st.session_state.graph = main.create_graph(
-                    ticker_data, period_input, interval_input
+                    ticker_info, price_df, interval_input
                 )
                 graph_place.plotly_chart(
                     st.session_state.graph, config=dict(scrollZoom=True)
@@ -431,28 +274,12 @@ if (
             # ------------------------------------------------------------------
             # ANALYSIS
             # ------------------------------------------------------------------
-            price_df = main.add_ta_to_df(
-                ticker_data,
-                period_input,
-                interval_input,
-                selected_indicators,
-                ma_short,
-                ma_long,
-                ema_checkbox,
-                rsi_length,
-                rsi_thresholds,
-                macd_fast,
-                macd_slow,
-                macd_signal,
-                dmi_length,
-                adx_smoothing,
-                trb_length,
-                trb_width,
-                trb_num_periods_to_hold,
+            signal_set = signals.build_signals(
+                price_df, selected_indicators, indicators_df, **parameters
             )
 
-            ta_statistics = main.do_ta_analysis(price_df)
-            ta_statistics_styled = main.apply_styles_df(ta_statistics)
+            analysis = main.analyze(signal_set)
+            ta_statistics_styled = main.apply_styles_df(analysis.statistics)
 
             st.markdown(
                 "<h4 style='text-align: center; font-size: 25px; font-family: serif;'>TRADE STATISTICS</h4>",
@@ -464,10 +291,333 @@ if (
             st.write("")
             st.write("")
             st.write("")
-            equity_df = main.extract_equity_curves(price_df)
-            main.plot_equity_curves(equity_df)
+            main.plot_equity_curves(analysis.equity_curves)
+
+            # Rolling statistics under the equity curves
+            col1, col2 = st.columns(2)
+            rolling_window = col1.number_input(
+                "Rolling window (bars):",
+                min_value=2,
+                max_value=max(2, len(price_df)),
+                value=min(c.rolling_window, max(2, len(price_df))),
+            )
+            rolling_metric = col2.selectbox(
+                "Rolling statistic:", performance.ROLLING_METRICS
+            )
+            rolling_curves = performance.rolling_curves(
+                main.strategy_returns(signal_set), rolling_window, 252
+            )
+            main.plot_rolling_statistics(
+                rolling_curves[rolling_metric], rolling_metric, rolling_window
+            )
+            main.plot_underwater(analysis.drawdowns.underwater)
+            with st.expander("DRAWDOWN EPISODES"):
+                st.dataframe(
+                    analysis.drawdowns.episodes.sort_values("Depth")
+                    .style.format(c.styles_drawdowns_df)
+                    .hide(axis="index")
+                )
+            # Counters of the memo of engine.compute_indicators
+            with st.expander("INDICATOR CACHE"):
+                cache = engine.cache_stats()
+                col1, col2, col3, col4, col5 = st.columns(5)
+                col1.metric("Hits", cache["hits"])
+                col2.metric("Misses", cache["misses"])
+                col3.metric("Hit Rate", f"{cache['hit_rate']:.0%}")
+                col4.metric("Evictions", cache["evictions"])
+                col5.metric(
+                    "Memory", f"{cache['bytes'] / 2**20:.1f} MB ({cache['entries']})"
+                )
+
+            main.current_recommendation(analysis.statistics)
+
+            # Every combination of the selected indicators as one strategy
+            if len(selected_indicators) > 1:
+                st.write("")
+                st.markdown(
+                    "<h4 style='text-align: center; font-size: 25px; font-family: serif;'>ENSEMBLES OF INDICATORS</h4>",
+                    unsafe_allow_html=True,
+                )
+                rules = st.multiselect(
+                    "Voting rules:",
+                    ensemble.ENSEMBLE_RULES,
+                    default=ensemble.ENSEMBLE_RULES,
+                )
+                keys = signal_set.keys
+                weight_columns = st.columns(len(keys))
+                weights = [
+                    weight_columns[i].number_input(
+                        f"{key} weight:", value=1.0, step=0.5, key=f"{key}_weight"
+                    )
+                    for i, key in enumerate(keys)
+                ]
+                st.dataframe(
+                    main.apply_styles_df(
+                        ensemble.evaluate_ensembles(signal_set, rules, weights)
+                    )
+                )
+
+            # Confidence intervals of the statistics
+            st.write("")
+            st.markdown(
+                "<h4 style='text-align: center; font-size: 25px; font-family: serif;'>BOOTSTRAP CONFIDENCE INTERVALS</h4>",
+                unsafe_allow_html=True,
+            )
+            col1, col2, col3, col4 = st.columns(4)
+            num_samples = col1.number_input(
+                "Resamples:",
+                min_value=100,
+                max_value=100000,
+                value=c.bootstrap_samples,
+                step=1000,
+            )
+            block_length = col2.number_input(
+                "Mean block length (bars):",
+                min_value=1,
+                max_value=len(price_df),
+                value=bootstrap.default_block_length(len(price_df)),
+            )
+            method = col3.selectbox("Method:", ["Stationary", "Circular block"])
+            confidence = col4.slider(
+                "Confidence (%):", min_value=50, max_value=99, value=95
+            )
+            bootstrap_key = (
+                ticker_input,
+                period_input,
+                interval_input,
+                tuple(selected_indicators),
+                repr(parameters),
+                num_samples,
+                block_length,
+                method,
+                confidence,
+            )
+
+            if st.button("BOOTSTRAP"):
+                with st.spinner("RESAMPLING"):
+                    st.session_state.bootstrap = bootstrap.bootstrap(
+                        main.strategy_returns(signal_set),
+                        num_samples=num_samples,
+                        block_length=block_length,
+                        stationary=method == "Stationary",
+                        confidence=confidence / 100,
+                    )
+                    st.session_state.bootstrap_key = bootstrap_key
+
+            if st.session_state.get("bootstrap_key") == bootstrap_key:
+                bootstrap_result = st.session_state.bootstrap
+                st.dataframe(main.apply_styles_bootstrap(bootstrap_result.intervals))
+                bootstrap_metric = st.selectbox(
+                    "Distribution of:", bootstrap.BOOTSTRAP_METRICS, index=2
+                )
+                main.plot_bootstrap_distributions(
+                    bootstrap_result.samples,
+                    list(bootstrap_result.intervals.index.unique(level="Strategy")),
+                    bootstrap_metric,
+                )
+
+    # ------------------------------------------------------------------
+    # OPTIMIZER SECTION
+    # ------------------------------------------------------------------
+    if selected_page == "OPTIMIZER":
+        optimized_indicator = st.selectbox(
+            "**Select technical indicator:**",
+            list(registry.INDICATORS),
+        )
+        st.write("")
+        st.markdown(
+            "<h4 style='text-align: center; font-size: 25px; font-family: serif;'>SELECT PARAMETER RANGES</h4>",
+            unsafe_allow_html=True,
+        )
+        st.write("")
+
+        ranges = main.select_grid(optimized_indicator, len(price_df))
+        grid = optimizer.parameter_grid(optimized_indicator, ranges)
+        metric = st.selectbox(
+            "Rank by:",
+            ["Sharpe", "Sortino", "Total Return", "Ann. Mean Return", "Max Drawdown"],
+        )
+        st.write(f"**{len(grid)}** parameter sets")
+        optimizer_key = (
+            ticker_input,
+            period_input,
+            interval_input,
+            optimized_indicator,
+            repr(ranges),
+        )
+
+        if len(grid) > c.optimizer_max_sets:
+            st.error(
+                f"Too many parameter sets (maximum {c.optimizer_max_sets}).", icon="❗"
+            )
+        elif len(grid) > 0 and st.button("OPTIMIZE"):
+            # Runs in a thread of the app process, so that STOP can cancel the pending shards
+            st.session_state.optimizer_run = parallel.BackgroundRun(
+                parallel.optimize, price_df, optimized_indicator, grid, metric=metric
+            )
+            st.session_state.optimizer_run_key = optimizer_key
+
+        optimizer_run = st.session_state.get("optimizer_run")
+        if optimizer_run is not None:
+            if st.session_state.optimizer_run_key != optimizer_key:
+                # The ranges or the ticker changed during the run
+                optimizer_run.stop()
+                del st.session_state.optimizer_run
+            else:
+                stop_place = st.empty()
+                stop_place.button("STOP", on_click=optimizer_run.stop)
+                progress_bar = st.progress(0.0, text="OPTIMIZING")
+                while optimizer_run.running:
+                    progress_bar.progress(
+                        optimizer_run.done / optimizer_run.total,
+                        text=f"OPTIMIZING ({optimizer_run.done}/{optimizer_run.total})",
+                    )
+                    time.sleep(0.2)
+                stop_place.empty()
+                progress_bar.empty()
+                del st.session_state.optimizer_run
+                if optimizer_run.error is not None:
+                    raise optimizer_run.error
+                st.session_state.optimizer_results = optimizer_run.result
+                st.session_state.optimizer_key = optimizer_key
+
+        # Results of the last run for this ticker and indicator
+        if st.session_state.get("optimizer_key") == optimizer_key:
+            results = st.session_state.optimizer_results
+            results = results.sort_values(metric, ascending=False)
+            st.markdown(
+                "<h4 style='text-align: center; font-size: 25px; font-family: serif;'>BEST PARAMETERS</h4>",
+                unsafe_allow_html=True,
+            )
+            st.dataframe(
+                main.apply_styles_optimizer(results.head(c.optimizer_top_results))
+            )
+
+            # Heatmap over two of the optimized parameters
+            varying = [
+                column for column in grid.columns if results[column].nunique() > 1
+            ]
+            if varying:
+                col1, col2 = st.columns(2)
+                x = col1.selectbox("Horizontal axis:", varying)
+                y = col2.selectbox(
+                    "Vertical axis:",
+                    [None] + [column for column in varying if column != x],
+                    index=min(1, len(varying) - 1),
+                )
+                main.plot_optimizer_results(results, x, y, metric)
+
+        # Walk-forward: parameters chosen on train windows, scored on the next test windows
+        st.write("")
+        st.markdown(
+            "<h4 style='text-align: center; font-size: 25px; font-family: serif;'>WALK-FORWARD (OUT-OF-SAMPLE)</h4>",
+            unsafe_allow_html=True,
+        )
+        col1, col2, col3 = st.columns(3)
+        num_folds = col1.number_input(
+            "Number of folds:", min_value=2, max_value=50, value=10
+        )
+        train_share = col2.slider(
+            "Train window (% of bars):", min_value=10, max_value=90, value=50
+        )
+        anchored = col3.checkbox("Anchored train windows (growing from the start).")
+        walk_forward_key = optimizer_key + (num_folds, train_share, anchored, metric)
+
+        if 0 < len(grid) <= c.optimizer_max_sets and st.button("WALK FORWARD"):
+            with st.spinner("WALKING FORWARD"):
+                try:
+                    st.session_state.walk_forward = walkforward.walk_forward(
+                        price_df,
+                        optimized_indicator,
+                        grid,
+                        num_folds=num_folds,
+                        train_bars=len(price_df) * train_share // 100,
+                        anchored=anchored,
+                        metric=metric,
+                    )
+                    st.session_state.walk_forward_key = walk_forward_key
+                except ValueError as error:
+                    st.error(str(error), icon="❗")
+
+        if st.session_state.get("walk_forward_key") == walk_forward_key:
+            walk_forward = st.session_state.walk_forward
+            st.dataframe(
+                main.apply_styles_optimizer(walk_forward.statistics, hide_index=False)
+            )
+            st.dataframe(main.apply_styles_optimizer(walk_forward.folds))
+            main.plot_equity_curves(walk_forward.equity_curves)
+
+    # ------------------------------------------------------------------
+    # UNIVERSE SECTION
+    # ------------------------------------------------------------------
+    if selected_page == "UNIVERSE":
+        watchlist = st.text_area(
+            "Enter the tickers of the universe (separated by commas, spaces or lines):",
+            value=ticker_input.upper(),
+        )
+        tickers = list(dict.fromkeys(watchlist.upper().replace(",", " ").split()))
+        universe_indicators = st.multiselect(
+            "**Select technical indicators:**",
+            list(registry.INDICATORS),
+            key="universe_indicators",
+        )
+        if universe_indicators != []:
+            st.write("")
+            st.markdown(
+                "<h4 style='text-align: center; font-size: 25px; font-family: serif;'>SELECT PARAMETERS FOR THE INDICATORS</h4>",
+                unsafe_allow_html=True,
+            )
+            st.write("")
+        parameters = main.select_parameters(universe_indicators, len(price_df))
+        st.write(f"**{len(tickers)}** tickers")
+        universe_key = (
+            tuple(tickers),
+            period_input,
+            interval_input,
+            tuple(universe_indicators),
+            repr(parameters),
+        )
 
-            main.current_recommendation(ta_statistics)
+        if len(tickers) > c.universe_max_tickers:
+            st.error(f"Too many tickers (maximum {c.universe_max_tickers}).", icon="❗")
+        elif tickers and st.button("ANALYZE UNIVERSE"):
+            with st.spinner("DOWNLOADING AND ANALYZING"):
+                price_dfs = data.load_price_histories(
+                    tuple(tickers), period_input, interval_input
+                )
+                panel, excluded = universe.price_panel(price_dfs)
+                excluded += [ticker for ticker in tickers if ticker not in price_dfs]
+                if panel.empty:
+                    st.error("No price data for these tickers.", icon="❗")
+                else:
+                    st.session_state.universe = universe.analyze_universe(
+                        panel, universe_indicators, excluded=excluded, **parameters
+                    )
+                    st.session_state.universe_key = universe_key
+
+        if st.session_state.get("universe_key") == universe_key:
+            universe_result = st.session_state.universe
+            if universe_result.excluded:
+                st.warning(
+                    "Left out (no data or too short history): "
+                    + ", ".join(universe_result.excluded)
+                )
+            st.markdown(
+                "<h4 style='text-align: center; font-size: 25px; font-family: serif;'>STRATEGY RANKINGS</h4>",
+                unsafe_allow_html=True,
+            )
+            st.dataframe(
+                main.apply_styles_optimizer(universe_result.rankings, hide_index=False)
+            )
+            st.markdown(
+                "<h4 style='text-align: center; font-size: 25px; font-family: serif;'>STATISTICS BY TICKER</h4>",
+                unsafe_allow_html=True,
+            )
+            st.dataframe(
+                main.apply_styles_optimizer(
+                    universe_result.statistics, hide_index=False
+                )
+            )
 
 elif search_btn:
     st.error("Please enter the ticker and choose time interval.", icon="❗")